@@ -1,5 +1,3 @@
-import bpy
-
 bl_info = {
     "name": "AluFrame",
     "author": "Simon Li / AluFrame contributors",
@@ -12,7 +10,9 @@ bl_info = {
 
 
 def register():
-    from . import operators, panels, handlers, workspace, ui, data, gn
+    # 启动时只注册类型、属性与处理器，不导入网格后端（NumPy）、不加载型材目录、不轮询：
+    # 目录在面板首次绘制时加载，场景设置由 handlers 在文件加载后执行
+    from . import operators, panels, handlers, ui, data
 
     data.register()
     operators.register()
@@ -20,18 +20,6 @@ def register():
     handlers.register()
     ui.register()
 
-    # 尝试创建并切换到 AluFrame 工作台（非强制，失败不影响启用）
-    try:
-        workspace.ensure_workspace()
-    except Exception as e:
-        print(f"[AluFrame] 工作台初始化跳过：{e}")
-
-    # 将场景单位设置为毫米（延迟执行，确保 scene 可用）
-    try:
-        workspace.set_units_millimeters_deferred()
-    except Exception as e:
-        print(f"[AluFrame] 单位设置跳过：{e}")
-
 
 def unregister():
     from . import operators, panels, handlers, ui, data
@@ -0,0 +1,340 @@
+"""单对象装配体：超大结构中的全部型材作为同一个网格对象的点，由几何节点实例化。
+
+- 每根型材是一个点：位置为型材中心，点属性记录型材、长度（mm）、旋转（XYZ 欧拉角）与缩放
+- 点的型材为稳定序号（UNIT_ATTR）：指向点网格自身的型材 ID 表（网格属性 UNITS_PROP，只追加不重排），
+  不随单位网格的增减、改名或追加其他文件而改变
+- 每种型材只有一份“单位网格”（长 1000 mm，沿 Z 居中），放在未链接到场景的集合中；
+  节点组 Instance on Points 按实例序号（PROFILE_ATTR，由稳定序号按单位网格的当前排序派生，
+  单位网格变化时重写）挑选单位网格，按缩放与长度缩放。实例不展开（不 Realize），
+  视图中 5 万根型材只是 5 万个实例
+- 编辑模式下选中顶点即选中型材；拆分（unpack）把选中的点还原为独立型材对象
+- 成员存储按点读取属性（store 中的 _assembly_rows），每个点记为一根型材，名称为“装配体名#点序号”
+
+吸附 / 干涉索引只处理独立型材对象，装配体中的型材需拆分后参与。
+"""
+
+import bpy
+import numpy as np
+from mathutils import Euler, Matrix, Vector
+
+from . import gn
+
+ASSEMBLY_PROP = "alu_assembly"
+# 实例序号（派生，供节点组挑选单位网格）
+PROFILE_ATTR = "alu_profile"
+# 稳定序号：点网格型材 ID 表中的位置
+UNIT_ATTR = "alu_unit"
+LENGTH_ATTR = "alu_length"
+ROTATION_ATTR = "alu_rotation"
+SCALE_ATTR = "alu_scale"
+# 点网格的型材 ID 表（换行分隔）
+UNITS_PROP = "alu_units"
+
+UNITS_COLLECTION = "AluFrameAssemblyUnits"
+NODE_GROUP = "AluFrame_AssemblyGN"
+# 单位网格长度（mm），实例沿 Z 缩放 length / UNIT_LENGTH
+UNIT_LENGTH = 1000.0
+
+
+def is_assembly(obj):
+    return obj.type == 'MESH' and bool(obj.get(ASSEMBLY_PROP))
+
+
+def units_collection():
+    """单位网格所在的集合（不链接到场景，只被节点组引用）。"""
+    coll = bpy.data.collections.get(UNITS_COLLECTION)
+    if coll is None:
+        coll = bpy.data.collections.new(UNITS_COLLECTION)
+    return coll
+
+
+def profile_table():
+    """按实例序号排列的单位网格对象（与 Collection Info 的“分离子项”顺序一致：按名称排序）。"""
+    return sorted(units_collection().objects, key=lambda o: o.name)
+
+
+def units_by_uid(table=None):
+    """型材 ID -> 单位网格对象。"""
+    table = profile_table() if table is None else table
+    return {unit.get("alu_uid"): unit for unit in table}
+
+
+def ensure_unit(item, table=None):
+    """返回型材对应的单位网格序号（当前排序下的实例序号），必要时新建；失败返回 None。
+
+    新建单位网格会改变排序，随后重写全部装配体的实例序号（refresh_instances）。
+    """
+    table = profile_table() if table is None else table
+    for i, unit in enumerate(table):
+        if unit.get("alu_uid") == item.uid:
+            return i
+    n = len(table)
+    mesh = gn.build_analytic_mesh(f"AluUnit_{n:04d}_{item.name}", item, UNIT_LENGTH)
+    if mesh is None:
+        return None
+    unit = bpy.data.objects.new(f"AluUnit_{n:04d}", mesh)
+    unit["alu_uid"] = item.uid
+    unit["alu_type"] = item.name
+    unit["standard"] = item.standard
+    unit["series"] = item.series
+    units_collection().objects.link(unit)
+    # 名称可能被占用（如追加了其他文件的单位网格），按实际排序重新取表
+    table[:] = profile_table()
+    refresh_instances(table)
+    return table.index(unit)
+
+
+def _named_attribute(ng, data_type, name, location):
+    node = ng.nodes.new("GeometryNodeInputNamedAttribute")
+    node.data_type = data_type
+    node.location = location
+    node.inputs["Name"].default_value = name
+    # 各数据类型共用名为 Attribute 的输出，只有与 data_type 对应的一个处于启用状态
+    return next(s for s in node.outputs if s.enabled)
+
+
+def ensure_node_group():
+    """装配体节点组：点 -> 按型材序号实例化单位网格，旋转取点属性，沿 Z 按长度缩放。"""
+    if NODE_GROUP in bpy.data.node_groups:
+        return bpy.data.node_groups[NODE_GROUP]
+
+    ng = bpy.data.node_groups.new(name=NODE_GROUP, type='GeometryNodeTree')
+    nodes = ng.nodes
+    links = ng.links
+    if hasattr(ng, "interface") and hasattr(ng.interface, "new_socket"):
+        ng.interface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        ng.interface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    else:
+        # Blender 3.5：旧接口
+        ng.inputs.new('NodeSocketGeometry', 'Geometry')
+        ng.outputs.new('NodeSocketGeometry', 'Geometry')
+
+    inp = nodes.new("NodeGroupInput"); inp.location = (-600, 0)
+    out = nodes.new("NodeGroupOutput"); out.location = (400, 0)
+
+    units = nodes.new("GeometryNodeCollectionInfo"); units.location = (-300, 200)
+    units.transform_space = 'ORIGINAL'
+    units.inputs["Collection"].default_value = units_collection()
+    units.inputs["Separate Children"].default_value = True
+    units.inputs["Reset Children"].default_value = True
+
+    profile = _named_attribute(ng, 'INT', PROFILE_ATTR, (-450, -100))
+    rotation = _named_attribute(ng, 'FLOAT_VECTOR', ROTATION_ATTR, (-450, -200))
+    length = _named_attribute(ng, 'FLOAT', LENGTH_ATTR, (-600, -300))
+    point_scale = _named_attribute(ng, 'FLOAT_VECTOR', SCALE_ATTR, (-300, -400))
+    scale_z = nodes.new("ShaderNodeMath"); scale_z.location = (-450, -300)
+    scale_z.operation = 'MULTIPLY'
+    scale_z.inputs[1].default_value = 1.0 / UNIT_LENGTH
+    links.new(length, scale_z.inputs[0])
+    length_scale = nodes.new("ShaderNodeCombineXYZ"); length_scale.location = (-300, -300)
+    length_scale.inputs[0].default_value = 1.0
+    length_scale.inputs[1].default_value = 1.0
+    links.new(scale_z.outputs[0], length_scale.inputs[2])
+    # 点的缩放 × 沿 Z 的长度缩放
+    scale = nodes.new("ShaderNodeVectorMath"); scale.location = (-100, -300)
+    scale.operation = 'MULTIPLY'
+    links.new(point_scale, scale.inputs[0])
+    links.new(length_scale.outputs[0], scale.inputs[1])
+
+    instance = nodes.new("GeometryNodeInstanceOnPoints"); instance.location = (100, 0)
+    links.new(inp.outputs[0], instance.inputs["Points"])
+    links.new(units.outputs[0], instance.inputs["Instance"])
+    instance.inputs["Pick Instance"].default_value = True
+    links.new(profile, instance.inputs["Instance Index"])
+    links.new(rotation, instance.inputs["Rotation"])
+    links.new(scale.outputs[0], instance.inputs["Scale"])
+    links.new(instance.outputs[0], out.inputs[0])
+    return ng
+
+
+def point_uids(mesh):
+    """点网格的型材 ID 表：稳定序号 -> 型材 ID。"""
+    text = str(mesh[UNITS_PROP])
+    return text.split("\n") if text else []
+
+
+def read_points(mesh):
+    """读取装配体网格的点数据：(位置 n×3, 稳定序号 n, 长度 n, 旋转 n×3, 缩放 n×3)。
+
+    稳定序号为 point_uids(mesh) 中的位置。
+    """
+    n = len(mesh.vertices)
+    co = np.empty(n * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    unit = np.empty(n, dtype=np.int32)
+    length = np.empty(n, dtype=np.float32)
+    rotation = np.empty(n * 3, dtype=np.float32)
+    scale = np.empty(n * 3, dtype=np.float32)
+    attrs = mesh.attributes
+    attrs[UNIT_ATTR].data.foreach_get("value", unit)
+    attrs[LENGTH_ATTR].data.foreach_get("value", length)
+    attrs[ROTATION_ATTR].data.foreach_get("vector", rotation)
+    attrs[SCALE_ATTR].data.foreach_get("vector", scale)
+    return co.reshape(n, 3), unit, length, rotation.reshape(n, 3), scale.reshape(n, 3)
+
+
+def _instance_indices(uids, table):
+    """稳定序号 -> 当前排序下的实例序号（单位网格缺失时为 -1）。"""
+    position = {unit.get("alu_uid"): i for i, unit in enumerate(table)}
+    return np.array([position.get(uid, -1) for uid in uids] or [-1], dtype=np.int32)
+
+
+def _write_instances(mesh, unit, uids, table):
+    values = _instance_indices(uids, table)[np.clip(unit, 0, max(len(uids) - 1, 0))]
+    values[(unit < 0) | (unit >= len(uids))] = -1
+    attrs = mesh.attributes
+    attr = attrs.get(PROFILE_ATTR) or attrs.new(PROFILE_ATTR, 'INT', 'POINT')
+    attr.data.foreach_set("value", values)
+
+
+def write_points(mesh, co, unit, length, rotation, scale, uids):
+    """整体重写装配体网格的点与点属性（foreach_set 一次写入）。
+
+    unit：稳定序号（uids 中的位置）；实例序号按单位网格的当前排序一并写入。
+    """
+    mesh.clear_geometry()
+    n = len(unit)
+    mesh.vertices.add(n)
+    mesh.vertices.foreach_set("co", np.asarray(co, dtype=np.float32).ravel())
+    mesh[UNITS_PROP] = "\n".join(uids)
+    unit = np.asarray(unit, dtype=np.int32)
+    attrs = mesh.attributes
+    for name, kind, field, values in (
+        (UNIT_ATTR, 'INT', "value", unit),
+        (LENGTH_ATTR, 'FLOAT', "value", np.asarray(length, dtype=np.float32)),
+        (ROTATION_ATTR, 'FLOAT_VECTOR', "vector", np.asarray(rotation, dtype=np.float32).ravel()),
+        (SCALE_ATTR, 'FLOAT_VECTOR', "vector", np.asarray(scale, dtype=np.float32).ravel()),
+    ):
+        attr = attrs.get(name) or attrs.new(name, kind, 'POINT')
+        attr.data.foreach_set(field, values)
+    _write_instances(mesh, unit, uids, profile_table())
+    mesh.update()
+
+
+def refresh_instances(table=None):
+    """单位网格排序变化后，按稳定序号重写全部装配体点网格的实例序号。"""
+    table = profile_table() if table is None else table
+    for mesh in bpy.data.meshes:
+        if UNITS_PROP not in mesh or not len(mesh.vertices):
+            continue
+        unit = np.zeros(len(mesh.vertices), dtype=np.int32)
+        mesh.attributes[UNIT_ATTR].data.foreach_get("value", unit)
+        _write_instances(mesh, unit, point_uids(mesh), table)
+        mesh.update()
+
+
+def new_assembly(context, name="AluAssembly"):
+    """新建空装配体对象（点网格 + 装配体节点修饰器）并链接到当前集合。"""
+    mesh = bpy.data.meshes.new(f"{name}Points")
+    mesh[ASSEMBLY_PROP] = True  # 删除装配体时随之回收（deletion.is_owned_mesh）
+    # 空的型材 ID 表与点属性：装配体网格始终带有 UNITS_PROP 与各点属性
+    empty = np.zeros((0, 3))
+    write_points(mesh, empty, np.zeros(0), np.zeros(0), empty, empty, [])
+    obj = bpy.data.objects.new(name, mesh)
+    obj[ASSEMBLY_PROP] = True
+    (context.collection or context.scene.collection).objects.link(obj)
+    mod = obj.modifiers.new(name="AluFrameAssembly", type='NODES')
+    mod.node_group = ensure_node_group()
+    return obj
+
+
+def pack(context, objects, assembly=None):
+    """把型材对象并入装配体（缺省新建），删除原对象。返回 (装配体, 并入数量, 跳过数量)。"""
+    from .bom import member_key
+    from .catalog import get_catalog
+
+    lookup = get_catalog().by_uid
+    table = profile_table()
+    members = []
+    skipped = 0
+    for obj in objects:
+        item = lookup.get(obj.get("alu_uid")) if member_key(obj) is not None else None
+        if item is None or ensure_unit(item, table) is None:
+            skipped += 1
+            continue
+        members.append(obj)
+    if not members:
+        return assembly, 0, skipped
+
+    if assembly is None:
+        assembly = new_assembly(context)
+    old = read_points(assembly.data)
+    uids = point_uids(assembly.data)
+    # 型材 ID 表只追加：已有点的稳定序号不变
+    index_of = {uid: i for i, uid in enumerate(uids)}
+    inverse = assembly.matrix_world.inverted()
+    n = len(members)
+    co = np.empty((n, 3), dtype=np.float32)
+    unit = np.empty(n, dtype=np.int32)
+    length = np.empty(n, dtype=np.float32)
+    rotation = np.empty((n, 3), dtype=np.float32)
+    scale = np.empty((n, 3), dtype=np.float32)
+    for i, obj in enumerate(members):
+        loc, rot, size = (inverse @ obj.matrix_world).decompose()
+        co[i] = loc
+        rotation[i] = rot.to_euler('XYZ')
+        scale[i] = size
+        uid = str(obj.get("alu_uid"))
+        if uid not in index_of:
+            index_of[uid] = len(uids)
+            uids.append(uid)
+        unit[i] = index_of[uid]
+        length[i] = float(obj["length"])
+
+    write_points(
+        assembly.data,
+        np.concatenate((old[0], co)),
+        np.concatenate((old[1], unit)),
+        np.concatenate((old[2], length)),
+        np.concatenate((old[3], rotation)),
+        np.concatenate((old[4], scale)),
+        uids,
+    )
+    # 原对象连同槽辅助对象与独占网格一次删除
+    from .deletion import delete_objects
+    delete_objects(members, context.scene)
+    return assembly, n, skipped
+
+
+def unpack(context, assembly, only_selected=True):
+    """把装配体中的点还原为独立型材对象（缺省只处理编辑模式下选中的点），返回创建的对象列表。"""
+    from .batch import MAX_LENGTH, MIN_LENGTH, add_profiles_batch
+
+    mesh = assembly.data
+    co, unit, length, rotation, scale = read_points(mesh)
+    n = len(unit)
+    if only_selected:
+        picked = np.zeros(n, dtype=bool)
+        mesh.vertices.foreach_get("select", picked)
+    else:
+        picked = np.ones(n, dtype=bool)
+    # 超出规格长度范围的点（如并入前改过长度）add_profiles_batch 不会创建，留在装配体中
+    picked &= (length >= MIN_LENGTH) & (length <= MAX_LENGTH)
+    if not picked.any():
+        return []
+
+    uids = point_uids(mesh)
+    world = assembly.matrix_world
+    records = []
+    for i in np.flatnonzero(picked):
+        u = int(unit[i])
+        if not 0 <= u < len(uids):
+            continue
+        local = Matrix.LocRotScale(Vector(co[i]), Euler(rotation[i], 'XYZ'), Vector(scale[i]))
+        records.append((uids[u], float(length[i]), world @ local))
+    created, _ = add_profiles_batch(context, records)
+
+    keep = ~picked
+    write_points(mesh, co[keep], unit[keep], length[keep], rotation[keep], scale[keep], uids)
+    return created
+
+
+def point_entries(mesh):
+    """稳定序号 -> 单位网格上记录的 (型材 ID, 型号, 标准)；单位网格缺失的为 None。"""
+    units = units_by_uid()
+    entries = []
+    for uid in point_uids(mesh):
+        u = units.get(uid)
+        entries.append(None if u is None else
+                       (str(u.get("alu_uid", "")), str(u.get("alu_type", "")), str(u.get("standard", ""))))
+    return entries
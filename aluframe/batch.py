@@ -0,0 +1,122 @@
+"""批量创建型材（脚本 API）。
+
+一次性创建成百上千根型材：共用缓存网格，不做逐对象的选中/激活/depsgraph 求值，
+由调用方（或 ALUFRAME_OT_add_profiles_batch）形成单个撤销步骤。
+
+每条记录先校验：型材 ID 不在目录中、长度不是数值或超出规格范围（MIN_LENGTH ~ MAX_LENGTH）、
+变换既不是 3 维位置也不是 4×4 矩阵的记录计入跳过数，不创建对象。
+
+示例（Blender Python 控制台）：
+    from aluframe.batch import add_profiles_batch
+    add_profiles_batch(bpy.context, [("GB-4040", 1000.0, matrix), ...])
+"""
+
+import math
+import numbers
+
+import bpy
+from mathutils import Matrix
+
+from . import gn
+from .catalog import get_catalog
+
+# 产品规格的单根长度范围（mm），与“新建型材”的长度限制一致
+MIN_LENGTH = 50.0
+MAX_LENGTH = 3000.0
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _to_matrix(value):
+    """接受 mathutils.Matrix / 4×4 嵌套序列 / NumPy 数组 / 仅位置 (x, y, z)；其他形式返回 None。"""
+    if isinstance(value, Matrix):
+        return value if len(value.row) == 4 and len(value.col) == 4 else None
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    try:
+        value = list(value)
+        if len(value) == 3 and all(_is_number(v) for v in value):
+            return Matrix.Translation(value)
+        rows = [list(row) for row in value]
+    except TypeError:
+        return None
+    if len(rows) != 4 or any(len(row) != 4 or not all(_is_number(v) for v in row) for row in rows):
+        return None
+    return Matrix(rows)
+
+
+def _check_record(record, lookup):
+    """校验一条记录，返回 (目录条目, 长度 mm, 4×4 矩阵)；无效记录返回 None。"""
+    try:
+        uid, length, matrix = record
+    except (TypeError, ValueError):
+        return None
+    item = lookup.get(uid) if isinstance(uid, str) else None
+    if item is None:
+        return None
+    if length is None:
+        length = item.default_length
+    if not _is_number(length) or not MIN_LENGTH <= length <= MAX_LENGTH:
+        return None
+    matrix = _to_matrix(matrix)
+    if matrix is None:
+        return None
+    return item, float(length), matrix
+
+
+def add_profiles_batch(context, records, collection=None, undo_push=False):
+    """批量创建型材对象。
+
+    records：可迭代的 (型材 ID, 长度 mm, 变换) 三元组；长度为 None 时取默认长度，
+    变换为 4×4 矩阵或 3 维位置。无效记录（见模块说明）计入跳过数。
+    collection：目标集合，缺省为当前集合。
+    undo_push：从脚本直接调用时，为整批创建压入一个撤销步骤。
+
+    返回 (创建的对象列表, 跳过的记录数)。
+    """
+    scene = context.scene
+    lookup = get_catalog().by_uid
+    coll = collection or context.collection or scene.collection
+    mode = gn.geometry_mode(context)
+    kind = gn.node_tree_kind(context) if mode == 'NODES' else None
+
+    meshes = {}
+    created = []
+    skipped = 0
+    for record in records:
+        checked = _check_record(record, lookup)
+        if checked is None:
+            skipped += 1
+            continue
+        item, length, matrix = checked
+        if kind is not None:
+            # 节点后端：共享空网格，几何由逐对象的节点修饰器生成
+            mesh = gn.nodes_base_mesh()
+            key = None
+        else:
+            key = gn.mesh_cache_key(item, length, mode)
+            mesh = meshes.get(key)
+        if mesh is None:
+            mesh = gn.ensure_profile_mesh(context, item, length, mode)
+            if mesh is None:
+                skipped += 1
+                continue
+            meshes[key] = mesh
+
+        obj = bpy.data.objects.new(name=f"AluProfile_{item.name}", object_data=mesh)
+        obj.matrix_world = matrix
+        coll.objects.link(obj)
+        gn.set_member_props(obj, item, length)
+        if kind is not None:
+            gn.add_profile_modifier(obj, item, length, kind)
+        obj["alu_grooved_bmesh"] = True
+        created.append(obj)
+
+    if undo_push and created:
+        try:
+            bpy.ops.ed.undo_push(message="AluFrame 批量添加型材")
+        except Exception:
+            pass
+    return created, skipped
@@ -0,0 +1,143 @@
+# 长度按 0.1mm 归并（与需求精度 ±0.1mm 一致）
+LENGTH_DECIMALS = 1
+
+
+SUMMARY_COLUMNS = ["型材型号", "执行标准", "单根长度(mm)", "数量(根)", "总长度(mm)"]
+MEMBER_COLUMNS = ["序号", "型材型号", "执行标准", "长度(mm)", "对象"]
+# 附质量列的版本（导出时使用，单重见 mass 模块）
+SUMMARY_MASS_COLUMNS = SUMMARY_COLUMNS + ["单重(kg/m)", "总质量(kg)"]
+MEMBER_MASS_COLUMNS = MEMBER_COLUMNS + ["质量(kg)"]
+
+
+def standard_label(code):
+    return {"GB": "国标", "EN": "欧标"}.get(code, code)
+
+
+def member_key(obj):
+    """返回型材对象的 BOM 键 (型号, 标准, 长度)；非型材对象返回 None。"""
+    if "alu_type" not in obj or "length" not in obj:
+        return None
+    try:
+        length = round(float(obj["length"]), LENGTH_DECIMALS)
+    except (TypeError, ValueError):
+        return None
+    return (str(obj["alu_type"]), str(obj.get("standard", "")), length)
+
+
+class BomRow:
+    __slots__ = ("alu_type", "standard", "length", "members")
+
+    def __init__(self, key):
+        self.alu_type, self.standard, self.length = key
+        self.members = set()  # 对象名称
+
+    @property
+    def count(self):
+        return len(self.members)
+
+    @property
+    def total_length(self):
+        return self.length * len(self.members)
+
+
+class BomIndex:
+    """BOM 分组：键为 (型号, 标准, 长度)，记录数量、总长度与成员名称。
+
+    本身不跟踪场景：它是成员存储（store.MemberStore.bom）的视图，存储写入 / 删除行时同步更新，
+    与存储始终一致。面板与导出直接读取 rows / total_count / total_length，无需遍历场景。
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self.members = {}  # 成员名称（对象名，装配体中为“对象名#点序号”）-> 键
+        self.total_count = 0
+        self.total_length = 0.0
+        self._sorted = None
+
+    def clear(self):
+        self.rows.clear()
+        self.members.clear()
+        self.total_count = 0
+        self.total_length = 0.0
+        self._sorted = None
+
+    def set(self, name, key):
+        """登记成员 name 的键（键未变时不做任何事）。"""
+        if self.members.get(name) == key:
+            return
+        self.discard(name)
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = BomRow(key)
+        row.members.add(name)
+        self.members[name] = key
+        self.total_count += 1
+        self.total_length += key[2]
+        self._sorted = None
+
+    def discard(self, name):
+        key = self.members.pop(name, None)
+        if key is None:
+            return
+        row = self.rows.get(key)
+        if row is not None:
+            row.members.discard(name)
+            if not row.members:
+                del self.rows[key]
+        self.total_count -= 1
+        self.total_length -= key[2]
+        if self.total_count == 0:
+            self.total_length = 0.0  # 消除浮点累计误差
+        self._sorted = None
+
+    def sorted_rows(self):
+        """按 (型号, 标准, 长度) 排序的行列表，版本未变时复用。"""
+        if self._sorted is None:
+            self._sorted = [self.rows[k] for k in sorted(self.rows)]
+        return self._sorted
+
+    def summary_rows(self):
+        """汇总行生成器：每个 (型号, 标准, 长度) 一行。"""
+        for row in self.sorted_rows():
+            yield (row.alu_type, standard_label(row.standard), row.length, row.count, round(row.total_length, 1))
+
+    def member_rows(self):
+        """逐根下料行生成器（按型号/标准/长度、对象名排序），不构造完整表格。"""
+        n = 0
+        for row in self.sorted_rows():
+            label = standard_label(row.standard)
+            for name in sorted(row.members):
+                n += 1
+                yield (n, row.alu_type, label, row.length, name)
+
+    def snapshot(self):
+        """[(成员名称, 键), ...] 的副本：主线程中复制，交给后台线程排序与写出（见 snapshot_member_rows）。"""
+        return list(self.members.items())
+
+
+def snapshot_member_rows(items, linear_mass=None):
+    """由 BomIndex.snapshot() 生成与 member_rows 相同的逐根行（不访问 bpy，可在工作线程中运行）。
+
+    linear_mass：可选 {(型号, 标准): 单重 kg/m}，给出时每行末尾附质量（列同 MEMBER_MASS_COLUMNS）。
+    """
+    items = sorted(items, key=lambda kv: (kv[1], kv[0]))
+    for n, (name, (alu_type, standard, length)) in enumerate(items, 1):
+        row = (n, alu_type, standard_label(standard), length, name)
+        if linear_mass is not None:
+            row += (round(linear_mass.get((alu_type, standard), 0.0) * length / 1000.0, 3),)
+        yield row
+
+
+def get_index(scene):
+    """返回与 scene 对应的 BOM 分组（成员存储的视图）；存储失效或场景切换时先重建存储。"""
+    from . import store
+
+    return store.get_index(scene).bom
+
+
+def cached_index(scene):
+    """已与 scene 同步的 BOM 分组；成员存储失效时返回 None（不重建，供面板绘制使用）。"""
+    from . import store
+
+    members = store.cached_index(scene)
+    return members.bom if members is not None else None
@@ -0,0 +1,234 @@
+"""BOM 流式导出（XLSX / CSV），不依赖 bpy 与 openpyxl。
+
+XLSX 由 zipfile 直接写出最小工作簿：静态部件一次写入，工作表 XML 按行流式生成，
+内存占用与行数无关；字符串使用 inlineStr，无需共享字符串表。
+"""
+
+import csv
+import datetime
+import zipfile
+from xml.sax.saxutils import escape
+
+TITLE = "铝型材BOM清单"
+
+# 每累计多少行写一次压缩流，减少小块写入次数
+_CHUNK_ROWS = 512
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+# 样式：0 默认，1 粗体（标题与表头）
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '</styleSheet>'
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+
+def _workbook_xml(sheet_name):
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(sheet_name)}" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    )
+
+
+# 文本单元格缓存上限：型号/标准等取值重复度高，缓存可省去大部分转义开销
+_CELL_CACHE_SIZE = 4096
+
+
+def _cell(value, style):
+    s = f' s="{style}"' if style else ''
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c{s}><v>{value}</v></c>'
+    text = '' if value is None else escape(str(value))
+    return f'<c t="inlineStr"{s}><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+class XlsxStreamWriter:
+    """最小 XLSX 流式写入器：逐行写入单个工作表。
+
+    用法：
+        with XlsxStreamWriter(path) as w:
+            w.write_row(["型号", "长度"], bold=True)
+            w.write_rows(rows)
+    """
+
+    def __init__(self, path, sheet_name="BOM"):
+        self.path = path
+        self.sheet_name = sheet_name
+        self._zip = None
+        self._sheet = None
+        self._buf = []
+        self._row = 0
+        self._text_cells = {}
+
+    def __enter__(self):
+        self._zip = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr('[Content_Types].xml', _CONTENT_TYPES)
+        self._zip.writestr('_rels/.rels', _ROOT_RELS)
+        self._zip.writestr('xl/workbook.xml', _workbook_xml(self.sheet_name))
+        self._zip.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS)
+        self._zip.writestr('xl/styles.xml', _STYLES)
+        self._sheet = self._zip.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True)
+        self._sheet.write(_SHEET_HEAD.encode('utf-8'))
+        return self
+
+    def _cells(self, values, style):
+        cache = self._text_cells
+        out = []
+        for v in values:
+            t = type(v)
+            if t is float or t is int:
+                out.append(f'<c><v>{v}</v></c>' if not style else _cell(v, style))
+                continue
+            key = (v, style)
+            xml = cache.get(key)
+            if xml is None:
+                xml = _cell(v, style)
+                if len(cache) >= _CELL_CACHE_SIZE:
+                    cache.clear()
+                cache[key] = xml
+            out.append(xml)
+        return ''.join(out)
+
+    def write_row(self, values, bold=False):
+        self._row += 1
+        cells = self._cells(values, 1 if bold else 0)
+        self._buf.append(f'<row r="{self._row}">{cells}</row>')
+        if len(self._buf) >= _CHUNK_ROWS:
+            self._flush()
+
+    def write_rows(self, rows):
+        for values in rows:
+            self.write_row(values)
+
+    def _flush(self):
+        if self._buf:
+            self._sheet.write(''.join(self._buf).encode('utf-8'))
+            self._buf.clear()
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._sheet is not None:
+                self._flush()
+                self._sheet.write(_SHEET_TAIL.encode('utf-8'))
+                self._sheet.close()
+        finally:
+            self._zip.close()
+        return False
+
+
+class CsvStreamWriter:
+    """与 XlsxStreamWriter 接口一致的 CSV 写入器（UTF-8 BOM，便于 Excel 直接打开）。"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._writer = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.writer(self._file)
+        return self
+
+    def write_row(self, values, bold=False):
+        self._writer.writerow(values)
+
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        return False
+
+
+PROGRESS_ROWS = 2000
+
+
+def open_writer(path, file_format):
+    if file_format == 'CSV':
+        return CsvStreamWriter(path)
+    return XlsxStreamWriter(path)
+
+
+def write_bom(path, file_format, columns, rows, total_count, total_length, title=TITLE, now=None,
+              progress=None, overview=(), extra_tables=()):
+    """写出 BOM：表头、导出时间、统计总览（总根数、总长度），随后为列标题与数据行。
+
+    rows 可以是生成器，逐行消费，不在内存中构造完整表格。返回写出的数据行数。
+    overview：附加在统计总览中的 [(名称, 值), ...]（如总质量、估算成本）。
+    extra_tables：型材明细之后的附表 [(列标题, 行列表), ...]（如连接件清单），各空一行分隔。
+    progress：可选回调 progress(已写行数)，每 PROGRESS_ROWS 行调用一次（后台导出报告进度）。
+    """
+    now = now or datetime.datetime.now()
+    written = 0
+    with open_writer(path, file_format) as w:
+        w.write_row([title], bold=True)
+        w.write_row(["导出时间", now.strftime("%Y-%m-%d %H:%M:%S")])
+        w.write_row(["总根数", int(total_count)])
+        w.write_row(["总长度(mm)", round(float(total_length), 1)])
+        for name, value in overview:
+            w.write_row([name, value])
+        w.write_row([])
+        w.write_row(columns, bold=True)
+        for values in rows:
+            w.write_row(values)
+            written += 1
+            if progress is not None and written % PROGRESS_ROWS == 0:
+                progress(written)
+        for table_columns, table_rows in extra_tables:
+            w.write_row([])
+            w.write_row(table_columns, bold=True)
+            w.write_rows(table_rows)
+    if progress is not None:
+        progress(written)
+    return written
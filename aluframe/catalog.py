@@ -0,0 +1,250 @@
+"""型材目录：每个会话只加载一次，所有场景共享（不依赖 bpy 模块级导入）。
+
+- 目录来源：内置 `assets/profiles.json`、`assets/catalogs/*.json`（厂商目录），
+  以及环境变量 ALUFRAME_CATALOG_PATH 指定的额外 JSON 文件/目录（os.pathsep 分隔）
+- 编译缓存：解析结果以带版本号的 pickle 保存；源文件 mtime/大小未变则直接使用，
+  变化时再比较内容哈希，哈希也变化才重新解析 JSON
+- 同一 ID 在多个文件中出现时，后加载的条目覆盖先加载的
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+# 缓存格式版本：ProfileEntry 字段变化时递增，使旧缓存失效
+CACHE_VERSION = 1
+CACHE_FILENAME = "profiles_catalog.pickle"
+
+_FIELDS = (
+    "uid", "name", "standard", "series",
+    "width", "height", "slot_width", "wall_thickness",
+    "default_length", "vendor",
+)
+
+
+class ProfileEntry:
+    """目录条目。属性名与旧的场景型材条目一致，可直接交给 gn.add_profile_object 等函数。"""
+
+    __slots__ = _FIELDS + ("index",)
+
+    def __init__(self, uid, name, standard, series, width, height, slot_width, wall_thickness,
+                 default_length, vendor, index=0):
+        self.uid = uid
+        self.name = name
+        self.standard = standard
+        self.series = series
+        self.width = width
+        self.height = height
+        self.slot_width = slot_width
+        self.wall_thickness = wall_thickness
+        self.default_length = default_length
+        self.vendor = vendor
+        self.index = index
+
+    def as_tuple(self):
+        return tuple(getattr(self, f) for f in _FIELDS)
+
+    def __repr__(self):
+        return f"ProfileEntry({self.uid!r})"
+
+
+def _entry_from_json(item, vendor):
+    sp = item.get('section_params', {})
+    return (
+        str(item.get('id', '')),
+        str(item.get('name', '')),
+        str(item.get('standard', 'GB')),
+        str(item.get('series', '')),
+        float(sp.get('width', 0.0)),
+        float(sp.get('height', 0.0)),
+        float(sp.get('slot_width', 0.0)),
+        float(sp.get('wall_thickness', 0.0)),
+        float(item.get('default_length', 1000.0)),
+        vendor,
+    )
+
+
+def assets_dir():
+    return os.path.join(os.path.dirname(__file__), 'assets')
+
+
+def catalog_paths():
+    """按加载顺序返回目录文件列表。"""
+    paths = [os.path.join(assets_dir(), 'profiles.json')]
+    paths.extend(sorted(glob.glob(os.path.join(assets_dir(), 'catalogs', '*.json'))))
+    for extra in os.environ.get("ALUFRAME_CATALOG_PATH", "").split(os.pathsep):
+        if not extra:
+            continue
+        if os.path.isdir(extra):
+            paths.extend(sorted(glob.glob(os.path.join(extra, '*.json'))))
+        else:
+            paths.append(extra)
+    return [p for p in paths if os.path.isfile(p)]
+
+
+def default_cache_dir():
+    env = os.environ.get("ALUFRAME_CACHE_DIR")
+    if env:
+        return env
+    try:
+        import bpy
+        return bpy.utils.user_resource('CONFIG', path='aluframe', create=True)
+    except Exception:
+        return os.path.join(tempfile.gettempdir(), 'aluframe')
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _stat(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class Catalog:
+    def __init__(self):
+        self.entries = []
+        self.by_uid = {}
+        self.sources = []
+        # 每次（重新）加载递增，供搜索索引、面板引用等判断是否需要刷新
+        self.version = 0
+        self.from_cache = False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def get(self, uid, default=None):
+        return self.by_uid.get(uid, default)
+
+    def _set_entries(self, rows):
+        entries = []
+        by_uid = {}
+        for row in rows:
+            uid = row[0]
+            old = by_uid.get(uid)
+            if old is not None:
+                entry = ProfileEntry(*row, index=old.index)
+                entries[old.index] = entry
+            else:
+                entry = ProfileEntry(*row, index=len(entries))
+                entries.append(entry)
+            by_uid[uid] = entry
+        self.entries = entries
+        self.by_uid = by_uid
+        self.version += 1
+
+    def load(self, paths=None, cache_dir=None):
+        """加载目录；优先使用编译缓存。返回条目数量。"""
+        paths = catalog_paths() if paths is None else list(paths)
+        cache_dir = default_cache_dir() if cache_dir is None else cache_dir
+        cache_path = os.path.join(cache_dir, CACHE_FILENAME) if cache_dir else None
+
+        rows, sources = self._load_cache(cache_path, paths)
+        self.from_cache = rows is not None
+        if rows is None:
+            rows, sources = self._parse(paths)
+            self._save_cache(cache_path, rows, sources)
+        self.sources = sources
+        self._set_entries(rows)
+        return len(self.entries)
+
+    def _parse(self, paths):
+        rows = []
+        sources = []
+        for path in paths:
+            try:
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                data = json.loads(raw.decode('utf-8'))
+            except Exception as e:
+                print(f"[AluFrame] 读取型材目录失败：{path}：{e}")
+                continue
+            vendor = os.path.splitext(os.path.basename(path))[0]
+            for item in data:
+                try:
+                    rows.append(_entry_from_json(item, vendor))
+                except (TypeError, ValueError, AttributeError) as e:
+                    print(f"[AluFrame] 跳过无效型材条目（{path}）：{e}")
+            mtime, size = _stat(path)
+            sources.append((path, mtime, size, hashlib.sha1(raw).hexdigest()))
+        return rows, sources
+
+    def _load_cache(self, cache_path, paths):
+        if not cache_path or not os.path.isfile(cache_path):
+            return None, None
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            return None, None
+        if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+            return None, None
+        sources = cached.get("sources", [])
+        if [s[0] for s in sources] != paths:
+            return None, None
+
+        refreshed = []
+        touched = False
+        for path, mtime, size, digest in sources:
+            try:
+                cur_mtime, cur_size = _stat(path)
+            except OSError:
+                return None, None
+            if (cur_mtime, cur_size) != (mtime, size):
+                # mtime 变化但内容未变（如重新检出）：比较哈希后沿用缓存
+                if cur_size != size or _file_hash(path) != digest:
+                    return None, None
+                touched = True
+            refreshed.append((path, cur_mtime, cur_size, digest))
+        rows = cached.get("rows", [])
+        if touched:
+            self._save_cache(cache_path, rows, refreshed)
+        return rows, refreshed
+
+    def _save_cache(self, cache_path, rows, sources):
+        if not cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp = cache_path + ".tmp"
+            with open(tmp, 'wb') as f:
+                pickle.dump({"version": CACHE_VERSION, "sources": sources, "rows": rows}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_path)
+        except Exception as e:
+            print(f"[AluFrame] 写入型材目录缓存失败：{e}")
+
+
+_catalog = None
+
+
+def get_catalog():
+    """返回会话级目录（首次调用时加载）。"""
+    global _catalog
+    if _catalog is None:
+        _catalog = Catalog()
+        _catalog.load()
+    return _catalog
+
+
+def loaded_catalog():
+    """已加载的会话目录；尚未加载时返回 None（不触发加载，供 draw() 使用）。
+
+    加载由 data.request_catalog_sync 登记的计时器在绘制之外完成。
+    """
+    return _catalog
+
+
+def reload_catalog():
+    """重新加载目录（如新增厂商目录文件后）。"""
+    cat = get_catalog()
+    cat.load()
+    return cat
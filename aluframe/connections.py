@@ -0,0 +1,295 @@
+"""型材连接图：由端面中心与轴线检测连接节点，推算连接件数量（BOM 用）。
+
+- 宽相复用吸附索引的网格（snapping.SnapIndex.nearby），每个端面只检查附近格子中的型材
+- 连接类型（以端面所在型材为“连接型材”，另一根为“宿主”）：
+    端面对侧面（T 形）：端面贴在宿主侧面上，且不在宿主端部
+    角接（L 形）：端面贴在宿主侧面、位于宿主端部（连接型材外侧面与宿主端面大致齐平）
+    同轴对接：两根型材轴线平行共线，端面相对
+  贴合容差与吸附规则一致：侧面 5 mm，同轴 3 mm；轴线夹角偏离 90° / 0° 超过 2° 的不计
+- 增量：吸附索引报告变化（新增、移动、删除）的型材时，只重新检测这些型材的端面、
+  以它们为宿主的端面，以及附近可能新贴上它们的端面；吸附索引全量重建后本索引随之重建
+- 连接件按 HARDWARE 规则折算，按连接型材的系列分别统计；同轴对接两端互为宿主，只计一次
+"""
+
+import math
+from collections import Counter
+
+from .snapping import (
+    COAXIAL_TOLERANCE,
+    END_TO_SIDE_TOLERANCE,
+    _dot,
+    _length,
+    _scale,
+    _sub,
+)
+
+END_TO_SIDE = 'END_TO_SIDE'
+CORNER = 'CORNER'
+COAXIAL = 'COAXIAL'
+
+KIND_LABELS = {
+    END_TO_SIDE: "T 形",
+    CORNER: "角接",
+    COAXIAL: "同轴",
+}
+
+# 每个连接节点所需的连接件：[(名称, 数量), ...]
+HARDWARE = {
+    END_TO_SIDE: (("角码", 1), ("T 型螺栓", 2), ("法兰螺母", 2)),
+    CORNER: (("角码", 1), ("T 型螺栓", 2), ("法兰螺母", 2), ("端盖", 1)),
+    COAXIAL: (("直线连接板", 1), ("T 型螺栓", 4), ("法兰螺母", 4)),
+}
+
+HARDWARE_COLUMNS = ["连接件", "系列", "数量"]
+
+# 轴线夹角判定：|cos| ≥ _PARALLEL 视为平行，≤ _PERPENDICULAR 视为垂直（±2°）
+_PARALLEL = math.cos(math.radians(2.0))
+_PERPENDICULAR = math.sin(math.radians(2.0))
+
+
+class Joint:
+    """一个端面上的连接：型材 member 的 end 端（0 起点 / 1 终点）连到 host。
+
+    t：连接点沿宿主轴线到宿主起点的距离（米）；host_end：同轴对接时宿主的端号，否则为 None。
+    """
+
+    __slots__ = ("kind", "member", "end", "host", "t", "host_end")
+
+    def __init__(self, kind, member, end, host, t, host_end=None):
+        self.kind = kind
+        self.member = member
+        self.end = end
+        self.host = host
+        self.t = t
+        self.host_end = host_end
+
+
+def _half_along(m, direction):
+    """截面在 direction 方向上的半尺寸（方向垂直于轴线时即端面到侧面的距离）。"""
+    return abs(_dot(direction, m.x)) * m.w2 + abs(_dot(direction, m.y)) * m.h2
+
+
+def classify(m, end, host):
+    """检测型材 m 的 end 端与 host 的连接，返回 (Joint, 贴合误差) 或 None。"""
+    p = m.p0 if end == 0 else m.p1
+    out = _scale(m.axis, -1.0) if end == 0 else m.axis  # 端面外法线
+    rel = _sub(p, host.p0)
+    t = _dot(rel, host.axis)
+    along = _dot(m.axis, host.axis)
+
+    if abs(along) >= _PARALLEL:
+        tol = COAXIAL_TOLERANCE / 1000.0
+        perp = _length(_sub(rel, _scale(host.axis, t)))
+        if perp > tol:
+            return None
+        toward = _dot(out, host.axis)
+        # 端面相对：宿主起点处端面外法线指向宿主内部（+axis），终点处相反
+        if abs(t) <= tol and toward > 0.0:
+            return Joint(COAXIAL, m.name, end, host.name, 0.0, 0), abs(t) + perp
+        if abs(t - host.length) <= tol and toward < 0.0:
+            return Joint(COAXIAL, m.name, end, host.name, host.length, 1), abs(t - host.length) + perp
+        return None
+
+    if abs(along) > _PERPENDICULAR:
+        return None
+    tol = END_TO_SIDE_TOLERANCE / 1000.0
+    if t < -tol or t > host.length + tol:
+        return None
+    # 端面贴在宿主侧面：端面中心到宿主轴线沿外法线的距离 ≈ 宿主该方向的半尺寸
+    depth = -_dot(_sub(rel, _scale(host.axis, t)), out)
+    gap = abs(depth - _half_along(host, out))
+    if gap > tol:
+        return None
+    # 端面中心须落在侧面范围内（侧面的另一方向）
+    side = _sub(_sub(rel, _scale(host.axis, t)), _scale(out, -depth))
+    if _length(side) > _half_along(host, _cross_dir(host, out)) + tol:
+        return None
+    reach = _half_along(m, host.axis) + tol
+    kind = CORNER if t <= reach or t >= host.length - reach else END_TO_SIDE
+    return Joint(kind, m.name, end, host.name, min(max(t, 0.0), host.length)), gap
+
+
+def _cross_dir(host, out):
+    """宿主截面内与 out 垂直的方向（侧面的宽度方向）。"""
+    return host.y if abs(_dot(out, host.x)) >= abs(_dot(out, host.y)) else host.x
+
+
+class ConnectionIndex:
+    """连接图：(型材名称, 端号) -> Joint；宿主名称 -> 连到它的端面集合。"""
+
+    def __init__(self):
+        self.joints = {}
+        self.by_host = {}
+        self.series = {}  # 型材名称 -> 系列（统计连接件用）
+        self.generation = None
+        self.version = 0
+        self._counts = None
+
+    @property
+    def valid(self):
+        return self.generation is not None
+
+    def invalidate(self):
+        self.generation = None
+
+    def _touch(self):
+        self.version += 1
+        self._counts = None
+
+    def __len__(self):
+        return len(self.joints)
+
+    def _drop_end(self, key):
+        joint = self.joints.pop(key, None)
+        if joint is None:
+            return
+        ends = self.by_host.get(joint.host)
+        if ends is not None:
+            ends.discard(key)
+            if not ends:
+                del self.by_host[joint.host]
+
+    def _check_end(self, snap, m, end):
+        self._drop_end((m.name, end))
+        p = m.p0 if end == 0 else m.p1
+        members = snap.members
+        best = None
+        best_gap = None
+        # 宿主在吸附网格中按截面半径 + 容差膨胀登记，端面中心必落在宿主的格子里
+        for name in snap.nearby(p, END_TO_SIDE_TOLERANCE / 1000.0):
+            if name == m.name:
+                continue
+            found = classify(m, end, members[name])
+            if found is not None and (best is None or found[1] < best_gap):
+                best, best_gap = found
+        if best is not None:
+            self.joints[(m.name, end)] = best
+            self.by_host.setdefault(best.host, set()).add((m.name, end))
+
+    def _read_series(self, names):
+        import bpy
+
+        objects = bpy.data.objects
+        for name in names:
+            obj = objects.get(name)
+            if obj is None:
+                self.series.pop(name, None)
+            else:
+                self.series[name] = str(obj.get("series", ""))
+
+    def rebuild(self, snap):
+        """按吸附索引中的全部型材重建。"""
+        self.joints.clear()
+        self.by_host.clear()
+        self.series.clear()
+        for m in snap.members.values():
+            self._check_end(snap, m, 0)
+            self._check_end(snap, m, 1)
+        self._read_series(snap.members)
+        self.generation = snap.generation
+        self._touch()
+
+    def update(self, snap, names):
+        """重新检测与 names（移动、新增或已删除的型材）有关的端面；吸附索引重建过则全量重建。"""
+        if self.generation != snap.generation:
+            self.rebuild(snap)
+            return True
+        if not names:
+            return False
+        names = set(names)
+        # 受影响的型材：自身、以其为宿主的型材、附近可能新贴上它的型材
+        affected = set(names)
+        for name in names:
+            affected.update(member for member, _ in self.by_host.get(name, ()))
+            affected |= snap.neighbours(name)
+        members = snap.members
+        for name in affected:
+            m = members.get(name)
+            if m is None:
+                self._drop_end((name, 0))
+                self._drop_end((name, 1))
+                continue
+            self._check_end(snap, m, 0)
+            self._check_end(snap, m, 1)
+        for name in names:
+            if name not in members:
+                self.series.pop(name, None)
+        self._read_series(name for name in names if name in members)
+        self._touch()
+        return True
+
+    # -- 统计 ---------------------------------------------------------------
+
+    def _counted(self):
+        """参与统计的连接：同轴对接互为宿主时只取名称较小的一侧。"""
+        joints = self.joints
+        for (member, end), joint in joints.items():
+            if joint.kind == COAXIAL:
+                back = joints.get((joint.host, joint.host_end))
+                if back is not None and back.kind == COAXIAL and back.host == member and joint.host < member:
+                    continue
+            yield joint
+
+    def counts(self):
+        """{(连接类型, 系列): 节点数}，版本未变时复用。"""
+        if self._counts is None:
+            self._counts = Counter((j.kind, self.series.get(j.member, "")) for j in self._counted())
+        return self._counts
+
+    def kind_counts(self):
+        """{连接类型: 节点数}。"""
+        result = Counter()
+        for (kind, _), n in self.counts().items():
+            result[kind] += n
+        return result
+
+    def hardware_rows(self):
+        """连接件清单 [(名称, 系列, 数量), ...]，按名称、系列排序。"""
+        totals = Counter()
+        for (kind, series), n in self.counts().items():
+            for part, qty in HARDWARE[kind]:
+                totals[(part, series)] += qty * n
+        return [(part, series, count) for (part, series), count in sorted(totals.items())]
+
+    def fem_joints(self, store):
+        """转换为 fem.detect_joints 的格式 [(端点序号, 宿主行号, t mm), ...]。
+
+        端点序号 e < n 为起点、否则为终点（n 为成员存储行数）；成员存储中含装配体的点时
+        （吸附索引不含这些点）返回 None，由 fem 自行检测。
+        """
+        from .store import FLAG_ASSEMBLY
+
+        flags = store.view()[3]
+        if (flags & FLAG_ASSEMBLY).any():
+            return None
+        n = len(store)
+        result = []
+        for (member, end), joint in self.joints.items():
+            row, host = store.row(member), store.row(joint.host)
+            if row is None or host is None:
+                continue
+            result.append((row + n * end, host, joint.t * 1000.0))
+        return result
+
+
+index = ConnectionIndex()
+
+
+def get_index(scene):
+    """返回与 scene 对应的连接图；吸附索引或本索引失效时先重建。"""
+    from . import snapping
+
+    snap = snapping.get_index(scene)
+    if index.generation != snap.generation:
+        index.rebuild(snap)
+    return index
+
+
+def cached_index(scene):
+    """已与吸附索引同代的连接图；任一失效时返回 None（不重建，供面板绘制使用）。"""
+    from . import snapping
+
+    snap = snapping.cached_index(scene)
+    if snap is None or index.generation != snap.generation:
+        return None
+    return index
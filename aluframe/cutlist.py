@@ -0,0 +1,342 @@
+"""下料优化：按型材把 BOM 排到标准棒料上（一维排样，不依赖 bpy）。
+
+- 长度以 0.1 mm 整数计算（与 BOM 长度精度一致）；锯缝按“每段 + 锯缝 ≤ 棒料 + 锯缝”折算，
+  最后一段恰好用尽棒料时不计锯缝
+- 第一阶段：降序首次适应（FFD），用最大值线段树查找第一根放得下的棒料，O(n log n)
+- 第二阶段（时间预算内）：把最空的棒料与其余棒料两两合并、用子集和精确重排，使后者最满，
+  余量逐步集中到最空的棒料上，清空即少用一根；达到理论下限（总长 / 棒料长度向上取整）
+  或时限用尽即停止。两种方案取棒料更少者，数量相同时取可复用余料（≥ 最小余料长度）更多者
+- 不同型材互不相关：零件较多时放到进程池并行求解，进程池不可用时退回串行
+
+脚本调用示例（无需 Blender）：
+    from aluframe.cutlist import optimize
+    plan = optimize([(1200.0, 40), (850.5, 16)], stock_length=6000, kerf=3)
+    for bar in plan.bars:
+        print(bar.cuts, bar.remnant)
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+STOCK_LENGTH = 6000.0
+KERF = 3.0
+# 短于该长度的余料按废料计
+MIN_OFFCUT = 100.0
+# 每种型材的改进阶段时限（秒）
+TIME_BUDGET = 2.0
+
+# 零件总数达到该值才启用进程池（进程启动本身约需数百毫秒）
+PARALLEL_MIN_PIECES = 2000
+
+_SCALE = 10
+# 改进阶段每轮依次尝试消去的最空棒料数
+_ELIMINATION_TRIES = 12
+
+
+def _units(mm):
+    return int(round(float(mm) * _SCALE))
+
+
+def _mm(units):
+    return units / _SCALE
+
+
+class Bar:
+    """一根棒料的下料顺序（mm，按下料先后）与余料。"""
+
+    __slots__ = ("stock", "kerf", "cuts")
+
+    def __init__(self, stock, kerf, cuts):
+        self.stock = stock
+        self.kerf = kerf
+        self.cuts = cuts
+
+    @property
+    def used(self):
+        return sum(self.cuts)
+
+    @property
+    def remnant(self):
+        return max(0.0, round(self.stock - self.used - self.kerf * len(self.cuts), 1))
+
+    def sequence(self):
+        """逐段产出 (起点 mm, 长度 mm)，相邻两段之间留出锯缝。"""
+        pos = 0.0
+        for length in self.cuts:
+            yield round(pos, 1), length
+            pos += length + self.kerf
+
+
+class CutPlan:
+    """一种型材的下料方案。"""
+
+    __slots__ = ("key", "stock_length", "kerf", "min_offcut", "bars", "oversize",
+                 "lower_bound", "method", "elapsed")
+
+    def __init__(self, key, stock_length, kerf, min_offcut):
+        self.key = key
+        self.stock_length = stock_length
+        self.kerf = kerf
+        self.min_offcut = min_offcut
+        self.bars = []
+        self.oversize = []  # 超过棒料长度、无法下料的零件长度
+        self.lower_bound = 0
+        self.method = 'FFD'
+        self.elapsed = 0.0
+
+    @property
+    def piece_count(self):
+        return sum(len(b.cuts) for b in self.bars)
+
+    @property
+    def total_stock(self):
+        return self.stock_length * len(self.bars)
+
+    @property
+    def total_parts(self):
+        return sum(b.used for b in self.bars)
+
+    @property
+    def reusable_offcut(self):
+        return sum(b.remnant for b in self.bars if b.remnant >= self.min_offcut)
+
+    @property
+    def waste_ratio(self):
+        """损耗率：(棒料总长 − 零件总长 − 可复用余料) / 棒料总长。"""
+        total = self.total_stock
+        if total <= 0.0:
+            return 0.0
+        return max(0.0, (total - self.total_parts - self.reusable_offcut) / total)
+
+    @property
+    def optimal(self):
+        return len(self.bars) == self.lower_bound
+
+
+def _ffd(sizes, cap):
+    """降序首次适应；sizes 已按降序排列。返回每根棒料的零件尺寸列表。"""
+    n = len(sizes)
+    size = 1
+    while size < max(n, 1):
+        size *= 2
+    # 叶子为各棒料剩余容量，未开启的棒料视为满容量（总在已开启棒料之后，保证“首次”语义）
+    tree = [cap] * (2 * size)
+    bars = []
+    for s in sizes:
+        i = 1
+        while i < size:
+            i = 2 * i if tree[2 * i] >= s else 2 * i + 1
+        b = i - size
+        if b == len(bars):
+            bars.append([])
+        bars[b].append(s)
+        tree[i] -= s
+        i //= 2
+        while i:
+            left, right = tree[2 * i], tree[2 * i + 1]
+            tree[i] = left if left > right else right
+            i //= 2
+    return bars
+
+
+def _max_fill(items, cap):
+    """子集和：items 中总和不超过 cap 的最大子集，返回其下标集合（成对合并的零件通常不超过十余段）。"""
+    reach = {0: ()}
+    best = 0
+    for i, s in enumerate(items):
+        for total, picked in list(reach.items()):
+            t = total + s
+            if t <= cap and t not in reach:
+                reach[t] = picked + (i,)
+                if t > best:
+                    best = t
+                    if best == cap:
+                        return set(reach[t])
+    return set(reach[best])
+
+
+def _improve(bars, cap, lower_bound, deadline):
+    """改进阶段：把余量集中到最空的棒料上，直到将其清空。
+
+    依次把最空的棒料与其余每根棒料两两合并，用子集和精确求出能让后者最满的组合，
+    剩下的零件留在最空的棒料中。每一步都让某根棒料严格更满，清空即少用一根；
+    若一轮下来无法清空，则换下一根较空的棒料重试，时限或尝试次数用尽即停止。
+    """
+    bars = [list(b) for b in bars]
+    attempt = 0
+    while len(bars) > lower_bound and attempt < _ELIMINATION_TRIES:
+        if time.perf_counter() > deadline:
+            break
+        bars.sort(key=sum, reverse=True)
+        if attempt >= len(bars):
+            break
+        e = len(bars) - 1 - attempt
+        target = bars[e]
+        emptied = False
+        for b, bar in enumerate(bars):
+            if b == e:
+                continue
+            if time.perf_counter() > deadline:
+                break
+            pool = bar + target
+            keep = _max_fill(pool, cap)
+            if sum(pool[i] for i in keep) <= sum(bar):
+                continue
+            bars[b] = [pool[i] for i in keep]
+            target = [pool[i] for i in range(len(pool)) if i not in keep]
+            bars[e] = target
+            if not target:
+                emptied = True
+                break
+        if emptied:
+            del bars[e]
+            attempt = 0
+        else:
+            attempt += 1
+    return bars
+
+
+def optimize(pieces, stock_length=STOCK_LENGTH, kerf=KERF, min_offcut=MIN_OFFCUT,
+             time_budget=TIME_BUDGET, key=None):
+    """求一种型材的下料方案。
+
+    pieces：可迭代的 (长度 mm, 数量)。返回 CutPlan。
+    """
+    t0 = time.perf_counter()
+    plan = CutPlan(key, float(stock_length), float(kerf), float(min_offcut))
+    k = _units(kerf)
+    cap = _units(stock_length) + k
+
+    demand = {}
+    for length, count in pieces:
+        count = int(count)
+        if count <= 0:
+            continue
+        u = _units(length)
+        if u + k > cap or u <= 0:
+            plan.oversize.extend([float(length)] * count)
+            continue
+        demand[u + k] = demand.get(u + k, 0) + count
+
+    flat = [s for s in sorted(demand, reverse=True) for _ in range(demand[s])]
+    if not flat:
+        plan.elapsed = time.perf_counter() - t0
+        return plan
+
+    total = sum(flat)
+    plan.lower_bound = -(-total // cap)
+    best = _ffd(flat, cap)
+    method = 'FFD'
+
+    if len(best) > plan.lower_bound and time_budget > 0:
+        candidate = _improve(best, cap, plan.lower_bound, t0 + float(time_budget))
+        if _better(candidate, best, cap, _units(min_offcut)):
+            best = candidate
+            method = 'FFD+REPACK'
+
+    plan.method = method
+    plan.bars = [
+        Bar(plan.stock_length, plan.kerf, [_mm(s - k) for s in sorted(bar, reverse=True)])
+        for bar in sorted(best, key=sum, reverse=True)
+    ]
+    plan.elapsed = time.perf_counter() - t0
+    return plan
+
+
+def _better(a, b, cap, min_offcut):
+    if len(a) != len(b):
+        return len(a) < len(b)
+
+    def reusable(bars):
+        return sum(cap - sum(bar) for bar in bars if cap - sum(bar) >= min_offcut)
+
+    return reusable(a) > reusable(b)
+
+
+def _solve_job(job):
+    key, pieces, options = job
+    return optimize(pieces, key=key, **options)
+
+
+def optimize_many(demand, stock_length=STOCK_LENGTH, kerf=KERF, min_offcut=MIN_OFFCUT,
+                  time_budget=TIME_BUDGET, processes=None):
+    """按型材分别求解：demand 为 {键: [(长度 mm, 数量), ...]}，返回 {键: CutPlan}（按键排序）。
+
+    processes：进程数；None 为 CPU 核数，1 为串行。
+    """
+    options = {
+        "stock_length": stock_length,
+        "kerf": kerf,
+        "min_offcut": min_offcut,
+        "time_budget": time_budget,
+    }
+    jobs = [(key, list(pieces), options) for key, pieces in sorted(demand.items())]
+    total = sum(c for _, pieces, _ in jobs for _, c in pieces)
+    workers = min(len(jobs), processes or os.cpu_count() or 1)
+
+    if workers > 1 and total >= PARALLEL_MIN_PIECES:
+        try:
+            import multiprocessing
+            # spawn：不 fork 宿主进程（Blender 进程 fork 不安全）
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                plans = list(pool.map(_solve_job, jobs))
+            return {plan.key: plan for plan in plans}
+        except Exception as e:
+            print(f"[AluFrame] 下料并行求解不可用，改为串行：{e}")
+    return {job[0]: _solve_job(job) for job in jobs}
+
+
+def demand_from_bom(index):
+    """由 BOM 索引得到 {(型号, 标准): [(长度 mm, 数量), ...]}。"""
+    demand = {}
+    for row in index.sorted_rows():
+        demand.setdefault((row.alu_type, row.standard), []).append((row.length, row.count))
+    return demand
+
+
+def demand_from_store(store):
+    """由成员存储得到同样的需求表（一次 np.unique 分组，不遍历对象）。"""
+    demand = {}
+    for alu_type, standard, length, count in store.bom_rows():
+        demand.setdefault((alu_type, standard), []).append((length, count))
+    return demand
+
+
+CUTLIST_TITLE = "铝型材下料方案"
+CUTLIST_COLUMNS = ["型材型号", "执行标准", "棒料序号", "下料顺序(mm)", "段数", "余料(mm)", "利用率"]
+
+
+def cutlist_rows(plans, label=lambda standard: standard):
+    """逐根棒料的表格行生成器。"""
+    for (alu_type, standard), plan in plans.items():
+        std = label(standard)
+        for i, bar in enumerate(plan.bars, 1):
+            seq = " + ".join(f"{length:g}" for length in bar.cuts)
+            ratio = bar.used / bar.stock if bar.stock else 0.0
+            yield (alu_type, std, i, seq, len(bar.cuts), bar.remnant, f"{ratio:.1%}")
+
+
+def write_cutlist(path, file_format, plans, label=lambda standard: standard, now=None):
+    """写出下料方案：表头、各型材汇总（棒料数、损耗率），随后为逐根棒料的下料顺序。"""
+    import datetime
+
+    from .bom_export import open_writer
+
+    now = now or datetime.datetime.now()
+    written = 0
+    with open_writer(path, file_format) as w:
+        w.write_row([CUTLIST_TITLE], bold=True)
+        w.write_row(["导出时间", now.strftime("%Y-%m-%d %H:%M:%S")])
+        w.write_row([])
+        w.write_row(["型材型号", "执行标准", "棒料长度(mm)", "棒料数(根)", "理论下限(根)", "零件数", "损耗率"], bold=True)
+        for (alu_type, standard), plan in plans.items():
+            w.write_row([alu_type, label(standard), plan.stock_length, len(plan.bars),
+                         plan.lower_bound, plan.piece_count, f"{plan.waste_ratio:.1%}"])
+        w.write_row([])
+        w.write_row(CUTLIST_COLUMNS, bold=True)
+        for values in cutlist_rows(plans, label):
+            w.write_row(values)
+            written += 1
+    return written
@@ -1,58 +1,94 @@
 import bpy
-import json
-import os
 
+from . import profiling
+from .catalog import get_catalog, loaded_catalog
 
-class AluFrameProfileItem(bpy.types.PropertyGroup):
+
+class AluFrameProfileRef(bpy.types.PropertyGroup):
+    # 仅保存目录条目 ID；截面参数统一从会话级目录（catalog.get_catalog）读取
     uid: bpy.props.StringProperty(name="ID")
-    name: bpy.props.StringProperty(name="型号")
-    standard: bpy.props.EnumProperty(
-        name="标准",
-        items=(
-            ('GB', '国标', ''),
-            ('EN', '欧标', ''),
-        ),
-    )
-    series: bpy.props.StringProperty(name="系列")  # 20/30/40/45 等
-    width: bpy.props.FloatProperty(name="宽度(mm)")
-    height: bpy.props.FloatProperty(name="高度(mm)")
-    slot_width: bpy.props.FloatProperty(name="槽宽(mm)")
-    wall_thickness: bpy.props.FloatProperty(name="壁厚(mm)")
-    default_length: bpy.props.FloatProperty(name="默认长度(mm)", default=1000.0)
-
-
-def _profiles_json_path():
-    return os.path.join(os.path.dirname(__file__), 'assets', 'profiles.json')
-
-
-def _ensure_profiles_loaded(scene):
-    # 避免重复加载
-    if len(scene.aluframe_profiles) > 0:
-        return
-
-    path = _profiles_json_path()
-    if not os.path.exists(path):
-        print(f"[AluFrame] 未找到 profiles.json：{path}")
-        return
+
+
+_refs_version = None
+
+
+def sync_catalog_refs(wm=None):
+    """使窗口管理器上的目录引用列表与会话目录一致（UIList 需要 RNA 集合作为数据源）。
+
+    引用列表挂在 WindowManager 上：不随 .blend 保存，也不在每个场景中重复一份。
+    """
+    global _refs_version
+    if wm is None:
+        wm = getattr(bpy.context, 'window_manager', None)
+        if wm is None and len(bpy.data.window_managers) > 0:
+            wm = bpy.data.window_managers[0]
+    if wm is None or not hasattr(wm, 'aluframe_catalog'):
+        return False
+
+    cat = get_catalog()
+    refs = wm.aluframe_catalog
+    if _refs_version == cat.version and len(refs) == len(cat):
+        return True
+    refs.clear()
+    for entry in cat.entries:
+        refs.add().uid = entry.uid
+    _refs_version = cat.version
+    return True
+
+
+def catalog_refs_synced(wm):
+    """引用列表是否已与会话目录一致；目录尚未加载时返回 False（本函数不加载目录）。"""
+    cat = loaded_catalog()
+    if cat is None:
+        return False
+    return _refs_version == cat.version and len(wm.aluframe_catalog) == len(cat)
+
+
+def _sync_pending():
+    from .handlers import _tag_redraw
+
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # 目录（JSON / 编译缓存读取、缓存回写）只在这里加载，draw() 只检查是否已加载
+        get_catalog()
+        sync_catalog_refs()
     except Exception as e:
-        print(f"[AluFrame] 读取 profiles.json 失败：{e}")
-        return
-
-    for item in data:
-        it = scene.aluframe_profiles.add()
-        it.uid = item.get('id', '')
-        it.name = item.get('name', '')
-        it.standard = item.get('standard', 'GB')
-        it.series = str(item.get('series', ''))
-        sp = item.get('section_params', {})
-        it.width = float(sp.get('width', 0.0))
-        it.height = float(sp.get('height', 0.0))
-        it.slot_width = float(sp.get('slot_width', 0.0))
-        it.wall_thickness = float(sp.get('wall_thickness', 0.0))
-        it.default_length = float(item.get('default_length', 1000.0))
+        print(f"[AluFrame] 型材目录引用同步失败：{e}")
+    _tag_redraw()
+    return None
+
+
+def request_catalog_sync():
+    """在 draw() 之外同步引用列表（draw 中不能写 ID 数据）：登记一次性计时器。
+
+    型材库面板首次绘制时调用，目录（及其编译缓存）由计时器在 draw() 之外加载：
+    只在用户打开侧栏时才加载，既不占用 Blender 启动与插件注册的时间，也不阻塞绘制。
+    """
+    if not bpy.app.timers.is_registered(_sync_pending):
+        bpy.app.timers.register(_sync_pending, first_interval=0.0)
+
+
+def active_profile(context):
+    """返回当前场景选中的目录条目（按 ID 引用，回退到列表索引）；无则返回 None。"""
+    scene = context.scene
+    cat = get_catalog()
+    uid = getattr(scene, 'aluframe_profile_uid', '')
+    entry = cat.get(uid) if uid else None
+    if entry is None:
+        idx = getattr(scene, 'aluframe_profiles_index', -1)
+        if 0 <= idx < len(cat):
+            entry = cat.entries[idx]
+    return entry
+
+
+def _on_profiles_index_update(self, context):
+    cat = get_catalog()
+    idx = self.aluframe_profiles_index
+    if 0 <= idx < len(cat):
+        self.aluframe_profile_uid = cat.entries[idx].uid
+
+
+def _on_profiling_update(self, context):
+    profiling.set_enabled(self.aluframe_profiling)
 
 
 def register():
@@ -60,8 +96,8 @@ def register():
     # Blender 3.5 在重复注册时会抛 ValueError；统一处理两种异常
     try:
         # 若已存在同名类型则跳过注册，避免重复
-        if not hasattr(bpy.types, 'AluFrameProfileItem'):
-            bpy.utils.register_class(AluFrameProfileItem)
+        if not hasattr(bpy.types, 'AluFrameProfileRef'):
+            bpy.utils.register_class(AluFrameProfileRef)
     except (RuntimeError, ValueError) as e:
         msg = str(e)
         if 'already registered' in msg:
@@ -70,12 +106,27 @@ def register():
             raise
 
     # 逐项添加属性（有则跳过），避免重复注册的报错
-    if not hasattr(bpy.types.Scene, 'aluframe_profiles'):
-        bpy.types.Scene.aluframe_profiles = bpy.props.CollectionProperty(type=AluFrameProfileItem)
+    if not hasattr(bpy.types.WindowManager, 'aluframe_catalog'):
+        bpy.types.WindowManager.aluframe_catalog = bpy.props.CollectionProperty(type=AluFrameProfileRef)
+    if not hasattr(bpy.types.WindowManager, 'aluframe_profiling'):
+        # 会话级开关（不随 .blend 保存），初始值沿用环境变量 ALUFRAME_PROFILE
+        bpy.types.WindowManager.aluframe_profiling = bpy.props.BoolProperty(
+            name="性能计时",
+            description="记录操作符、面板绘制与 depsgraph 处理的逐次耗时（关闭时几乎无开销）",
+            default=profiling.enabled,
+            update=_on_profiling_update,
+        )
     if not hasattr(bpy.types.Scene, 'aluframe_profiles_index'):
-        bpy.types.Scene.aluframe_profiles_index = bpy.props.IntProperty(name="型材索引", default=0)
+        bpy.types.Scene.aluframe_profiles_index = bpy.props.IntProperty(
+            name="型材索引", default=0, update=_on_profiles_index_update
+        )
+    if not hasattr(bpy.types.Scene, 'aluframe_profile_uid'):
+        bpy.types.Scene.aluframe_profile_uid = bpy.props.StringProperty(name="当前型材 ID")
     if not hasattr(bpy.types.Scene, 'aluframe_search'):
-        bpy.types.Scene.aluframe_search = bpy.props.StringProperty(name="搜索")
+        bpy.types.Scene.aluframe_search = bpy.props.StringProperty(
+            name="搜索",
+            description="型号/系列关键字；支持条件 slot:8、series:40-45、w:40、h:80（可组合）",
+        )
     if not hasattr(bpy.types.Scene, 'aluframe_filter_standard'):
         bpy.types.Scene.aluframe_filter_standard = bpy.props.EnumProperty(
             name="标准过滤",
@@ -88,48 +139,62 @@ def register():
             items=(('ALL', '全部', ''), ('20', '20', ''), ('30', '30', ''), ('40', '40', ''), ('45', '45', '')),
             default='ALL'
         )
-
-    # 在 3.5 的插件启用阶段，bpy.context 可能是 _RestrictContext，无法直接访问 scene。
-    # 这里不直接加载，而是通过计时器在 scene 可用时再进行一次性加载。
-    def _defer_load():
-        try:
-            scene = getattr(bpy.context, 'scene', None)
-            if scene is None:
-                # 退化到数据中的第一个场景（若已有）
-                if len(bpy.data.scenes) == 0:
-                    return 0.25  # 稍后重试
-                scene = bpy.data.scenes[0]
-
-            if hasattr(scene, 'aluframe_profiles'):
-                _ensure_profiles_loaded(scene)
-                return None  # 停止计时器（一次性加载）
-            else:
-                return 0.25
-        except Exception:
-            return 0.25
-
-    try:
-        bpy.app.timers.register(_defer_load)
-    except Exception:
-        # 旧版本若无 timers.register，则尽力立即加载（若 scene 可用）
-        scene = getattr(bpy.context, 'scene', None)
-        if scene is not None and hasattr(scene, 'aluframe_profiles'):
-            _ensure_profiles_loaded(scene)
-
+    if not hasattr(bpy.types.Scene, 'aluframe_geometry_mode'):
+        # ANALYTIC 直接由截面轮廓拉伸生成；BOOLEAN 对槽切割体求一次布尔差集后烘焙（用于对比）；
+        # NODES 为逐对象的几何节点修饰器（节点组见 aluframe_node_tree）
+        bpy.types.Scene.aluframe_geometry_mode = bpy.props.EnumProperty(
+            name="几何后端",
+            items=(
+                ('ANALYTIC', '解析截面', '由截面轮廓直接拉伸生成带槽网格（无修饰器、无辅助对象）'),
+                ('BOOLEAN', '布尔槽口', '实心立方体与槽切割体求 EXACT 布尔差集'),
+                ('NODES', '几何节点', '共享空网格 + 几何节点修饰器，修改长度 / 截面参数后即时重新求值'),
+            ),
+            default='ANALYTIC'
+        )
+    if not hasattr(bpy.types.Scene, 'aluframe_price_per_kg'):
+        bpy.types.Scene.aluframe_price_per_kg = bpy.props.FloatProperty(
+            name="单价 (元/kg)",
+            description="铝型材单价，用于 BOM 中的估算成本",
+            default=30.0,
+            min=0.0,
+        )
+    if not hasattr(bpy.types.Scene, 'aluframe_node_tree'):
+        bpy.types.Scene.aluframe_node_tree = bpy.props.EnumProperty(
+            name="节点组",
+            items=(
+                ('SWEEP', '截面扫掠', '带槽截面曲线经 Curve to Mesh 沿长度扫掠（无网格布尔）'),
+                ('BOOLEAN', '布尔槽口', '立方体减去四个槽口立方体（EXACT 布尔，求值较慢）'),
+            ),
+            default='SWEEP'
+        )
 
 def unregister():
-    if hasattr(bpy.types.Scene, 'aluframe_profiles'):
-        del bpy.types.Scene.aluframe_profiles
+    global _refs_version
+    _refs_version = None
+    if bpy.app.timers.is_registered(_sync_pending):
+        bpy.app.timers.unregister(_sync_pending)
+    if hasattr(bpy.types.WindowManager, 'aluframe_catalog'):
+        del bpy.types.WindowManager.aluframe_catalog
+    if hasattr(bpy.types.WindowManager, 'aluframe_profiling'):
+        del bpy.types.WindowManager.aluframe_profiling
     if hasattr(bpy.types.Scene, 'aluframe_profiles_index'):
         del bpy.types.Scene.aluframe_profiles_index
+    if hasattr(bpy.types.Scene, 'aluframe_profile_uid'):
+        del bpy.types.Scene.aluframe_profile_uid
     if hasattr(bpy.types.Scene, 'aluframe_search'):
         del bpy.types.Scene.aluframe_search
     if hasattr(bpy.types.Scene, 'aluframe_filter_standard'):
         del bpy.types.Scene.aluframe_filter_standard
     if hasattr(bpy.types.Scene, 'aluframe_filter_series'):
         del bpy.types.Scene.aluframe_filter_series
+    if hasattr(bpy.types.Scene, 'aluframe_geometry_mode'):
+        del bpy.types.Scene.aluframe_geometry_mode
+    if hasattr(bpy.types.Scene, 'aluframe_node_tree'):
+        del bpy.types.Scene.aluframe_node_tree
+    if hasattr(bpy.types.Scene, 'aluframe_price_per_kg'):
+        del bpy.types.Scene.aluframe_price_per_kg
 
     try:
-        bpy.utils.unregister_class(AluFrameProfileItem)
+        bpy.utils.unregister_class(AluFrameProfileRef)
     except Exception:
         pass
\ No newline at end of file
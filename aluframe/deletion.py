@@ -0,0 +1,126 @@
+"""批量删除：型材连同其槽辅助对象与不再使用的网格，一次 bpy.data.batch_remove 删除。
+
+- 删除范围与 bpy.ops.object.delete(use_global=False) 相同：仍链接在其他场景中的对象
+  只从当前场景移除，不删除数据块
+- 本插件的型材 / 装配体（带 alu_type / alu_assembly 属性）：逐对象布尔构造的 AluSlots_* 槽切割体
+  （布尔修饰器引用）随型材一起处理
+- 只回收本插件的网格（AluFrameMesh_* / AluFrameSlots_* 前缀或带 alu_assembly 标记，且无伪用户）：
+  被删除对象独占的一并删除，仍被其他对象共用的缓存网格保留；其他对象的网格与原生删除一样保留
+- 顺带回收本插件的孤立网格（长度修改、并入装配体等留下的无用户网格），文件不会越用越大
+- 删除后立即通知成员存储（及其 BOM 分组）与吸附 / 干涉 / 连接索引按场景成员剔除，不等下一次 depsgraph 刷新
+"""
+
+import sys
+from collections import Counter
+
+import bpy
+
+SLOT_HELPER_PREFIX = "AluSlots_"
+# 本插件生成的网格名称前缀：无用户时可直接回收
+MESH_PREFIXES = ("AluFrameMesh_", "AluFrameSlots_")
+# 装配体点网格的标记（与 assembly.ASSEMBLY_PROP 相同）
+ASSEMBLY_PROP = "alu_assembly"
+
+
+def is_member(obj):
+    """本插件的型材或装配体对象。"""
+    return "alu_type" in obj or bool(obj.get(ASSEMBLY_PROP))
+
+
+def is_owned_mesh(mesh):
+    """本插件生成的网格（可随对象回收）。"""
+    return mesh.name.startswith(MESH_PREFIXES) or bool(mesh.get(ASSEMBLY_PROP))
+
+
+def helper_objects(obj):
+    """型材依赖的辅助对象（布尔修饰器引用的 AluSlots_* 槽切割体）。"""
+    helpers = []
+    for mod in getattr(obj, "modifiers", ()):
+        if mod.type != 'BOOLEAN':
+            continue
+        helper = mod.object
+        if helper is not None and helper.name.startswith(SLOT_HELPER_PREFIX):
+            helpers.append(helper)
+    return helpers
+
+
+def resolve(objects, scene):
+    """展开待删除集合：返回 (删除的对象集合, 只从 scene 移除的对象集合, 辅助对象数量, 随之删除的网格集合)。"""
+    # 只有一个场景时不必逐对象查询 users_scene
+    shared_scenes = len(bpy.data.scenes) > 1
+
+    def in_other_scene(obj):
+        return shared_scenes and any(s != scene for s in obj.users_scene)
+
+    removed, unlinked = set(), set()
+    for obj in objects:
+        (unlinked if in_other_scene(obj) else removed).add(obj)
+    helpers = 0
+    for obj in [o for o in removed | unlinked if is_member(o)]:
+        for helper in helper_objects(obj):
+            if helper in removed or helper in unlinked:
+                continue
+            helpers += 1
+            # 型材仍留在其他场景时，槽切割体也要保留（布尔修饰器引用）
+            if obj in unlinked or in_other_scene(helper):
+                unlinked.add(helper)
+            else:
+                removed.add(helper)
+
+    # 本插件网格的全部使用者都在删除集合中时一并删除
+    usage = Counter(obj.data for obj in removed
+                    if obj.type == 'MESH' and obj.data is not None and is_owned_mesh(obj.data))
+    meshes = {mesh for mesh, n in usage.items() if not mesh.use_fake_user and mesh.users <= n}
+    for mesh in bpy.data.meshes:
+        if mesh.users == 0 and mesh.name.startswith(MESH_PREFIXES):
+            meshes.add(mesh)
+    return removed, unlinked, helpers, meshes
+
+
+def _unlink(objects, scene):
+    """把对象从 scene 的全部集合中移除（对象本身仍在其他场景中使用）。"""
+    if not objects:
+        return
+    for coll in [scene.collection] + list(scene.collection.children_recursive):
+        linked = coll.objects
+        for obj in objects:
+            if linked.get(obj.name) is not None:
+                linked.unlink(obj)
+
+
+def _notify_indexes(scene):
+    """删除 / 移出场景已知发生：立即按 scene 的成员剔除各索引中的成员（不等待合并刷新）。"""
+    from . import snapping
+
+    package = __package__
+    store = sys.modules.get(f"{package}.store")
+    if store is not None and store.index.valid and store.index.scene_name == scene.name:
+        store.index.prune(scene)
+    snap = snapping.index
+    if snap.valid and snap.scene_name == scene.name:
+        removed = snap.prune(scene)
+        for name in ("interference", "connections"):
+            module = sys.modules.get(f"{package}.{name}")
+            if removed and module is not None and module.index.generation == snap.generation:
+                module.index.update(snap, removed)
+    gn = sys.modules.get(f"{package}.gn")
+    if gn is not None:
+        # 缓存中已被删除的网格条目在这里清掉
+        gn.release_unused_meshes()
+
+
+def delete_objects(objects, scene=None):
+    """从 scene（缺省为当前场景）删除 objects 及其辅助对象、独占网格，返回 (删除的对象数, 辅助对象数, 网格数)。
+
+    对象数含只从 scene 移除、仍保留在其他场景中的对象。
+    """
+    scene = scene or bpy.context.scene
+    removed, unlinked, helpers, meshes = resolve(objects, scene)
+    if not removed and not unlinked and not meshes:
+        return 0, 0, 0
+    count = len(removed) + len(unlinked)
+    mesh_count = len(meshes)
+    _unlink(unlinked, scene)
+    bpy.data.batch_remove(list(removed) + list(meshes))
+    _notify_indexes(scene)
+    return count - helpers, helpers, mesh_count
@@ -0,0 +1,703 @@
+"""框架结构线弹性计算：三维梁单元（Euler-Bernoulli，每节点 6 自由度），稀疏刚度矩阵求解。
+
+建模（单位：N、mm）：
+- 成员来自成员存储（store）：型材沿局部 Z 的中心线为梁轴，局部 X / Y 为截面主轴，
+  截面特性取 section.section_properties（面积、Ix / Iy、扭转常数、截面模量）
+- 节点：端点连接取自连接图（connections，T 形 / 角接 / 同轴对接）；含装配体的点时按空间哈希
+  自行检测。端点连到另一根型材侧面时在该型材上插入节点，连到端部附近（角接 / 同轴对接）时
+  与其端点合并；连接一律按刚接处理。
+  每根型材另在中点设节点，用于跨中挠度与中点集中力
+- 支座、荷载记在场景 ID 属性中（按成员名称），装配体中的点同样适用：
+  支座 SUPPORTS_PROP {名称: [起点类型, 终点类型]}，类型为 "" / "PINNED"（铰接）/ "FIXED"（固接）；
+  荷载 LOADS_PROP {名称: [均布 N/m, 跨中集中力 N]}，方向为世界 -Z；可选计入自重
+- 铰接支座约束三向平动与绕该型材轴线的扭转（叉形支座），固接支座约束全部 6 个自由度
+- 未与任何支座相连的部分不参与求解，结果中单独计数
+
+求解：有 SciPy 时用稀疏 LU 分解（scipy.sparse.linalg.splu），否则用 NumPy 实现的
+Jacobi 预条件共轭梯度。结构（几何、截面、支座）不变、只改荷载时复用分解结果与刚度矩阵。
+刚度矩阵不做正则化：主元过小（SciPy）、小模型特征值过小或共轭梯度不收敛（NumPy）时
+抛出 UnstableStructure，不给出数值结果。
+
+结果：每根型材的最大挠度（节点与单元内采样点的绝对位移，即相对支座的位移，mm）与利用率
+max(组合应力 / 许用应力, 挠度 / (L / DEFLECTION_LIMIT))。
+"""
+
+import hashlib
+import time
+
+import numpy as np
+
+from .section import ELASTIC_MODULUS, SHEAR_MODULUS, YIELD_STRENGTH, item_properties
+
+try:
+    import scipy.sparse as _sparse
+    import scipy.sparse.linalg as _sparse_linalg
+except ImportError:  # SciPy 为可选依赖
+    _sparse = None
+    _sparse_linalg = None
+
+SUPPORTS_PROP = "aluframe_fem_supports"
+LOADS_PROP = "aluframe_fem_loads"
+SUPPORT_TYPES = ("PINNED", "FIXED")
+
+GRAVITY = 9.81  # m/s²
+SAFETY_FACTOR = 1.5
+ALLOWABLE_STRESS = YIELD_STRENGTH / SAFETY_FACTOR  # N/mm²
+DEFLECTION_LIMIT = 200.0  # 允许挠度 L / 200
+
+# 连接检测：端面到另一根型材轴线 / 端部的额外容差（mm）
+JOINT_TOLERANCE = 2.0
+CELL_SIZE = 250.0  # mm
+
+# 共轭梯度（无 SciPy 时）
+CG_TOLERANCE = 1e-8
+CG_MAX_ITERATIONS = 20000
+# 无 SciPy 时自由度不超过该数量的模型用稠密特征值检查稳定性
+DENSE_CHECK_DOFS = 1200
+# 主元（或最小特征值）与刚度矩阵最大对角元之比低于该值视为奇异（可变体系）
+PIVOT_TOLERANCE = 1e-12
+# 铰接支座扭转弹簧刚度 = 系数 × G·J / L（近似刚性，仅消除构件绕自身轴线转动的零能模式）
+TORSION_SUPPORT_FACTOR = 1000.0
+
+DOF = 6
+
+
+class UnstableStructure(RuntimeError):
+    """结构不稳定：支座不足或存在机构，刚度矩阵奇异。"""
+
+    def __init__(self, detail=""):
+        message = "结构不稳定（可变体系）：支座不足或存在未约束的自由度"
+        super().__init__(f"{message}（{detail}）" if detail else message)
+
+
+def has_scipy():
+    return _sparse is not None
+
+
+# ---------------------------------------------------------------------------
+# 连接检测
+# ---------------------------------------------------------------------------
+
+def member_radius(store):
+    """每根型材截面外包半宽（mm），与 store.view() 的行一一对应。"""
+    from .catalog import get_catalog
+
+    catalog = get_catalog()
+    table = []
+    for uid, _, _ in store.types:
+        item = catalog.get(uid)
+        table.append(max(float(item.width), float(item.height)) / 2.0 if item is not None else 0.0)
+    profile = store.view()[0]
+    if not table:
+        return np.zeros(len(profile))
+    return np.asarray(table, dtype=np.float64)[profile]
+
+
+def detect_joints(p0, p1, radius, tolerance=JOINT_TOLERANCE, cell=CELL_SIZE):
+    """检测端点连接：返回 [(端点序号 e, 宿主型材 j, 沿 j 轴线的参数 t mm), ...]。
+
+    端点序号 e < n 为型材 e 的起点，否则为型材 e - n 的终点。
+    p0 / p1：起点 / 终点（n×3，mm）；radius：截面外包半宽。端点到 j 轴线的距离不超过
+    radius[j] + tolerance、且投影落在 j 的长度范围内（两端各放宽 radius[i] + tolerance）时视为连接，
+    取距离最近的宿主；t 截断到 [0, L_j]。
+    """
+    n = len(p0)
+    axis = p1 - p0
+    length = np.linalg.norm(axis, axis=1)
+    safe = np.where(length > 0.0, length, 1.0)
+    unit = axis / safe[:, None]
+    reach = radius + radius.max(initial=0.0) + tolerance
+
+    # 空间哈希：每根型材登记到其轴线外包盒（扩展 reach）覆盖的格子
+    lo = np.floor((np.minimum(p0, p1) - reach[:, None]) / cell).astype(np.int64)
+    hi = np.floor((np.maximum(p0, p1) + reach[:, None]) / cell).astype(np.int64)
+    grid = {}
+    for i in range(n):
+        (x0, y0, z0), (x1, y1, z1) = lo[i].tolist(), hi[i].tolist()
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for z in range(z0, z1 + 1):
+                    grid.setdefault((x, y, z), []).append(i)
+
+    ends = np.concatenate((p0, p1))
+    cells = np.floor(ends / cell).astype(np.int64).tolist()
+    joints = []
+    for e in range(2 * n):
+        i = e % n
+        candidates = [j for j in grid.get(tuple(cells[e]), ()) if j != i]
+        if not candidates:
+            continue
+        c = np.asarray(candidates)
+        rel = ends[e] - p0[c]
+        t = np.einsum("ij,ij->i", rel, unit[c])
+        perp = np.linalg.norm(rel - t[:, None] * unit[c], axis=1)
+        slack = radius[i] + tolerance
+        ok = (perp <= radius[c] + tolerance) & (t >= -slack) & (t <= length[c] + slack)
+        if not ok.any():
+            continue
+        k = np.flatnonzero(ok)[np.argmin(perp[ok])]
+        j = int(c[k])
+        joints.append((e, j, float(min(max(t[k], 0.0), length[j]))))
+    return joints
+
+
+# ---------------------------------------------------------------------------
+# 模型
+# ---------------------------------------------------------------------------
+
+class FrameModel:
+    """节点、单元与截面（结构不变时复用，包括刚度矩阵的分解结果）。"""
+
+    def __init__(self):
+        self.nodes = np.zeros((0, 3))
+        self.elements = np.zeros((0, 2), dtype=np.int64)
+        self.element_member = np.zeros(0, dtype=np.int64)
+        self.rotation = np.zeros((0, 3, 3))
+        self.section = np.zeros((0, 6))  # A, Iy, Iz, J, Wy, Wz（局部轴）
+        self.member_chain = []  # 每根型材沿轴线排列的节点序号
+        self.member_mid = np.zeros(0, dtype=np.int64)
+        self.member_length = np.zeros(0)
+        self.fixed = np.zeros(0, dtype=bool)
+        self.active = np.zeros(0, dtype=bool)  # 与支座连通的节点
+        self.springs = []  # 铰接支座的扭转弹簧 [(节点, 型材轴线, 刚度 N·mm/rad), ...]
+        self.key = None
+        self.solver = None
+        self.matrix = None
+
+
+def _find(parent, a):
+    while parent[a] != a:
+        parent[a] = parent[parent[a]]
+        a = parent[a]
+    return a
+
+
+def _union(parent, a, b):
+    ra, rb = _find(parent, a), _find(parent, b)
+    if ra != rb:
+        parent[max(ra, rb)] = min(ra, rb)
+
+
+def _section_table(store):
+    """型材表序号 -> [A, Iy, Iz, J, Wy, Wz]（局部 y = 型材 X 轴，局部 z = 型材 Y 轴）。"""
+    from .catalog import get_catalog
+
+    catalog = get_catalog()
+    rows = []
+    for uid, _, _ in store.types:
+        item = catalog.get(uid)
+        if item is None:
+            rows.append((0.0,) * 6)
+            continue
+        p = item_properties(item)
+        # 绕局部 y（型材 X 轴）弯曲用 ix / wx，绕局部 z（型材 Y 轴）用 iy / wy
+        rows.append((p.area, p.ix, p.iy, p.j, p.wx, p.wy))
+    return np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+
+
+def structure_key(store, supports):
+    h = hashlib.blake2b(digest_size=16)
+    profile, length, matrix, _ = store.view()
+    for values in (profile, length, matrix):
+        h.update(np.ascontiguousarray(values).tobytes())
+    h.update(repr(store.types).encode("utf-8"))
+    h.update(repr(sorted(supports.items())).encode("utf-8"))
+    return h.hexdigest()
+
+
+def build_model(store, supports, joints=None):
+    """由成员存储与支座表建立模型（frame_model 的成员存储入口）。"""
+    profile, _, matrix, _ = store.view()
+    n = len(profile)
+    if n == 0:
+        return FrameModel()
+    end_supports = {}
+    for name, kinds in supports.items():
+        row = store.row(name)
+        if row is None:
+            continue
+        for k, kind in enumerate(kinds[:2]):
+            if kind in SUPPORT_TYPES:
+                end_supports[row + n * k] = kind
+    start, end = store.endpoints()
+    return frame_model(start * 1000.0, end * 1000.0, matrix[:, :3, 0], _section_table(store)[profile],
+                       member_radius(store), end_supports, joints)
+
+
+def frame_model(p0, p1, x_axes, sections, radius, end_supports, joints=None):
+    """由型材中心线建立模型（单位 mm，不依赖成员存储，可直接用于测试）。
+
+    p0 / p1：起点 / 终点（n×3）；x_axes：截面 X 轴方向（n×3）；sections：每根的 [A, Iy, Iz, J, Wy, Wz]；
+    radius：截面外包半宽；end_supports：{端点序号 e: "PINNED" / "FIXED"}（e 的含义同 detect_joints）；
+    joints：端点连接，None 时调用 detect_joints。
+    """
+    model = FrameModel()
+    p0 = np.asarray(p0, dtype=np.float64).reshape(-1, 3)
+    p1 = np.asarray(p1, dtype=np.float64).reshape(-1, 3)
+    sections = np.asarray(sections, dtype=np.float64).reshape(-1, 6)
+    radius = np.asarray(radius, dtype=np.float64)
+    n = len(p0)
+    length = np.linalg.norm(p1 - p0, axis=1)
+    model.member_length = length
+    if n == 0:
+        return model
+    if joints is None:
+        joints = detect_joints(p0, p1, radius)
+
+    # 节点编号：型材 i 的起点 2i、终点 2i+1，插入点与中点依次追加
+    coords = [None] * (2 * n)
+    coords[0::2] = list(p0)
+    coords[1::2] = list(p1)
+    parent = list(range(2 * n))
+    splits = [[] for _ in range(n)]  # 每根型材上的插入点 [(t, 节点号), ...]
+
+    def new_node(point):
+        coords.append(point)
+        parent.append(len(parent))
+        return len(parent) - 1
+
+    for e, j, t in joints:
+        i = e if e < n else e - n
+        a = 2 * i if e < n else 2 * i + 1
+        slack = radius[i] + JOINT_TOLERANCE
+        if t <= slack:
+            host = 2 * j
+        elif t >= length[j] - slack:
+            host = 2 * j + 1
+        else:
+            host = None
+            for ts, node in splits[j]:
+                if abs(ts - t) <= slack:
+                    host = node
+                    break
+            if host is None:
+                point = p0[j] + (p1[j] - p0[j]) * (t / length[j])
+                host = new_node(point)
+                splits[j].append((t, host))
+        # 侧面连接：端点移到宿主轴线上（中心线模型）
+        coords[a] = coords[host]
+        _union(parent, a, host)
+
+    chains = []
+    mids = []
+    for i in range(n):
+        params = [(0.0, 2 * i), (float(length[i]), 2 * i + 1)] + splits[i]
+        half = float(length[i]) / 2.0
+        mid = None
+        for t, node in splits[i]:
+            if abs(t - half) <= JOINT_TOLERANCE:
+                mid = node
+        if mid is None:
+            mid = new_node(p0[i] + (p1[i] - p0[i]) * 0.5)
+            params.append((half, mid))
+        params.sort()
+        chains.append([node for _, node in params])
+        mids.append(mid)
+
+    # 合并后的节点：每组取坐标均值，重新连续编号
+    roots = np.array([_find(parent, a) for a in range(len(parent))])
+    unique, index = np.unique(roots, return_inverse=True)
+    points = np.asarray(coords, dtype=np.float64)
+    nodes = np.zeros((len(unique), 3))
+    np.add.at(nodes, index, points)
+    nodes /= np.bincount(index, minlength=len(unique))[:, None]
+    model.nodes = nodes
+    model.member_chain = [index[chain] for chain in chains]
+    model.member_mid = index[np.asarray(mids)]
+
+    # 单元：沿每根型材的相邻节点
+    pairs = []
+    owner = []
+    for i, chain in enumerate(model.member_chain):
+        for a, b in zip(chain[:-1], chain[1:]):
+            if a != b:
+                pairs.append((a, b))
+                owner.append(i)
+    elements = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    d = nodes[elements[:, 1]] - nodes[elements[:, 0]]
+    norm = np.linalg.norm(d, axis=1)
+    keep = norm > 1e-6  # 合并后重合的节点之间不建单元
+    model.elements = elements[keep]
+    model.element_member = np.asarray(owner, dtype=np.int64)[keep]
+
+    # 局部坐标系：x 沿单元，y 取型材 X 轴对 x 正交化，z = x × y
+    ex = d[keep] / norm[keep, None]
+    ref = np.asarray(x_axes, dtype=np.float64).reshape(-1, 3)[model.element_member]
+    ey = ref - np.einsum("ij,ij->i", ref, ex)[:, None] * ex
+    ey /= np.linalg.norm(ey, axis=1)[:, None]
+    ez = np.cross(ex, ey)
+    model.rotation = np.stack((ex, ey, ez), axis=1)
+    model.section = sections[model.element_member]
+
+    # 支座：铰接约束三向平动，并以扭转弹簧约束绕该型材轴线的转动（叉形支座）
+    fixed = np.zeros((len(nodes), DOF), dtype=bool)
+    springs = []
+    for e, kind in end_supports.items():
+        if kind not in SUPPORT_TYPES:
+            continue
+        i = e if e < n else e - n
+        node = index[2 * i if e < n else 2 * i + 1]
+        fixed[node, :3] = True
+        if kind == "FIXED":
+            fixed[node, 3:] = True
+        elif length[i] > 0.0:
+            axis = (p1[i] - p0[i]) / length[i]
+            springs.append((node, axis, TORSION_SUPPORT_FACTOR * SHEAR_MODULUS * sections[i, 3] / length[i]))
+    model.fixed = fixed.ravel()
+    model.springs = springs
+
+    # 与支座连通的节点（单元图的连通分量）
+    parent = list(range(len(nodes)))
+    for a, b in model.elements.tolist():
+        _union(parent, a, b)
+    roots = np.array([_find(parent, a) for a in range(len(nodes))])
+    supported = np.unique(roots[fixed.any(axis=1)])
+    model.active = np.isin(roots, supported)
+    return model
+
+
+# ---------------------------------------------------------------------------
+# 单元矩阵与装配
+# ---------------------------------------------------------------------------
+
+def local_stiffness(length, section, e=ELASTIC_MODULUS, g=SHEAR_MODULUS):
+    """局部坐标系下的单元刚度矩阵（m×12×12），自由度顺序 [u v w θx θy θz]×2。"""
+    a, iy, iz, j = section[:, 0], section[:, 1], section[:, 2], section[:, 3]
+    L = length
+    k = np.zeros((len(L), 12, 12))
+
+    def put(r, c, value):
+        k[:, r, c] = value
+        k[:, c, r] = value
+
+    ea, gj = e * a / L, g * j / L
+    put(0, 0, ea); put(6, 6, ea); put(0, 6, -ea)
+    put(3, 3, gj); put(9, 9, gj); put(3, 9, -gj)
+    # xy 平面弯曲（v, θz）：Iz
+    b12, b6, b4, b2 = 12 * e * iz / L ** 3, 6 * e * iz / L ** 2, 4 * e * iz / L, 2 * e * iz / L
+    put(1, 1, b12); put(7, 7, b12); put(1, 7, -b12)
+    put(1, 5, b6); put(1, 11, b6); put(5, 7, -b6); put(7, 11, -b6)
+    put(5, 5, b4); put(11, 11, b4); put(5, 11, b2)
+    # xz 平面弯曲（w, θy）：Iy
+    c12, c6, c4, c2 = 12 * e * iy / L ** 3, 6 * e * iy / L ** 2, 4 * e * iy / L, 2 * e * iy / L
+    put(2, 2, c12); put(8, 8, c12); put(2, 8, -c12)
+    put(2, 4, -c6); put(2, 10, -c6); put(4, 8, c6); put(8, 10, c6)
+    put(4, 4, c4); put(10, 10, c4); put(4, 10, c2)
+    return k
+
+
+def _to_global(k, rotation):
+    """Tᵀ K T（T 为 4 个 3×3 旋转块组成的块对角矩阵），按块批量计算。"""
+    m = len(k)
+    blocks = k.reshape(m, 4, 3, 4, 3)
+    out = np.einsum("eji,eajbk,ekl->eaibl", rotation, blocks, rotation)
+    return out.reshape(m, 12, 12)
+
+
+def _element_dofs(elements):
+    base = elements * DOF
+    return np.concatenate([base[:, :1] + np.arange(DOF), base[:, 1:] + np.arange(DOF)], axis=1)
+
+
+def _element_lengths(model):
+    d = model.nodes[model.elements[:, 1]] - model.nodes[model.elements[:, 0]]
+    return np.linalg.norm(d, axis=1)
+
+
+def _free_map(model):
+    """自由度 -> 求解方程序号（约束或未与支座连通的自由度为 -1）。"""
+    active = np.repeat(model.active, DOF)
+    free = ~model.fixed & active
+    mapping = np.full(len(free), -1, dtype=np.int64)
+    mapping[free] = np.arange(int(free.sum()))
+    return mapping, int(free.sum())
+
+
+class _CooMatrix:
+    """无 SciPy 时的对称稀疏矩阵（COO），提供矩阵-向量乘积与对角线。"""
+
+    def __init__(self, rows, cols, values, size):
+        self.rows, self.cols, self.values, self.size = rows, cols, values, size
+
+    def dot(self, x):
+        return np.bincount(self.rows, weights=self.values * x[self.cols], minlength=self.size)
+
+    def diagonal(self):
+        on = self.rows == self.cols
+        return np.bincount(self.rows[on], weights=self.values[on], minlength=self.size)
+
+
+def _cg_solver(matrix):
+    diag = matrix.diagonal()
+    inv = np.where(diag > 0.0, 1.0 / np.where(diag > 0.0, diag, 1.0), 0.0)
+
+    def solve(b):
+        x = np.zeros_like(b)
+        r = b.copy()
+        z = inv * r
+        p = z.copy()
+        rz = r @ z
+        norm_b = np.linalg.norm(b)
+        if norm_b == 0.0:
+            return x
+        for _ in range(CG_MAX_ITERATIONS):
+            ap = matrix.dot(p)
+            pap = p @ ap
+            if pap <= 0.0:
+                raise UnstableStructure("刚度矩阵非正定")
+            alpha = rz / pap
+            x += alpha * p
+            r -= alpha * ap
+            if np.linalg.norm(r) <= CG_TOLERANCE * norm_b:
+                return x
+            z = inv * r
+            rz_new = r @ z
+            p = z + (rz_new / rz) * p
+            rz = rz_new
+        # 可变体系在荷载作用方向上无解，迭代不会收敛
+        raise UnstableStructure(f"共轭梯度 {CG_MAX_ITERATIONS} 次迭代未收敛")
+
+    return solve
+
+
+def _check_pivots(pivots, scale):
+    if len(pivots) and np.abs(pivots).min() <= PIVOT_TOLERANCE * scale:
+        raise UnstableStructure("刚度矩阵奇异")
+
+
+def factorize(model):
+    """装配约化后的刚度矩阵并分解（SciPy：稀疏 LU；否则：预条件共轭梯度）。
+
+    刚度矩阵奇异（支座不足、存在机构）时抛出 UnstableStructure，不做正则化。
+    """
+    lengths = _element_lengths(model)
+    k_global = _to_global(local_stiffness(lengths, model.section), model.rotation)
+    dofs = _element_dofs(model.elements)
+    mapping, size = _free_map(model)
+    rows = mapping[np.repeat(dofs[:, :, None], 12, axis=2)].ravel()
+    cols = mapping[np.repeat(dofs[:, None, :], 12, axis=1)].ravel()
+    values = k_global.ravel()
+
+    # 铰接支座的扭转弹簧：k·a·aᵀ 加在节点转动自由度上
+    extra_rows, extra_cols, extra_values = [], [], []
+    for node, axis, stiffness in model.springs:
+        block = stiffness * np.outer(axis, axis)
+        rot = node * DOF + 3 + np.arange(3)
+        extra_rows.append(np.repeat(mapping[rot], 3))
+        extra_cols.append(np.tile(mapping[rot], 3))
+        extra_values.append(block.ravel())
+    if extra_rows:
+        rows = np.concatenate([rows] + extra_rows)
+        cols = np.concatenate([cols] + extra_cols)
+        values = np.concatenate([values] + extra_values)
+    keep = (rows >= 0) & (cols >= 0)
+    rows, cols, values = rows[keep], cols[keep], values[keep]
+    model.solver = None
+    if size == 0:
+        return
+    scale = np.abs(np.bincount(rows[rows == cols], weights=values[rows == cols], minlength=size)).max()
+
+    if _sparse is not None:
+        matrix = _sparse.coo_matrix((values, (rows, cols)), shape=(size, size)).tocsc()
+        try:
+            lu = _sparse_linalg.splu(matrix)
+        except RuntimeError:  # "Factor is exactly singular"
+            raise UnstableStructure("刚度矩阵奇异")
+        _check_pivots(lu.U.diagonal(), scale)
+        model.solver = lu.solve
+    else:
+        matrix = _CooMatrix(rows, cols, values, size)
+        if size <= DENSE_CHECK_DOFS:
+            # 规模较小时直接检查特征值；大模型只能依赖共轭梯度是否收敛
+            dense = np.zeros((size, size))
+            np.add.at(dense, (rows, cols), values)
+            _check_pivots(np.linalg.eigvalsh(dense)[:1], scale)
+        model.solver = _cg_solver(matrix)
+    model.matrix = matrix
+
+
+# ---------------------------------------------------------------------------
+# 荷载与求解
+# ---------------------------------------------------------------------------
+
+def _fixed_end_forces(model, q):
+    """均布荷载的局部等效节点力（m×12）：端部剪力 qL/2、弯矩 qL²/12；另返回局部荷载分量（m×3）。"""
+    lengths = _element_lengths(model)
+    load = np.zeros((len(q), 3))
+    load[:, 2] = -q
+    local = np.einsum("eij,ej->ei", model.rotation, load)  # 局部分量
+    f = np.zeros((len(q), 12))
+    half = lengths / 2.0
+    m12 = lengths ** 2 / 12.0
+    f[:, 0:3] = local * half[:, None]
+    f[:, 6:9] = local * half[:, None]
+    f[:, 4] = -local[:, 2] * m12
+    f[:, 5] = local[:, 1] * m12
+    f[:, 10] = local[:, 2] * m12
+    f[:, 11] = -local[:, 1] * m12
+    return f, local
+
+
+# 单元内挠度的采样点（单元长度的比例）
+_SAMPLES = np.linspace(0.0, 1.0, 5)
+
+
+def _element_displacements(model, u_local, q_local):
+    """单元内采样点的整体位移幅值（m×采样数）：Hermite 插值 + 两端固接单元的均布荷载特解。"""
+    L = _element_lengths(model)[:, None]
+    xi = _SAMPLES[None, :]
+    n1 = 1.0 - 3.0 * xi ** 2 + 2.0 * xi ** 3
+    n2 = xi - 2.0 * xi ** 2 + xi ** 3
+    n3 = 3.0 * xi ** 2 - 2.0 * xi ** 3
+    n4 = -xi ** 2 + xi ** 3
+    ul = u_local[:, :, None]
+    axial = ul[:, 0] * (1.0 - xi) + ul[:, 6] * xi
+    v = n1 * ul[:, 1] + n2 * L * ul[:, 5] + n3 * ul[:, 7] + n4 * L * ul[:, 11]
+    # 绕局部 y 的转角 θy = -dw/dx
+    w = n1 * ul[:, 2] - n2 * L * ul[:, 4] + n3 * ul[:, 8] - n4 * L * ul[:, 10]
+    bubble = (L ** 4) * xi ** 2 * (1.0 - xi) ** 2 / 24.0
+    ei_z = ELASTIC_MODULUS * model.section[:, 2:3]
+    ei_y = ELASTIC_MODULUS * model.section[:, 1:2]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = v + np.nan_to_num(q_local[:, 1:2] * bubble / ei_z)
+        w = w + np.nan_to_num(q_local[:, 2:3] * bubble / ei_y)
+    local = np.stack((axial, v, w), axis=2)  # m×采样数×3
+    world = np.einsum("eji,esj->esi", model.rotation, local)
+    return np.linalg.norm(world, axis=2)
+
+
+def solve_model(model, q, point):
+    """求解已分解的模型。
+
+    q：每根型材的均布荷载（N/mm，世界 -Z）；point：每根型材的跨中集中力（N，世界 -Z）。
+    返回 (挠度 mm, 应力 N/mm², 利用率)，挠度为型材节点与单元内采样点的最大绝对位移（相对支座）。
+    """
+    n = len(model.member_length)
+    deflection = np.zeros(n)
+    stress = np.zeros(n)
+    if not len(model.elements) or model.solver is None:
+        return deflection, stress, np.zeros(n)
+
+    q = np.asarray(q, dtype=np.float64)
+    point = np.asarray(point, dtype=np.float64)
+    f_fixed, q_local = _fixed_end_forces(model, q[model.element_member])
+    f_global = np.einsum("eji,eaj->eai", model.rotation, f_fixed.reshape(-1, 4, 3)).reshape(-1, 12)
+    vector = np.zeros(len(model.nodes) * DOF)
+    np.add.at(vector, _element_dofs(model.elements).ravel(), f_global.ravel())
+    np.add.at(vector, model.member_mid * DOF + 2, -point)
+
+    mapping, _ = _free_map(model)
+    free = mapping >= 0
+    u = np.zeros(len(vector))
+    u[free] = model.solver(vector[free])
+    u = u.reshape(-1, DOF)
+
+    u_e = u[model.elements].reshape(-1, 4, 3)
+    u_local = np.einsum("eij,eaj->eai", model.rotation, u_e).reshape(-1, 12)
+    np.maximum.at(deflection, model.element_member, _element_displacements(model, u_local, q_local).max(axis=1))
+
+    # 单元端部内力：f = K_local · T · u_e − 固端力
+    k_local = local_stiffness(_element_lengths(model), model.section)
+    forces = np.einsum("eij,ej->ei", k_local, u_local) - f_fixed
+    a, wy, wz = model.section[:, 0], model.section[:, 4], model.section[:, 5]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sigma = np.maximum(
+            np.abs(forces[:, 0]) / a + np.abs(forces[:, 4]) / wy + np.abs(forces[:, 5]) / wz,
+            np.abs(forces[:, 6]) / a + np.abs(forces[:, 10]) / wy + np.abs(forces[:, 11]) / wz,
+        )
+    sigma = np.nan_to_num(sigma, nan=0.0, posinf=0.0)
+    np.maximum.at(stress, model.element_member, sigma)
+
+    allowed = np.where(model.member_length > 0.0, model.member_length / DEFLECTION_LIMIT, 1.0)
+    utilization = np.maximum(stress / ALLOWABLE_STRESS, deflection / allowed)
+    inactive = ~model.active[model.member_mid]
+    deflection[inactive] = 0.0
+    stress[inactive] = 0.0
+    utilization[inactive] = 0.0
+    return deflection, stress, utilization
+
+
+class FrameResult:
+    """一次求解的结果：逐根型材的挠度（mm）与利用率，按成员存储的行排列。"""
+
+    def __init__(self, names, deflection, utilization, stress, unsupported, elapsed, reused, solver):
+        self.names = names
+        self.deflection = deflection
+        self.utilization = utilization
+        self.stress = stress
+        self.unsupported = unsupported
+        self.elapsed = elapsed
+        self.reused = reused
+        self.solver = solver
+
+    @property
+    def max_deflection(self):
+        return float(self.deflection.max(initial=0.0))
+
+    @property
+    def max_utilization(self):
+        return float(self.utilization.max(initial=0.0))
+
+    def worst(self, count=10):
+        order = np.argsort(-self.utilization)[:count]
+        return [(self.names[i], float(self.utilization[i]), float(self.deflection[i])) for i in order]
+
+
+_model = FrameModel()
+# 最近一次求解结果（面板显示、清除着色用）
+last_result = None
+
+
+def read_table(scene, prop):
+    """场景 ID 属性中的 {名称: 列表}。"""
+    data = scene.get(prop)
+    if data is None:
+        return {}
+    return {name: list(value) for name, value in data.items()}
+
+
+def solve(store, supports, loads, self_weight=True, joints=None):
+    """求解并返回 FrameResult；结构未变时复用上一次的模型与分解结果。
+
+    joints：连接图给出的端点连接（connections.ConnectionIndex.fem_joints），缺省时按端点检测。
+    结构不稳定（支座不足、存在机构）时抛出 UnstableStructure。
+    """
+    global _model
+
+    t0 = time.perf_counter()
+    key = structure_key(store, supports)
+    reused = _model.key == key and _model.solver is not None
+    if not reused:
+        model = build_model(store, supports, joints)
+        if len(model.elements):
+            factorize(model)
+        # 分解失败时不缓存，下次重新建模
+        model.key = key
+        _model = model
+    model = _model
+
+    n = len(store)
+    q = np.zeros(n)
+    point = np.zeros(n)
+    for name, (dist, p) in loads.items():
+        row = store.row(name)
+        if row is not None:
+            q[row] += float(dist) / 1000.0
+            point[row] += float(p)
+    if self_weight and len(store.types):
+        from .mass import linear_mass_table
+
+        q += linear_mass_table(store)[store.view()[0]] * GRAVITY / 1000.0
+    deflection, stress, utilization = solve_model(model, q, point)
+    unsupported = int(np.count_nonzero(~model.active[model.member_mid])) if len(model.elements) else 0
+    solver = ("SciPy" if _sparse is not None else "NumPy CG") if model.solver is not None else ""
+    return FrameResult(list(store.names), deflection, utilization, stress, unsupported,
+                       time.perf_counter() - t0, reused, solver)
+
+
+def utilization_color(value):
+    """利用率 → RGBA：0 绿、0.5 黄、≥1 红。"""
+    v = min(max(float(value), 0.0), 1.0)
+    if v < 0.5:
+        return (2.0 * v, 1.0, 0.0, 1.0)
+    return (1.0, 2.0 * (1.0 - v), 0.0, 1.0)
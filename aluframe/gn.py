@@ -1,39 +1,46 @@
 import bpy
 import bmesh
+import numpy as np
 
+from .section import item_outline
 
-def ensure_profile_node_group():
-    name = "AluFrame_ProfileGN"
-    if name in bpy.data.node_groups:
-        return bpy.data.node_groups[name]
 
-    ng = bpy.data.node_groups.new(name=name, type='GeometryNodeTree')
-    nodes = ng.nodes
-    links = ng.links
-    # 定义组接口：优先使用 4.x 的 interface API；在 3.5 退回到 inputs/outputs API
+PROFILE_INPUTS = ("Width", "Height", "SlotWidth", "WallThickness", "Length")
+
+
+def _define_profile_interface(ng):
+    """定义型材节点组接口（两种节点组共用，便于修饰器按同名输入设置参数）。
+
+    优先使用 4.x 的 interface API；在 3.5 退回到 inputs/outputs API。
+    """
     use_interface = hasattr(ng, "interface") and hasattr(ng.interface, "new_socket")
     if use_interface:
         iface = ng.interface
         iface.new_socket(name="Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
-        iface.new_socket(name="Width", in_out='INPUT', socket_type='NodeSocketFloat')
-        iface.new_socket(name="Height", in_out='INPUT', socket_type='NodeSocketFloat')
-        iface.new_socket(name="SlotWidth", in_out='INPUT', socket_type='NodeSocketFloat')
-        iface.new_socket(name="WallThickness", in_out='INPUT', socket_type='NodeSocketFloat')
-        iface.new_socket(name="Length", in_out='INPUT', socket_type='NodeSocketFloat')
+        for name in PROFILE_INPUTS:
+            iface.new_socket(name=name, in_out='INPUT', socket_type='NodeSocketFloat')
         iface.new_socket(name="Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
     else:
         # Blender 3.5：旧接口
         try:
             ng.inputs.new('NodeSocketGeometry', 'Geometry')
-            ng.inputs.new('NodeSocketFloat', 'Width')
-            ng.inputs.new('NodeSocketFloat', 'Height')
-            ng.inputs.new('NodeSocketFloat', 'SlotWidth')
-            ng.inputs.new('NodeSocketFloat', 'WallThickness')
-            ng.inputs.new('NodeSocketFloat', 'Length')
+            for name in PROFILE_INPUTS:
+                ng.inputs.new('NodeSocketFloat', name)
             ng.outputs.new('NodeSocketGeometry', 'Geometry')
         except Exception as e:
             print(f"[AluFrame] 旧接口定义失败：{e}")
 
+
+def ensure_profile_node_group():
+    name = "AluFrame_ProfileGN"
+    if name in bpy.data.node_groups:
+        return bpy.data.node_groups[name]
+
+    ng = bpy.data.node_groups.new(name=name, type='GeometryNodeTree')
+    nodes = ng.nodes
+    links = ng.links
+    _define_profile_interface(ng)
+
     inp = nodes.new("NodeGroupInput"); inp.location = (-800, 0)
     out = nodes.new("NodeGroupOutput"); out.location = (450, 0)
 
@@ -180,38 +187,501 @@ def ensure_profile_node_group():
     return ng
 
 
-def add_profile_object(context, item, location=(0.0, 0.0, 0.0)):
-    """创建并链接一个带槽的型材网格（Mesh布尔差集构造，避免GN兼容问题）。
-    若布尔失败，将回退为实心立方体。
+def _math(ng, operation, a, b=None, location=(0, 0)):
+    """新建数学节点并连接输入：a / b 可以是输出插槽或常数。返回结果插槽。"""
+    node = ng.nodes.new("ShaderNodeMath")
+    node.operation = operation
+    node.location = location
+    for sock, value in zip(node.inputs, (a, b)):
+        if value is None:
+            continue
+        if isinstance(value, (int, float)):
+            sock.default_value = float(value)
+        else:
+            ng.links.new(value, sock)
+    return node.outputs[0]
+
+
+def _set_socket(node, name, value):
+    """按名称设置节点输入的默认值（不同版本缺少该输入时忽略）。"""
+    sock = node.inputs.get(name)
+    if sock is not None:
+        sock.default_value = value
+    return sock
+
+
+def ensure_profile_sweep_node_group():
+    """截面扫掠节点组：带槽截面作为闭合曲线，用 Curve to Mesh 沿长度为 Length 的直线扫掠。
+
+    不含网格布尔，修改长度或截面参数时只需重新扫掠；与 ensure_profile_node_group 接口相同。
+    截面与 section.section_outline 一致：20 个点，每条边 5 个，由点序号直接算出坐标：
+    边 j = floor(i / 5)，边内序号 k = i - 5j，切向 (cos jπ/2, sin jπ/2)。
     """
-    # 1. 创建基体 Mesh（回退几何：实心立方体）
-    mesh = bpy.data.meshes.new(name=f"AluFrameMesh_{item.name}")
+    name = "AluFrame_ProfileSweepGN"
+    if name in bpy.data.node_groups:
+        return bpy.data.node_groups[name]
+
+    import math
+    from mathutils import Matrix
+
+    ng = bpy.data.node_groups.new(name=name, type='GeometryNodeTree')
+    nodes = ng.nodes
+    links = ng.links
+    _define_profile_interface(ng)
+
+    inp = nodes.new("NodeGroupInput"); inp.location = (-1600, 0)
+    out = nodes.new("NodeGroupOutput"); out.location = (600, 0)
+
+    # 半宽 / 半高 / 半槽宽 / 壁厚 / 半长（m），尺寸加最小值保护防止空几何
+    def half_m(name, factor=0.0005, x=-1400):
+        scaled = _math(ng, 'MULTIPLY', inp.outputs[name], factor, (x, 0))
+        return _math(ng, 'MAXIMUM', scaled, 0.00005, (x + 150, 0))
+
+    w2 = half_m("Width")
+    h2 = half_m("Height")
+    l2 = half_m("Length")
+    s2 = half_m("SlotWidth")
+    t = half_m("WallThickness", 0.001)
+    # 槽口不得超出截面（section_outline 在此情形退化为矩形，节点中改为夹紧）
+    limit = _math(ng, 'MULTIPLY', _math(ng, 'MINIMUM', w2, h2, (-1100, -200)), 0.9, (-950, -200))
+    s2 = _math(ng, 'MINIMUM', s2, limit, (-800, -150))
+    t = _math(ng, 'MINIMUM', t, limit, (-800, -250))
+
+    # 边序号 j、边内序号 k 及其分段选择（比较节点输出 0 / 1）
+    index = nodes.new("GeometryNodeInputIndex"); index.location = (-1400, -500)
+    i = index.outputs[0]
+    j = _math(ng, 'FLOOR', _math(ng, 'DIVIDE', i, 5.0, (-1250, -500)), None, (-1100, -500))
+    k = _math(ng, 'SUBTRACT', i, _math(ng, 'MULTIPLY', j, 5.0, (-950, -550)), (-800, -500))
+    pairs = _math(ng, 'FLOOR', _math(ng, 'MULTIPLY', j, 0.5, (-950, -650)), None, (-800, -650))
+    odd = _math(ng, 'SUBTRACT', j, _math(ng, 'MULTIPLY', pairs, 2.0, (-650, -650)), (-500, -650))
+    corner = _math(ng, 'LESS_THAN', k, 0.5, (-650, -450))
+    outer = _math(ng, 'GREATER_THAN', k, 2.5, (-650, -500))
+    inner = _math(ng, 'SUBTRACT', _math(ng, 'SUBTRACT', 1.0, corner, (-500, -450)), outer, (-350, -450))
+    in_slot = _math(ng, 'MULTIPLY', _math(ng, 'GREATER_THAN', k, 1.5, (-650, -550)),
+                    _math(ng, 'LESS_THAN', k, 3.5, (-650, -600)), (-500, -550))
+
+    # 沿边方向的半长 E 与到边的距离 D：偶数边为 (w2, h2)，奇数边为 (h2, w2)
+    diff = _math(ng, 'SUBTRACT', h2, w2, (-650, -100))
+    e = _math(ng, 'ADD', w2, _math(ng, 'MULTIPLY', odd, diff, (-500, -100)), (-350, -100))
+    d = _math(ng, 'SUBTRACT', h2, _math(ng, 'MULTIPLY', odd, diff, (-500, -150)), (-350, -150))
+
+    # 沿边坐标 p、法向坐标 q
+    p = _math(ng, 'ADD',
+              _math(ng, 'MULTIPLY', _math(ng, 'MULTIPLY', e, -1.0, (-200, -100)), corner, (-50, -100)),
+              _math(ng, 'MULTIPLY', s2, _math(ng, 'SUBTRACT', outer, inner, (-200, -400)), (-50, -400)),
+              (100, -250))
+    q = _math(ng, 'SUBTRACT', d, _math(ng, 'MULTIPLY', t, in_slot, (-200, -550)), (-50, -550))
+
+    angle = _math(ng, 'MULTIPLY', j, math.pi / 2.0, (-950, -750))
+    cos_a = _math(ng, 'COSINE', angle, None, (-800, -750))
+    sin_a = _math(ng, 'SINE', angle, None, (-800, -800))
+    x = _math(ng, 'ADD', _math(ng, 'MULTIPLY', p, cos_a, (250, -200)),
+              _math(ng, 'MULTIPLY', q, sin_a, (250, -250)), (400, -220))
+    y = _math(ng, 'SUBTRACT', _math(ng, 'MULTIPLY', p, sin_a, (250, -300)),
+              _math(ng, 'MULTIPLY', q, cos_a, (250, -350)), (400, -320))
+
+    # 截面曲线：20 个点的闭合圆，逐点改写位置
+    circle = nodes.new("GeometryNodeCurvePrimitiveCircle"); circle.location = (250, 100)
     try:
-        w2 = float(item.width) / 2000.0
-        h2 = float(item.height) / 2000.0
-        l2 = float(item.default_length) / 2000.0
-
-        verts = [
-            (-w2, -h2, -l2), (w2, -h2, -l2), (w2, h2, -l2), (-w2, h2, -l2),
-            (-w2, -h2, l2), (w2, -h2, l2), (w2, h2, l2), (-w2, h2, l2)
-        ]
-        faces = [
-            (0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1),
-            (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)
-        ]
-
-        mesh.from_pydata(verts, [], faces)
+        circle.mode = 'RADIUS'
+    except Exception:
+        pass
+    _set_socket(circle, "Resolution", 20)
+    position = nodes.new("ShaderNodeCombineXYZ"); position.location = (550, -250)
+    links.new(x, position.inputs[0])
+    links.new(y, position.inputs[1])
+    set_pos = nodes.new("GeometryNodeSetPosition"); set_pos.location = (700, 100)
+    links.new(circle.outputs[0], set_pos.inputs[0])
+    links.new(position.outputs[0], set_pos.inputs["Position"])
+
+    # 扫掠路径：沿 X 的直线，Z_UP 法线使截面坐标系确定（截面 X -> 世界 Y，截面 Y -> 世界 Z）
+    start = nodes.new("ShaderNodeCombineXYZ"); start.location = (250, 300)
+    links.new(_math(ng, 'MULTIPLY', l2, -1.0, (100, 300)), start.inputs[0])
+    end = nodes.new("ShaderNodeCombineXYZ"); end.location = (250, 400)
+    links.new(l2, end.inputs[0])
+    line = nodes.new("GeometryNodeCurvePrimitiveLine"); line.location = (400, 350)
+    links.new(start.outputs[0], line.inputs["Start"])
+    links.new(end.outputs[0], line.inputs["End"])
+    normal = nodes.new("GeometryNodeSetCurveNormal"); normal.location = (550, 350)
+    normal.mode = 'Z_UP'
+    links.new(line.outputs[0], normal.inputs[0])
+
+    sweep = nodes.new("GeometryNodeCurveToMesh"); sweep.location = (850, 250)
+    links.new(normal.outputs[0], sweep.inputs["Curve"])
+    links.new(set_pos.outputs[0], sweep.inputs["Profile Curve"])
+    _set_socket(sweep, "Fill Caps", True)
+
+    # 转到型材约定的局部坐标：长度沿 Z、宽度沿 X、高度沿 Y（X -> Z，Y -> X，Z -> Y）
+    orient = nodes.new("GeometryNodeTransform"); orient.location = (1000, 250)
+    links.new(sweep.outputs[0], orient.inputs[0])
+    _set_socket(orient, "Rotation", Matrix(((0, 1, 0), (0, 0, 1), (1, 0, 0))).to_euler())
+    links.new(orient.outputs[0], out.inputs[0])
+    out.location = (1150, 250)
+    return ng
+
+
+def node_tree_kind(context):
+    # 节点组类型见 data.register 中的 aluframe_node_tree
+    return getattr(context.scene, 'aluframe_node_tree', 'SWEEP')
+
+
+def ensure_node_group(kind='SWEEP'):
+    """按类型返回型材节点组：SWEEP 为截面扫掠，BOOLEAN 为立方体布尔差集。"""
+    if kind == 'BOOLEAN':
+        return ensure_profile_node_group()
+    return ensure_profile_sweep_node_group()
+
+
+def set_profile_inputs(modifier, item, length):
+    """按型材条目与长度设置节点修饰器的组输入（mm）。"""
+    group = modifier.node_group
+    values = (item.width, item.height, item.slot_width, item.wall_thickness, length)
+    for name, value in zip(PROFILE_INPUTS, values):
+        set_modifier_input(modifier, group, name, value)
+
+
+def set_modifier_input(modifier, group, name, value):
+    """按组输入名称设置节点修饰器的输入值。"""
+    # 优先按名称设置（Blender 4.x）
+    try:
+        modifier[name] = float(value)
+        return
+    except Exception:
+        pass
+    # 退回到按接口顺序映射 Input_N（Blender 3.x）
+    idx = None
+    try:
+        for i, sock in enumerate(getattr(group, 'inputs', [])):
+            if sock.name == name:
+                idx = i + 1  # Input_N 为 1 基
+                break
+    except Exception:
+        idx = None
+    if idx is not None:
+        try:
+            modifier[f"Input_{idx}"] = float(value)
+        except Exception:
+            pass
+
+
+def add_profile_modifier(obj, item, length, kind='SWEEP'):
+    """为对象添加型材节点修饰器并写入组输入，返回修饰器。"""
+    mod = obj.modifiers.new(name="AluFrameProfile", type='NODES')
+    mod.node_group = ensure_node_group(kind)
+    set_profile_inputs(mod, item, length)
+    return mod
+
+
+
+
+# ---------------------------------------------------------------------------
+# 共享网格缓存：相同型号 / 长度 / 截面参数的型材共用同一个已开槽的网格数据块，
+# 以“链接复制”的方式实例化，避免大型机架中成百上千份重复网格与布尔求值。
+# 缓存值只保存网格名称（不持有 RNA 引用，避免撤销/加载后失效），
+# 网格上写入 CACHE_KEY_PROP 作为校验与加载后重建索引的依据。
+# ---------------------------------------------------------------------------
+
+CACHE_KEY_PROP = "alu_cache_key"
+
+_mesh_cache = {}
+# 缓存索引按需建立：首次查找时扫描一次当前文件，文件加载后作废等下次使用
+_cache_loaded = False
+
+
+def geometry_mode(context):
+    # 几何后端见 data.register 中的 aluframe_geometry_mode
+    return getattr(context.scene, 'aluframe_geometry_mode', 'ANALYTIC')
+
+
+def mesh_cache_key(item, length=None, mode='ANALYTIC'):
+    """返回网格缓存键：(型材 ID, 长度, 宽, 高, 槽宽, 壁厚, 几何后端)，数值统一保留 3 位小数。"""
+    if length is None:
+        length = item.default_length
+    return (
+        str(item.uid),
+        round(float(length), 3),
+        round(float(item.width), 3),
+        round(float(item.height), 3),
+        round(float(item.slot_width), 3),
+        round(float(item.wall_thickness), 3),
+        str(mode),
+    )
+
+
+NODES_BASE_MESH = "AluFrameNodesBase"
+
+
+def nodes_base_mesh():
+    """节点后端共用的空网格：几何完全由节点修饰器生成。"""
+    mesh = bpy.data.meshes.get(NODES_BASE_MESH)
+    if mesh is None:
+        mesh = bpy.data.meshes.new(NODES_BASE_MESH)
+    return mesh
+
+
+def _key_to_str(key):
+    return "|".join(str(k) for k in key)
+
+
+def _ensure_cache():
+    if not _cache_loaded:
+        reset_mesh_cache()
+
+
+def _cached_mesh(key):
+    _ensure_cache()
+    name = _mesh_cache.get(key)
+    if name is None:
+        return None
+    mesh = bpy.data.meshes.get(name)
+    if mesh is None or mesh.get(CACHE_KEY_PROP) != _key_to_str(key):
+        # 网格已被删除或改名复用，作废该条目
+        _mesh_cache.pop(key, None)
+        return None
+    return mesh
+
+
+def mesh_key(mesh):
+    """读取网格上的缓存键；不是缓存网格（或标记无效）时返回 None。"""
+    key_str = mesh.get(CACHE_KEY_PROP)
+    if not key_str:
+        return None
+    parts = str(key_str).split("|")
+    if len(parts) != 7:
+        return None
+    try:
+        return (parts[0],) + tuple(float(p) for p in parts[1:6]) + (parts[6],)
+    except ValueError:
+        return None
+
+
+def cached_mesh(key):
+    """按缓存键查找已缓存的网格，无则返回 None。"""
+    return _cached_mesh(key)
+
+
+def adopt_mesh(mesh, key):
+    """把已有网格登记为 key 对应的缓存网格（如原位修改长度后的网格）。"""
+    _ensure_cache()
+    mesh[CACHE_KEY_PROP] = _key_to_str(key)
+    _mesh_cache[key] = mesh.name
+
+
+def reset_mesh_cache():
+    """清空缓存并按当前文件中带缓存标记的网格重建索引。"""
+    global _cache_loaded
+    _mesh_cache.clear()
+    _cache_loaded = True
+    for mesh in bpy.data.meshes:
+        key = mesh_key(mesh)
+        if key is not None:
+            _mesh_cache.setdefault(key, mesh.name)
+
+
+def invalidate_mesh_cache():
+    """作废缓存索引（文件加载后调用），下次查找时再按文件内容重建。"""
+    global _cache_loaded
+    _mesh_cache.clear()
+    _cache_loaded = False
+
+
+def release_unused_meshes():
+    """回收缓存中已无用户的网格（最后一个引用的型材被删除后调用），返回回收数量。"""
+    _ensure_cache()
+    removed = 0
+    for key, name in list(_mesh_cache.items()):
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None:
+            _mesh_cache.pop(key, None)
+            continue
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+            _mesh_cache.pop(key, None)
+            removed += 1
+    return removed
+
+
+def _new_body_mesh(name, w2, h2, l2):
+    """基体网格：以原点为中心的长方体（单位：米）。"""
+    mesh = bpy.data.meshes.new(name=name)
+    verts = [
+        (-w2, -h2, -l2), (w2, -h2, -l2), (w2, h2, -l2), (-w2, h2, -l2),
+        (-w2, -h2, l2), (w2, -h2, l2), (w2, h2, l2), (-w2, h2, l2)
+    ]
+    faces = [
+        (0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1),
+        (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)
+    ]
+    mesh.from_pydata(verts, [], faces)
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _new_slots_mesh(name, w2, h2, l2, slot_width, wall_thickness):
+    """槽口切割体网格：四侧各一个沿 Z 方向贯穿的长方体（单位：米）。"""
+    s = float(slot_width) / 1000.0
+    t = float(wall_thickness) / 1000.0
+    # 微缩以避免与基体共面
+    s *= 0.999
+    t *= 0.999
+
+    verts = []
+    faces = []
+
+    def add_box(cx, cy, sx, sy, sz):
+        base = len(verts)
+        vx = sx / 2.0; vy = sy / 2.0; vz = sz / 2.0
+        verts.extend([
+            (cx - vx, cy - vy, -vz), (cx + vx, cy - vy, -vz), (cx + vx, cy + vy, -vz), (cx - vx, cy + vy, -vz),
+            (cx - vx, cy - vy,  vz), (cx + vx, cy - vy,  vz), (cx + vx, cy + vy,  vz), (cx - vx, cy + vy,  vz),
+        ])
+        faces.extend([
+            (base+0, base+1, base+2, base+3), (base+4, base+7, base+6, base+5), (base+0, base+4, base+5, base+1),
+            (base+1, base+5, base+6, base+2), (base+2, base+6, base+7, base+3), (base+3, base+7, base+4, base+0),
+        ])
+
+    # 槽位置（沿 Z 方向贯穿）
+    add_box(+ (w2 - t/2.0), 0.0, s, t, 2.0*l2)  # 右侧槽
+    add_box(- (w2 - t/2.0), 0.0, s, t, 2.0*l2)  # 左侧槽
+    add_box(0.0, + (h2 - t/2.0), t, s, 2.0*l2)  # 上侧槽
+    add_box(0.0, - (h2 - t/2.0), t, s, 2.0*l2)  # 下侧槽
+
+    mesh = bpy.data.meshes.new(name=name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update(calc_edges=True)
+    return mesh
+
+
+def _add_groove_modifier(obj, slots_obj):
+    bool_mod = obj.modifiers.new(name="AluFrameGroove", type='BOOLEAN')
+    bool_mod.operation = 'DIFFERENCE'
+    bool_mod.object = slots_obj
+    try:
+        bool_mod.solver = 'EXACT'
+    except Exception:
+        pass
+    return bool_mod
+
+
+def _bake_grooved_mesh(item, length, name):
+    """对临时对象求值一次布尔差集，并将结果烘焙为独立网格。失败返回 None。
+
+    临时对象放在只含它们的临时场景中，只求值该场景自己的依赖图，不触发当前场景的整体求值。
+    """
+    w2 = float(item.width) / 2000.0
+    h2 = float(item.height) / 2000.0
+    l2 = float(length) / 2000.0
+
+    body = _new_body_mesh("_AluFrameBakeBody", w2, h2, l2)
+    slots = _new_slots_mesh("_AluFrameBakeSlots", w2, h2, l2, item.slot_width, item.wall_thickness)
+    tmp_body = bpy.data.objects.new("_AluFrameBakeBody", body)
+    tmp_slots = bpy.data.objects.new("_AluFrameBakeSlots", slots)
+    tmp_scene = bpy.data.scenes.new("_AluFrameBake")
+    baked = None
+    try:
+        coll = tmp_scene.collection
+        coll.objects.link(tmp_body)
+        coll.objects.link(tmp_slots)
+        _add_groove_modifier(tmp_body, tmp_slots)
+        depsgraph = tmp_scene.view_layers[0].depsgraph
+        depsgraph.update()
+        baked = bpy.data.meshes.new_from_object(tmp_body.evaluated_get(depsgraph))
+        baked.name = name
+    except Exception as e:
+        print(f"[AluFrame] 布尔槽烘焙失败：{e}")
+        baked = None
+    finally:
+        # 先删场景（连同其依赖图），再删临时对象与网格
+        bpy.data.scenes.remove(tmp_scene)
+        bpy.data.objects.remove(tmp_body)
+        bpy.data.objects.remove(tmp_slots)
+        bpy.data.meshes.remove(body)
+        bpy.data.meshes.remove(slots)
+
+    if baked is not None and len(baked.polygons) == 0:
+        bpy.data.meshes.remove(baked)
+        baked = None
+    return baked
+
+
+def build_analytic_mesh(name, item, length):
+    """由截面轮廓沿 Z 拉伸生成带槽网格（NumPy + foreach_set，一次性写入）。
+
+    顶点：底面轮廓 n 个 + 顶面轮廓 n 个；面：两个 n 边形端面 + n 个侧面四边形。
+    失败返回 None。
+    """
+    outline = np.asarray(item_outline(item), dtype=np.float64) / 1000.0
+    n = len(outline)
+    if n < 3:
+        return None
+    l2 = float(length) / 2000.0
+
+    co = np.empty((2 * n, 3), dtype=np.float32)
+    co[:n, :2] = outline
+    co[:n, 2] = -l2
+    co[n:, :2] = outline
+    co[n:, 2] = l2
+
+    ring = np.arange(n, dtype=np.int32)
+    nxt = np.roll(ring, -1)
+    # 轮廓为逆时针：底面反向（法线 -Z），顶面正向（法线 +Z），侧面 (i, i+1, i+1', i') 法线朝外
+    sides = np.stack((ring, nxt, nxt + n, ring + n), axis=1)
+    loops = np.concatenate((ring[::-1], ring + n, sides.ravel()))
+    totals = np.concatenate(((n, n), np.full(n, 4))).astype(np.int32)
+    starts = np.concatenate(((0,), np.cumsum(totals)[:-1])).astype(np.int32)
+
+    mesh = bpy.data.meshes.new(name=name)
+    try:
+        mesh.vertices.add(len(co))
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", loops)
+        mesh.polygons.add(len(totals))
+        mesh.polygons.foreach_set("loop_start", starts)
+        try:
+            # Blender 4.0 起 loop_total 由 loop_start 推导且只读
+            mesh.polygons.foreach_set("loop_total", totals)
+        except (AttributeError, TypeError, RuntimeError):
+            pass
         mesh.update(calc_edges=True)
     except Exception as e:
-        print(f"[AluFrame] CRITICAL: Fallback mesh creation failed: {e}")
+        print(f"[AluFrame] 解析截面网格构造失败：{e}")
         bpy.data.meshes.remove(mesh)
         return None
+    return mesh
+
+
+def cache_mesh_name(type_name, length):
+    """缓存网格的名称：AluFrameMesh_型号_长度。"""
+    return f"AluFrameMesh_{type_name}_{float(length):g}"
+
+
+def ensure_profile_mesh(context, item, length=None, mode=None):
+    """获取（必要时创建）缓存中的已开槽网格；失败或节点后端（无烘焙网格）返回 None。"""
+    if length is None:
+        length = float(item.default_length)
+    if mode is None:
+        mode = geometry_mode(context)
+    if mode == 'NODES':
+        return None
+    key = mesh_cache_key(item, length, mode)
+    mesh = _cached_mesh(key)
+    if mesh is not None:
+        return mesh
+
+    name = cache_mesh_name(item.name, length)
+    if mode == 'ANALYTIC':
+        mesh = build_analytic_mesh(name, item, length)
+    else:
+        mesh = _bake_grooved_mesh(item, length, name)
+    if mesh is None:
+        return None
+    mesh[CACHE_KEY_PROP] = _key_to_str(key)
+    _mesh_cache[key] = mesh.name
+    return mesh
 
-    # 2. 用创建好的 Mesh 创建 Object
-    obj = bpy.data.objects.new(name=f"AluProfile_{item.name}", object_data=mesh)
-    obj.location = location
 
-    # 3. 链接到场景并设为活动
+def _link_and_activate(context, obj):
     try:
         (context.collection or context.scene.collection).objects.link(obj)
         obj.select_set(True)
@@ -219,51 +689,100 @@ def add_profile_object(context, item, location=(0.0, 0.0, 0.0)):
     except Exception as e:
         print(f"[AluFrame] Linking object to scene failed: {e}")
         bpy.data.objects.remove(obj) # 清理失败的对象
-        return None
+        return False
+    return True
+
 
-    # 4. 添加自定义属性（后续用于手动添加 GN）
+def set_member_props(obj, item, length):
+    obj["alu_uid"] = item.uid
     obj["alu_type"] = item.name
     obj["standard"] = item.standard
     obj["series"] = item.series
-    obj["length"] = float(item.default_length)
+    obj["length"] = float(length)
+
+
+def add_profile_object(context, item, location=(0.0, 0.0, 0.0), length=None, matrix=None):
+    """创建并链接一个带槽的型材对象。
+
+    相同型号/长度/截面的型材共用缓存中的已开槽网格（链接复制），网格由场景的
+    几何后端（解析截面 / 布尔槽口）生成；节点后端改为逐对象的节点修饰器。若生成失败，则回退为
+    “实心立方体 + 布尔修饰器 + 槽辅助对象”的逐对象构造。
+    matrix：完整的世界变换（如吸附结果），给出时忽略 location。
+    """
+    if length is None:
+        length = float(item.default_length)
+
+    if geometry_mode(context) == 'NODES':
+        return _add_profile_object_nodes(context, item, location, length, matrix)
+
+    mesh = ensure_profile_mesh(context, item, length)
+    if mesh is None:
+        return _add_profile_object_boolean(context, item, location, length, matrix)
+
+    obj = bpy.data.objects.new(name=f"AluProfile_{item.name}", object_data=mesh)
+    if matrix is not None:
+        obj.matrix_world = matrix
+    else:
+        obj.location = location
+    if not _link_and_activate(context, obj):
+        return None
+    set_member_props(obj, item, length)
+    # 标记：网格已包含槽口，无需再添加几何节点
+    obj["alu_grooved_bmesh"] = True
+    return obj
+
+
+def _add_profile_object_nodes(context, item, location, length, matrix=None):
+    """节点后端：共享空网格 + 型材节点修饰器，长度与截面参数修改后即时重新求值。"""
+    obj = bpy.data.objects.new(name=f"AluProfile_{item.name}", object_data=nodes_base_mesh())
+    if matrix is not None:
+        obj.matrix_world = matrix
+    else:
+        obj.location = location
+    if not _link_and_activate(context, obj):
+        return None
+    set_member_props(obj, item, length)
+    add_profile_modifier(obj, item, length, node_tree_kind(context))
+    # 标记：槽口由节点修饰器生成，无需再添加几何节点
+    obj["alu_grooved_bmesh"] = True
+    return obj
+
 
-    # 5. 构造槽几何并添加布尔修饰器（Mesh级布尔，更稳健）
+def _add_profile_object_boolean(context, item, location, length, matrix=None):
+    """逐对象构造：实心立方体 + 布尔修饰器（运行时 EXACT 求值）。
+    若布尔失败，将回退为实心立方体。
+    """
+    w2 = float(item.width) / 2000.0
+    h2 = float(item.height) / 2000.0
+    l2 = float(length) / 2000.0
+
+    # 1. 创建基体 Mesh（回退几何：实心立方体）
     try:
-        s = float(item.slot_width) / 1000.0
-        t = float(item.wall_thickness) / 1000.0
-        L = float(item.default_length) / 1000.0
-
-        # 微缩以避免与基体共面
-        s *= 0.999
-        t *= 0.999
-
-        slots_mesh = bpy.data.meshes.new(name=f"AluFrameSlots_{item.name}")
-        verts = []
-        faces = []
-
-        def add_box(cx, cy, sx, sy, sz):
-            base = len(verts)
-            vx = sx / 2.0; vy = sy / 2.0; vz = sz / 2.0
-            verts.extend([
-                (cx - vx, cy - vy, -vz), (cx + vx, cy - vy, -vz), (cx + vx, cy + vy, -vz), (cx - vx, cy + vy, -vz),
-                (cx - vx, cy - vy,  vz), (cx + vx, cy - vy,  vz), (cx + vx, cy + vy,  vz), (cx - vx, cy + vy,  vz),
-            ])
-            faces.extend([
-                (base+0, base+1, base+2, base+3), (base+4, base+7, base+6, base+5), (base+0, base+4, base+5, base+1),
-                (base+1, base+5, base+6, base+2), (base+2, base+6, base+7, base+3), (base+3, base+7, base+4, base+0),
-            ])
-
-        # 槽位置（沿 Z 方向贯穿）
-        add_box(+ (w2 - t/2.0), 0.0, s, t, 2.0*l2)  # 右侧槽
-        add_box(- (w2 - t/2.0), 0.0, s, t, 2.0*l2)  # 左侧槽
-        add_box(0.0, + (h2 - t/2.0), t, s, 2.0*l2)  # 上侧槽
-        add_box(0.0, - (h2 - t/2.0), t, s, 2.0*l2)  # 下侧槽
-
-        slots_mesh.from_pydata(verts, [], faces)
-        slots_mesh.update(calc_edges=True)
+        mesh = _new_body_mesh(f"AluFrameMesh_{item.name}", w2, h2, l2)
+    except Exception as e:
+        print(f"[AluFrame] CRITICAL: Fallback mesh creation failed: {e}")
+        return None
+
+    # 2. 用创建好的 Mesh 创建 Object，链接到场景并设为活动
+    obj = bpy.data.objects.new(name=f"AluProfile_{item.name}", object_data=mesh)
+    if matrix is not None:
+        obj.matrix_world = matrix
+    else:
+        obj.location = location
+    if not _link_and_activate(context, obj):
+        return None
+
+    # 3. 添加自定义属性（后续用于手动添加 GN）
+    set_member_props(obj, item, length)
 
+    # 4. 构造槽几何并添加布尔修饰器（Mesh级布尔，更稳健）
+    try:
+        slots_mesh = _new_slots_mesh(f"AluFrameSlots_{item.name}", w2, h2, l2, item.slot_width, item.wall_thickness)
         slots_obj = bpy.data.objects.new(name=f"AluSlots_{item.name}", object_data=slots_mesh)
-        slots_obj.location = location
+        if matrix is not None:
+            slots_obj.matrix_world = matrix
+        else:
+            slots_obj.location = location
         (context.collection or context.scene.collection).objects.link(slots_obj)
         # 使其不影响选择与视图杂乱
         try:
@@ -272,14 +791,7 @@ def add_profile_object(context, item, location=(0.0, 0.0, 0.0)):
         except Exception:
             pass
 
-        # 添加布尔修饰器
-        bool_mod = obj.modifiers.new(name="AluFrameGroove", type='BOOLEAN')
-        bool_mod.operation = 'DIFFERENCE'
-        bool_mod.object = slots_obj
-        try:
-            bool_mod.solver = 'EXACT'
-        except Exception:
-            pass
+        _add_groove_modifier(obj, slots_obj)
         # 标记：本对象已通过Mesh布尔生成槽
         obj["alu_grooved_bmesh"] = True
     except Exception as e:
@@ -287,4 +799,4 @@ def add_profile_object(context, item, location=(0.0, 0.0, 0.0)):
         # 失败时仅保留实心立方体
         obj["alu_grooved_bmesh"] = False
 
-    return obj
\ No newline at end of file
+    return obj
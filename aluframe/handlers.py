@@ -1,15 +1,239 @@
+import sys
+
 import bpy
+from bpy.app.handlers import persistent
+
+from .profiling import timed
 
 _handler_registered = False
 
+_SELECTABLE_TYPES = {'MESH', 'CURVE', 'EMPTY', 'ARMATURE'}
+
+# 合并窗口（秒）：窗口内的多次 depsgraph 更新只触发一次刷新
+_FLUSH_DELAY = 0.05
+
+_selection_dirty = False
+_flush_scheduled = False
+# 合并窗口内场景成员可能变化（场景 / 集合更新）：刷新时各索引与 scene.objects 比较，剔除离开场景的对象
+_membership_dirty = False
+# 合并窗口内发生变化（含纯变换）的对象（名称 -> 原始对象），刷新时交给成员存储与吸附空间索引
+_moved_objects = {}
+# 面板绘制时发现已失效、需要在计时器中重建的索引模块名称（见 request_rebuild）
+_rebuild_requested = set()
+
+
+def _has_selection(view_layer):
+    # any() 命中第一个即返回，不构造中间列表
+    return any(o.type in _SELECTABLE_TYPES for o in view_layer.objects.selected)
+
+
+@timed("handlers._flush")
+def _flush():
+    """计时器回调：合并后的一次刷新。
+
+    - 将窗口内变化的对象交给成员存储（及其 BOM 分组）做增量更新
+    - 将窗口内移动过的对象交给吸附空间索引做增量更新
+    - 场景成员有变化时，两者先剔除已删除 / 已移出场景的对象
+    - 重新计算选中标记，仅在值变化时写回场景属性
+    """
+    global _selection_dirty, _flush_scheduled, _membership_dirty
+    _flush_scheduled = False
+    membership = _membership_dirty
+    _membership_dirty = False
+    changed = False
+    try:
+        # 先于 _flush_spatial：两者读取同一份变化对象，由后者清空
+        changed |= _flush_store(membership)
+    except Exception as e:
+        print(f"[AluFrame] 成员存储更新失败：{e}")
+    try:
+        changed |= _flush_spatial(membership)
+    except Exception as e:
+        print(f"[AluFrame] 吸附 / 干涉 / 连接索引更新失败：{e}")
+    if changed:
+        # 刷新发生在计时器中，面板不会自动重绘
+        _tag_redraw()
+    try:
+        if _selection_dirty:
+            _selection_dirty = False
+            scene = bpy.context.scene
+            view_layer = getattr(bpy.context, 'view_layer', None) or scene.view_layers[0]
+            has_sel = _has_selection(view_layer)
+            # 写属性本身会再触发一次 depsgraph 更新，值未变化时不写
+            if scene.aluframe_has_selection != has_sel:
+                scene.aluframe_has_selection = has_sel
+    except Exception:
+        pass
+    return None
+
+
+@timed("handlers._flush_store")
+def _flush_store(membership):
+    from . import store
+
+    scene = bpy.context.scene
+    index = store.index
+    if not index.valid or index.scene_name != scene.name:
+        # 失效的存储不在计时器中整体重建：由面板 / 操作符首次读取（store.get_index）时重建，
+        # 打开文件后不立即扫描全部对象
+        return False
+    pruned = index.prune(scene) if membership else False
+    return index.update_objects(list(_moved_objects.values())) or pruned
+
+
+@timed("handlers._flush_spatial")
+def _flush_spatial(membership):
+    from . import interference, snapping
+
+    scene = bpy.context.scene
+    objects = list(_moved_objects.values())
+    _moved_objects.clear()
+    snap = snapping.index
+    if not snap.valid or snap.scene_name != scene.name:
+        # 同上：首次吸附 / 干涉检查时由 snapping.get_index 重建
+        return False
+    changed = snap.prune(scene) if membership else []
+    changed += snap.update_objects(objects)
+    if not changed:
+        return False
+    # 干涉 / 连接索引按需建立（面板 / 操作符首次读取时）；已建立且与吸附索引同代时只检测变化的型材
+    updated = False
+    if interference.index.generation == snap.generation:
+        updated |= interference.index.update(snap, changed)
+    connections = _loaded("connections")
+    if connections is not None and connections.index.generation == snap.generation:
+        updated |= connections.index.update(snap, changed)
+    return updated
+
+
+def _tag_redraw():
+    wm = getattr(bpy.context, 'window_manager', None)
+    if wm is None:
+        return
+    for win in wm.windows:
+        for area in win.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def request_rebuild(*names):
+    """登记需要重建的索引模块（"bom" / "store" / "connections" / "interference"）。
 
+    面板 draw 中不做全量重建：只读取已同步的索引（cached_index），失效时调用本函数，
+    由下一轮主循环中的计时器重建后重绘。
+    """
+    _rebuild_requested.update(names)
+    if _rebuild_requested and not bpy.app.timers.is_registered(_rebuild_indexes):
+        bpy.app.timers.register(_rebuild_indexes, first_interval=0.0)
+
+
+@timed("handlers._rebuild_indexes")
+def _rebuild_indexes():
+    import importlib
+
+    scene = bpy.context.scene
+    names = sorted(_rebuild_requested)
+    _rebuild_requested.clear()
+    for name in names:
+        try:
+            importlib.import_module(f"{__package__}.{name}").get_index(scene)
+        except Exception as e:
+            print(f"[AluFrame] 索引重建失败（{name}）：{e}")
+    _tag_redraw()
+    return None
+
+
+def _schedule_flush():
+    global _flush_scheduled
+    if _flush_scheduled:
+        return
+    _flush_scheduled = True
+    # persistent：加载文件时不丢弃已登记的刷新，否则调度标记会停留在 True
+    bpy.app.timers.register(_flush, first_interval=_FLUSH_DELAY, persistent=True)
+
+
+@persistent
+@timed("handlers._depsgraph_update")
 def _depsgraph_update(scene, depsgraph):
-    # 根据选中状态更新场景级标记，供右侧面板使用
+    # 热路径：变换拖拽等每帧都会触发，这里只扫描本次更新列表并登记脏标记，
+    # 实际处理合并到计时器中进行
+    global _selection_dirty, _membership_dirty
+    dirty = False
     try:
-        selected = [o for o in bpy.context.selected_objects if o.type in {'MESH', 'CURVE', 'EMPTY', 'ARMATURE'}]
-        scene.aluframe_has_selection = len(selected) > 0
+        for update in depsgraph.updates:
+            uid = update.id
+            if isinstance(uid, bpy.types.Scene):
+                # 选择变化、对象增删会以场景更新的形式出现
+                _selection_dirty = True
+                _membership_dirty = True
+                dirty = True
+            elif isinstance(uid, bpy.types.Collection):
+                # 对象链接到 / 移出集合
+                _membership_dirty = True
+                dirty = True
+            elif isinstance(uid, bpy.types.Object):
+                obj = uid.original
+                _moved_objects[obj.name] = obj
+                dirty = True
     except Exception:
         pass
+    if dirty:
+        _schedule_flush()
+
+
+@persistent
+def _load_post(*_args):
+    global _selection_dirty
+    # 新文件中的网格数据块与上一个文件无关：作废共享网格缓存，下次创建型材时按文件内容重建。
+    # 网格模块（及 NumPy）尚未导入时无需处理
+    gn = _loaded("gn")
+    if gn is not None:
+        gn.invalidate_mesh_cache()
+    # 新文件：成员存储 / 吸附索引作废（首次读取时重建），选中状态重新同步一次
+    _invalidate_indexes()
+    _selection_dirty = True
+    _schedule_flush()
+
+
+@persistent
+def _scene_setup(*_args):
+    # 新文件 / 启动文件：毫米单位与 AluFrame 工作台（已保存的文件不修改）
+    from . import workspace
+
+    try:
+        workspace.setup_new_file()
+    except Exception as e:
+        print(f"[AluFrame] 场景初始化失败：{e}")
+
+
+def _scene_setup_once():
+    # 插件在会话中途启用时不会收到 load_post：注册后在主循环中执行一次
+    _scene_setup()
+    return None
+
+
+def _loaded(name):
+    """已导入的本插件子模块；尚未导入时返回 None（不为此触发导入）。"""
+    return sys.modules.get(f"{__package__}.{name}")
+
+
+def _invalidate_indexes():
+    global _membership_dirty
+    from . import snapping
+
+    _membership_dirty = False
+    _moved_objects.clear()
+    snapping.index.invalidate()
+    store = _loaded("store")
+    if store is not None:
+        store.index.invalidate()
+
+
+@persistent
+def _undo_redo_post(*_args):
+    # 撤销/重做会整体替换数据块，增量索引无法跟踪，标记为需要重建
+    _invalidate_indexes()
+    _schedule_flush()
 
 
 def register():
@@ -23,14 +247,47 @@ def register():
     if _depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.append(_depsgraph_update)
         _handler_registered = True
+    if _load_post not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_load_post)
+    for handler_list in (bpy.app.handlers.load_post, bpy.app.handlers.load_factory_startup_post):
+        if _scene_setup not in handler_list:
+            handler_list.append(_scene_setup)
+    for handler_list in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _undo_redo_post not in handler_list:
+            handler_list.append(_undo_redo_post)
+    # 启动时注册发生在启动文件加载之前，随后的 load_post 会完成设置；这里的一次性计时器
+    # 只在会话中途启用插件时起作用（setup_new_file 可重复调用）
+    if not bpy.app.timers.is_registered(_scene_setup_once):
+        bpy.app.timers.register(_scene_setup_once, first_interval=0.0)
 
 
 def unregister():
-    global _handler_registered
+    global _handler_registered, _flush_scheduled, _membership_dirty
 
     if _handler_registered and _depsgraph_update in bpy.app.handlers.depsgraph_update_post:
         bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_update)
         _handler_registered = False
+    if _load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_load_post)
+    for handler_list in (bpy.app.handlers.load_post, bpy.app.handlers.load_factory_startup_post):
+        if _scene_setup in handler_list:
+            handler_list.remove(_scene_setup)
+    if bpy.app.timers.is_registered(_scene_setup_once):
+        bpy.app.timers.unregister(_scene_setup_once)
+    for handler_list in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _undo_redo_post in handler_list:
+            handler_list.remove(_undo_redo_post)
+    if bpy.app.timers.is_registered(_flush):
+        bpy.app.timers.unregister(_flush)
+    if bpy.app.timers.is_registered(_rebuild_indexes):
+        bpy.app.timers.unregister(_rebuild_indexes)
+    _rebuild_requested.clear()
+    jobs = _loaded("jobs")
+    if jobs is not None:
+        jobs.unregister()
+    _flush_scheduled = False
+    _membership_dirty = False
+    _moved_objects.clear()
 
     if hasattr(bpy.types.Scene, "aluframe_has_selection"):
-        del bpy.types.Scene.aluframe_has_selection
\ No newline at end of file
+        del bpy.types.Scene.aluframe_has_selection
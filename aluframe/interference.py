@@ -0,0 +1,238 @@
+"""型材干涉检测：宽相复用吸附索引的网格，窄相在真实截面矩形（定向包围盒）上计算。
+
+- 宽相：两根型材实体相交时，必然至少共享一个吸附网格格子（snapping.SnapIndex.neighbours）
+- 窄相：分离轴测试（15 轴）排除不相交的一对；相交时计算重叠体积占较小型材体积的比例，
+  超过 30% 记为干涉。截面坐标轴互相平行（同向、垂直交叉等常见情形）时按盒求交精确计算，
+  斜交时在较小型材内部均匀采样估算
+- 增量：只重新检测合并窗口内实际移动 / 增删的型材；吸附索引全量重建后本索引随之重建
+"""
+
+import math
+
+from .snapping import _add, _dot, _scale, _sub
+
+# 重叠体积 / 较小型材体积 超过该比例视为干涉
+OVERLAP_THRESHOLD = 0.30
+
+# 斜交时每个截面方向的采样数；长度方向按比例取，最多 MAX_SAMPLES_AXIAL
+_SAMPLES = 6
+_MAX_SAMPLES_AXIAL = 24
+
+_ALIGNED = 1.0 - 1e-6
+
+
+class _Box:
+    """定向包围盒：中心 c、单位轴 (x, y, z)、半尺寸 (w2, h2, l2)。"""
+
+    __slots__ = ("c", "axes", "half")
+
+    def __init__(self, member):
+        self.c = _scale(_add(member.p0, member.p1), 0.5)
+        self.axes = (member.x, member.y, member.axis)
+        self.half = (member.w2, member.h2, member.length / 2.0)
+
+    def volume(self):
+        return 8.0 * self.half[0] * self.half[1] * self.half[2]
+
+    def contains(self, p, eps):
+        d = _sub(p, self.c)
+        for axis, h in zip(self.axes, self.half):
+            if abs(_dot(d, axis)) > h - eps:
+                return False
+        return True
+
+
+def _separated(a, b):
+    """分离轴测试：存在分离轴返回 True（仅接触的一对重叠体积为 0，由比例阈值排除）。"""
+    r = [[_dot(ai, bj) for bj in b.axes] for ai in a.axes]
+    t = _sub(b.c, a.c)
+    ta = [_dot(t, ai) for ai in a.axes]
+    ea, eb = a.half, b.half
+    absr = [[abs(v) + 1e-9 for v in row] for row in r]
+
+    for i in range(3):
+        ra = ea[i]
+        rb = eb[0] * absr[i][0] + eb[1] * absr[i][1] + eb[2] * absr[i][2]
+        if abs(ta[i]) > ra + rb:
+            return True
+    for j in range(3):
+        ra = ea[0] * absr[0][j] + ea[1] * absr[1][j] + ea[2] * absr[2][j]
+        rb = eb[j]
+        if abs(ta[0] * r[0][j] + ta[1] * r[1][j] + ta[2] * r[2][j]) > ra + rb:
+            return True
+    for i in range(3):
+        i1, i2 = (i + 1) % 3, (i + 2) % 3
+        for j in range(3):
+            j1, j2 = (j + 1) % 3, (j + 2) % 3
+            ra = ea[i1] * absr[i2][j] + ea[i2] * absr[i1][j]
+            rb = eb[j1] * absr[i][j2] + eb[j2] * absr[i][j1]
+            if abs(ta[i2] * r[i1][j] - ta[i1] * r[i2][j]) > ra + rb:
+                return True
+    return False
+
+
+def _aligned_overlap(a, b):
+    """两盒坐标轴互相平行时的精确重叠体积；不平行返回 None。"""
+    r = [[_dot(ai, bj) for bj in b.axes] for ai in a.axes]
+    for j in range(3):
+        if max(abs(r[i][j]) for i in range(3)) < _ALIGNED:
+            return None
+    t = _sub(b.c, a.c)
+    volume = 1.0
+    for i in range(3):
+        ti = _dot(t, a.axes[i])
+        ebi = sum(abs(r[i][j]) * b.half[j] for j in range(3))
+        lo = max(-a.half[i], ti - ebi)
+        hi = min(a.half[i], ti + ebi)
+        if hi <= lo:
+            return 0.0
+        volume *= hi - lo
+    return volume
+
+
+def _sampled_ratio(small, big):
+    """斜交：在较小盒内部均匀取样，返回落在另一盒内的比例。"""
+    hx, hy, hz = small.half
+    ax, ay, az = small.axes
+    nz = max(2, min(_MAX_SAMPLES_AXIAL, int(math.ceil(hz / max(hx, hy, 1e-9))) * 2))
+    inside = 0
+    total = 0
+    for i in range(_SAMPLES):
+        u = ((i + 0.5) / _SAMPLES * 2.0 - 1.0) * hx
+        for j in range(_SAMPLES):
+            v = ((j + 0.5) / _SAMPLES * 2.0 - 1.0) * hy
+            base = _add(small.c, _add(_scale(ax, u), _scale(ay, v)))
+            for k in range(nz):
+                w = ((k + 0.5) / nz * 2.0 - 1.0) * hz
+                total += 1
+                if big.contains(_add(base, _scale(az, w)), 0.0):
+                    inside += 1
+    return inside / total
+
+
+def overlap_ratio(ma, mb):
+    """两根型材（SnapMember）重叠体积占较小者体积的比例；不相交返回 0。"""
+    a, b = _Box(ma), _Box(mb)
+    if _separated(a, b):
+        return 0.0
+    va, vb = a.volume(), b.volume()
+    smaller = min(va, vb)
+    if smaller <= 0.0:
+        return 0.0
+    exact = _aligned_overlap(a, b)
+    if exact is not None:
+        return exact / smaller
+    return _sampled_ratio(a, b) if va <= vb else _sampled_ratio(b, a)
+
+
+def _pair(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+class InterferenceIndex:
+    """干涉对索引：(名称 a, 名称 b) -> 重叠比例（仅记录超过阈值的对）。"""
+
+    def __init__(self, threshold=OVERLAP_THRESHOLD):
+        self.threshold = threshold
+        self.pairs = {}
+        self.by_member = {}
+        self.generation = None
+        self.version = 0
+        self._sorted = None
+
+    @property
+    def valid(self):
+        return self.generation is not None
+
+    def invalidate(self):
+        self.generation = None
+
+    def _touch(self):
+        self.version += 1
+        self._sorted = None
+
+    def _drop(self, name):
+        for other in self.by_member.pop(name, ()):
+            self.pairs.pop(_pair(name, other), None)
+            partners = self.by_member.get(other)
+            if partners is not None:
+                partners.discard(name)
+                if not partners:
+                    del self.by_member[other]
+
+    def _check(self, snap, name, skip=()):
+        m = snap.members.get(name)
+        if m is None:
+            return
+        members = snap.members
+        for other in snap.neighbours(name):
+            if other in skip:
+                continue
+            ratio = overlap_ratio(m, members[other])
+            if ratio > self.threshold:
+                self.pairs[_pair(name, other)] = ratio
+                self.by_member.setdefault(name, set()).add(other)
+                self.by_member.setdefault(other, set()).add(name)
+
+    def rebuild(self, snap):
+        """按吸附索引中的全部型材重建（每对只检测一次）。"""
+        self.pairs.clear()
+        self.by_member.clear()
+        done = set()
+        for name in snap.members:
+            self._check(snap, name, done)
+            done.add(name)
+        self.generation = snap.generation
+        self._touch()
+
+    def update(self, snap, names):
+        """只重新检测 names 中的型材（移动、新增或已删除）；吸附索引重建过则全量重建。"""
+        if self.generation != snap.generation:
+            self.rebuild(snap)
+            return True
+        if not names:
+            return False
+        names = set(names)
+        for name in names:
+            self._drop(name)
+        done = set()
+        for name in names:
+            self._check(snap, name, done)
+            done.add(name)
+        self._touch()
+        return True
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def sorted_pairs(self):
+        """按重叠比例从大到小排列的 [(a, b, 比例), ...]，版本未变时复用。"""
+        if self._sorted is None:
+            self._sorted = sorted(
+                ((a, b, r) for (a, b), r in self.pairs.items()),
+                key=lambda p: (-p[2], p[0], p[1]),
+            )
+        return self._sorted
+
+
+index = InterferenceIndex()
+
+
+def get_index(scene):
+    """返回与 scene 对应的干涉索引；吸附索引或本索引失效时先重建。"""
+    from . import snapping
+
+    snap = snapping.get_index(scene)
+    if index.generation != snap.generation:
+        index.rebuild(snap)
+    return index
+
+
+def cached_index(scene):
+    """已与吸附索引同代的干涉索引；任一失效时返回 None（不重建，供面板绘制使用）。"""
+    from . import snapping
+
+    snap = snapping.cached_index(scene)
+    if snap is None or index.generation != snap.generation:
+        return None
+    return index
@@ -0,0 +1,123 @@
+"""后台任务：耗时的序列化与写文件在工作线程中进行，界面保持可操作。
+
+- 调用方先在主线程取快照（只读复制型材数据，代价很小），再把纯 Python 的工作交给 submit()
+- 工作函数不得访问 bpy：通过 job.progress(done, total) 报告进度
+- 主线程用 bpy.app.timers 轮询（POLL_INTERVAL），在状态栏显示进度；结束后在主线程调用 on_done，
+  完成 / 失败信息在状态栏保留 DONE_MESSAGE_SECONDS 秒
+"""
+
+import threading
+import time
+
+import bpy
+
+POLL_INTERVAL = 0.2
+DONE_MESSAGE_SECONDS = 4.0
+
+
+class Job:
+    def __init__(self, label, on_done=None):
+        self.label = label
+        self.on_done = on_done
+        self.done = 0
+        self.total = 0
+        self.result = None
+        self.error = None
+        self.finished = False
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def progress(self, done, total=None):
+        """工作线程调用：只写普通属性，主线程轮询时读取。"""
+        self.done = done
+        if total is not None:
+            self.total = total
+
+    def status(self):
+        if self.total:
+            return f"{self.label}：{self.done}/{self.total}（{self.done / self.total:.0%}）"
+        return f"{self.label}：{self.done}"
+
+
+_jobs = []
+# (文本, 清除时间)：最近结束的任务信息
+_message = None
+
+
+def running(label=None):
+    """正在运行的任务（label 给定时只看同名任务）。"""
+    return [j for j in _jobs if not j.finished and (label is None or j.label == label)]
+
+
+def submit(label, fn, *args, on_done=None):
+    """在后台线程运行 fn(job, *args)，返回 Job；on_done(job) 在主线程调用。"""
+    job = Job(label, on_done)
+
+    def run():
+        try:
+            job.result = fn(job, *args)
+        except Exception as e:
+            job.error = e
+        job.elapsed = time.perf_counter() - job.started
+        job.finished = True
+
+    threading.Thread(target=run, name=f"AluFrame {label}", daemon=True).start()
+    _jobs.append(job)
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=POLL_INTERVAL, persistent=True)
+    return job
+
+
+def _set_status(text):
+    wm = getattr(bpy.context, 'window_manager', None)
+    if wm is None:
+        return
+    for win in wm.windows:
+        try:
+            win.workspace.status_text_set(text)
+        except Exception:
+            pass
+
+
+def _poll():
+    global _message
+    for job in [j for j in _jobs if j.finished]:
+        _jobs.remove(job)
+        if job.error is not None:
+            text = f"{job.label}失败：{job.error}"
+            print(f"[AluFrame] {text}")
+        else:
+            text = f"{job.label}完成（{job.elapsed:.1f}s）"
+            if job.on_done is not None:
+                try:
+                    extra = job.on_done(job)
+                    if extra:
+                        text = f"{text}：{extra}"
+                except Exception as e:
+                    text = f"{job.label}完成，但后续处理失败：{e}"
+            print(f"[AluFrame] {text}")
+        _message = (text, time.monotonic() + DONE_MESSAGE_SECONDS)
+
+    if _jobs:
+        _set_status("  |  ".join(job.status() for job in _jobs))
+        return POLL_INTERVAL
+    if _message is not None:
+        text, until = _message
+        if time.monotonic() < until:
+            _set_status(text)
+            return POLL_INTERVAL
+        _message = None
+    # 恢复默认状态栏
+    _set_status(None)
+    return None
+
+
+def unregister():
+    global _message
+    # 工作线程为守护线程，不等待；只停止轮询并恢复状态栏
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
+    if _jobs or _message is not None:
+        _set_status(None)
+    _jobs.clear()
+    _message = None
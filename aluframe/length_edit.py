@@ -0,0 +1,181 @@
+"""型材长度的原位修改：只改端面顶点的 Z 坐标（foreach_get / foreach_set），不重建几何。
+
+- 型材网格（解析截面、烘焙布尔、逐对象布尔的基体与槽切割体）的全部顶点都位于 z = ±L/2 两个端面上，
+  改长度即把 z 的符号保留、绝对值改为新的 L/2，一次向量化写回
+- 共享缓存网格：同一网格的全部使用者一起改时原位修改并重新登记缓存键；只改其中一部分时复制一份；
+  缓存中已有目标长度的网格则直接换用。1000 根同型号同长度的型材只改一份网格
+- 逐对象布尔构造：基体与 AluSlots_* 槽切割体在同一轮中修改，槽切割体随型材一起平移
+- 节点后端：只改修饰器的 Length 输入
+- anchor：START 固定 -Z 端（移动 +Z 端），END 固定 +Z 端，CENTER 两端对称
+"""
+
+import bpy
+import numpy as np
+
+from . import gn
+
+MIN_LENGTH = 10.0
+
+
+def is_member(obj):
+    """由本插件生成的型材对象（占位立方体、装配体除外）。"""
+    return obj.type == 'MESH' and "alu_uid" in obj and "length" in obj
+
+
+def set_mesh_length(mesh, length):
+    """把网格所有顶点的 z 改为 ±length/2（mm -> m），一次 foreach 读写。"""
+    l2 = float(length) / 2000.0
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    z = co[2::3]
+    z[:] = np.where(z >= 0.0, l2, -l2)
+    mesh.vertices.foreach_set("co", co)
+    mesh.update()
+
+
+def slot_helper(obj):
+    """逐对象布尔构造的槽切割体对象；没有则返回 None。"""
+    for mod in obj.modifiers:
+        if mod.type == 'BOOLEAN' and mod.object is not None and mod.object.name.startswith("AluSlots_"):
+            return mod.object
+    return None
+
+
+def profile_modifier(obj):
+    mod = obj.modifiers.get("AluFrameProfile")
+    return mod if mod is not None and mod.type == 'NODES' else None
+
+
+def shifted_matrix(matrix, old_length, new_length, anchor):
+    """按固定端返回平移后的世界矩阵：型材以中心为原点，固定一端时中心移动长度差的一半。"""
+    if anchor == 'CENTER':
+        return matrix.copy()
+    sign = 1.0 if anchor == 'START' else -1.0
+    axis = matrix.col[2].to_3d().normalized()
+    result = matrix.copy()
+    result.translation = matrix.translation + axis * (sign * (new_length - old_length) / 2000.0)
+    return result
+
+
+def _private_mesh(obj):
+    """确保对象的网格只有自己一个使用者（共享时复制一份），返回该网格。"""
+    mesh = obj.data
+    if mesh.users > 1:
+        mesh = mesh.copy()
+        obj.data = mesh
+    return mesh
+
+
+def apply_length(obj, length):
+    """只改几何（不改属性与位置）：拖拽时每帧调用。共享缓存网格须先经 DragState 变为独占。"""
+    mod = profile_modifier(obj)
+    if mod is not None:
+        gn.set_modifier_input(mod, mod.node_group, "Length", length)
+        obj.update_tag()
+        return
+    set_mesh_length(obj.data, length)
+    helper = slot_helper(obj)
+    if helper is not None:
+        set_mesh_length(helper.data, length)
+
+
+def _move(obj, matrix):
+    helper = slot_helper(obj)
+    obj.matrix_world = matrix
+    if helper is not None:
+        helper.matrix_world = matrix
+
+
+def _rekey(objects, mesh, length):
+    """共享缓存网格改长度：换用已有网格、原位修改或复制一份，并登记新缓存键。"""
+    key = gn.mesh_key(mesh)
+    new_key = key[:1] + (round(float(length), 3),) + key[2:]
+    target = gn.cached_mesh(new_key)
+    if target is None:
+        if mesh.users == len(objects):
+            target = mesh
+        else:
+            target = mesh.copy()
+        set_mesh_length(target, length)
+        # 名称随长度更新，与新建的缓存网格一致（被占用时 Blender 自动追加后缀）
+        target.name = gn.cache_mesh_name(objects[0].get("alu_type", ""), length)
+        gn.adopt_mesh(target, new_key)
+    for obj in objects:
+        obj.data = target
+    if mesh.users == 0 and mesh != target and gn.cached_mesh(key) != mesh:
+        # 拖拽时复制出的独占网格：已换用缓存网格后直接删除
+        bpy.data.meshes.remove(mesh)
+
+
+def set_lengths(objects, length, anchor='CENTER'):
+    """把 objects 中的型材统一改为 length（mm），返回实际修改的对象列表。"""
+    length = max(float(length), MIN_LENGTH)
+    shared = {}
+    changed = []
+    for obj in objects:
+        if not is_member(obj):
+            continue
+        old = float(obj["length"])
+        if abs(old - length) < 1e-6:
+            continue
+        if profile_modifier(obj) is None and gn.mesh_key(obj.data) is not None:
+            shared.setdefault(obj.data.name, []).append(obj)
+        else:
+            if profile_modifier(obj) is None:
+                _private_mesh(obj)
+                helper = slot_helper(obj)
+                if helper is not None:
+                    _private_mesh(helper)
+            apply_length(obj, length)
+        _move(obj, shifted_matrix(obj.matrix_world, old, length, anchor))
+        obj["length"] = length
+        changed.append(obj)
+
+    for name, group in shared.items():
+        _rekey(group, bpy.data.meshes[name], length)
+    if shared:
+        gn.release_unused_meshes()
+    return changed
+
+
+class DragState:
+    """一次拖拽的初始状态：取消时还原，确认时按最终长度重新登记缓存。"""
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.length = float(obj["length"])
+        self.matrix = obj.matrix_world.copy()
+        self.mesh = obj.data
+        self.cached = profile_modifier(obj) is None and gn.mesh_key(obj.data) is not None
+        if profile_modifier(obj) is None:
+            # 拖拽期间只改独占网格，不影响共用同一网格的其他型材
+            if self.cached:
+                obj.data = self.mesh.copy()
+            else:
+                _private_mesh(obj)
+            helper = slot_helper(obj)
+            if helper is not None:
+                _private_mesh(helper)
+
+    def update(self, length, anchor):
+        obj = self.obj
+        apply_length(obj, length)
+        _move(obj, shifted_matrix(self.matrix, self.length, length, anchor))
+        obj["length"] = float(length)
+
+    def finish(self):
+        obj = self.obj
+        if self.cached:
+            _rekey([obj], obj.data, float(obj["length"]))
+            gn.release_unused_meshes()
+
+    def cancel(self):
+        obj = self.obj
+        if self.cached:
+            private = obj.data
+            obj.data = self.mesh
+            bpy.data.meshes.remove(private)
+        else:
+            apply_length(obj, self.length)
+        _move(obj, self.matrix)
+        obj["length"] = self.length
@@ -0,0 +1,56 @@
+"""质量与成本：截面特性每种截面只算一次（section.section_properties 缓存），
+对整个装配只做数组运算（成员存储的型材表序号与长度），2 万根型材的合计在毫秒级完成。
+
+- 单重（kg/m）按型材表建一个小数组，逐根质量 = 单重[序号] × 长度 / 1000
+- 目录中找不到的型材单重记为 0
+- 合计结果按成员存储版本缓存，面板每次重绘不重复计算
+"""
+
+import numpy as np
+
+from .section import item_properties
+
+
+def type_properties(store):
+    """成员存储型材表对应的截面特性列表（目录中缺失的条目为 None）。"""
+    from .catalog import get_catalog
+
+    catalog = get_catalog()
+    result = []
+    for uid, _, _ in store.types:
+        item = catalog.get(uid)
+        result.append(item_properties(item) if item is not None else None)
+    return result
+
+
+def linear_mass_table(store):
+    """型材表序号 -> 单重（kg/m）的数组。"""
+    return np.array([p.linear_mass if p is not None else 0.0 for p in type_properties(store)],
+                    dtype=np.float64)
+
+
+def member_masses(store):
+    """逐根质量（kg），与 store.view() 的行一一对应。"""
+    profile, length, _, _ = store.view()
+    table = linear_mass_table(store)
+    if not len(table):
+        return np.zeros(len(profile))
+    return table[profile] * (length / 1000.0)
+
+
+_total_cache = {"key": None, "value": None}
+
+
+def total_mass(store):
+    """总质量（kg），按 (存储对象, 版本, 型材表长度, 行数) 缓存。"""
+    key = (id(store), store.version, len(store.types), len(store))
+    if _total_cache["key"] != key:
+        _total_cache["value"] = float(member_masses(store).sum())
+        _total_cache["key"] = key
+    return _total_cache["value"]
+
+
+def type_mass_by_key(store):
+    """{(型号, 标准): 单重 kg/m}：供只有 BOM 键（无型材 ID）的逐根行查询。"""
+    table = linear_mass_table(store)
+    return {entry[1:]: float(table[i]) for i, entry in enumerate(store.types)}
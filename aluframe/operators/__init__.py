@@ -8,6 +8,35 @@ from .core import (
 from .profile_add import (
     ALUFRAME_OT_add_selected_profile,
     ALUFRAME_OT_drag_add_profile,
+    ALUFRAME_OT_add_profiles_batch,
+)
+from .interference import (
+    ALUFRAME_OT_check_interference,
+    ALUFRAME_OT_select_interference_pair,
+)
+from .cutlist import ALUFRAME_OT_optimize_cutlist
+from .assembly import (
+    ALUFRAME_OT_pack_assembly,
+    ALUFRAME_OT_unpack_assembly,
+)
+from .length_edit import (
+    ALUFRAME_OT_set_length,
+    ALUFRAME_OT_drag_length,
+)
+from .diagnostics import (
+    ALUFRAME_OT_refresh_diagnostics,
+    ALUFRAME_OT_export_trace,
+    ALUFRAME_OT_reset_profiling,
+)
+from .exchange import (
+    ALUFRAME_OT_export_aluframe,
+    ALUFRAME_OT_import_aluframe,
+)
+from .fem import (
+    ALUFRAME_OT_fem_set_support,
+    ALUFRAME_OT_fem_set_load,
+    ALUFRAME_OT_fem_solve,
+    ALUFRAME_OT_fem_clear,
 )
 
 
@@ -17,6 +46,23 @@ classes = (
     ALUFRAME_OT_export_bom,
     ALUFRAME_OT_add_selected_profile,
     ALUFRAME_OT_drag_add_profile,
+    ALUFRAME_OT_add_profiles_batch,
+    ALUFRAME_OT_check_interference,
+    ALUFRAME_OT_select_interference_pair,
+    ALUFRAME_OT_optimize_cutlist,
+    ALUFRAME_OT_pack_assembly,
+    ALUFRAME_OT_unpack_assembly,
+    ALUFRAME_OT_set_length,
+    ALUFRAME_OT_drag_length,
+    ALUFRAME_OT_refresh_diagnostics,
+    ALUFRAME_OT_export_trace,
+    ALUFRAME_OT_reset_profiling,
+    ALUFRAME_OT_export_aluframe,
+    ALUFRAME_OT_import_aluframe,
+    ALUFRAME_OT_fem_set_support,
+    ALUFRAME_OT_fem_set_load,
+    ALUFRAME_OT_fem_solve,
+    ALUFRAME_OT_fem_clear,
 )
 
 
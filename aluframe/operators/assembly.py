@@ -0,0 +1,74 @@
+import bpy
+from bpy.types import Operator
+
+from ..profiling import timed
+
+
+def _active_assembly(context):
+    from ..assembly import is_assembly
+
+    obj = context.active_object
+    return obj if obj is not None and is_assembly(obj) else None
+
+
+class ALUFRAME_OT_pack_assembly(Operator):
+    bl_idname = "aluframe.pack_assembly"
+    bl_label = "并入装配体"
+    bl_description = "把选中的型材并入单对象装配体（点 + 几何节点实例化）；活动对象为装配体时并入该装配体"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @timed()
+    def execute(self, context):
+        from ..assembly import pack, is_assembly
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        target = _active_assembly(context)
+        objects = [o for o in context.selected_objects if not is_assembly(o)]
+        if not objects:
+            self.report({'WARNING'}, "请选择要并入的型材")
+            return {'CANCELLED'}
+
+        assembly, packed, skipped = pack(context, objects, target)
+        if not packed:
+            self.report({'WARNING'}, "选中对象中没有可并入的型材")
+            return {'CANCELLED'}
+        assembly.select_set(True)
+        context.view_layer.objects.active = assembly
+        if skipped:
+            self.report({'WARNING'}, f"已并入 {packed} 根型材，跳过 {skipped} 个对象（非型材或目录中无此型材）")
+        else:
+            self.report({'INFO'}, f"已并入 {packed} 根型材，装配体共 {len(assembly.data.vertices)} 根")
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_unpack_assembly(Operator):
+    bl_idname = "aluframe.unpack_assembly"
+    bl_label = "拆分装配体"
+    bl_description = "把装配体中选中的点（编辑模式下选择）还原为独立型材对象"
+    bl_options = {"REGISTER", "UNDO"}
+
+    only_selected: bpy.props.BoolProperty(name="仅选中的点", default=True)
+
+    @classmethod
+    def poll(cls, context):
+        return _active_assembly(context) is not None
+
+    @timed()
+    def execute(self, context):
+        from ..assembly import unpack
+
+        assembly = _active_assembly(context)
+        # 编辑模式下的点选择需写回网格后才能读取
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        created = unpack(context, assembly, self.only_selected)
+        if not created:
+            self.report({'WARNING'}, "没有可拆分的点（请在编辑模式下选择）")
+            return {'CANCELLED'}
+        assembly.select_set(False)
+        for obj in created:
+            obj.select_set(True)
+        context.view_layer.objects.active = created[0]
+        self.report({'INFO'}, f"已拆分 {len(created)} 根型材")
+        return {'FINISHED'}
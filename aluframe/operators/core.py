@@ -1,4 +1,11 @@
 import bpy
+import functools
+import os
+
+from ..profiling import timed
+
+# 后台任务名称（同名任务同时只运行一个）
+BOM_JOB = "BOM 导出"
 
 
 class ALUFRAME_OT_new_profile(bpy.types.Operator):
@@ -15,6 +22,7 @@ class ALUFRAME_OT_new_profile(bpy.types.Operator):
         description="占位型材长度，后续将由几何节点精确生成",
     )
 
+    @timed()
     def execute(self, context):
         # 使用 20mm 边长立方体作为占位截面，并沿 X 方向按长度缩放
         bpy.ops.mesh.primitive_cube_add(size=0.02)
@@ -41,36 +49,121 @@ class ALUFRAME_OT_new_profile(bpy.types.Operator):
 class ALUFRAME_OT_delete_selected(bpy.types.Operator):
     bl_idname = "aluframe.delete_selected"
     bl_label = "删除选中"
-    bl_description = "删除当前选中的对象"
+    bl_description = "删除当前选中的对象（连同型材的槽辅助对象与不再使用的网格）"
     bl_options = {"REGISTER", "UNDO"}
 
+    @timed()
     def execute(self, context):
+        from ..deletion import delete_objects
+
         if not context.selected_objects:
             self.report({"WARNING"}, "无选中对象")
             return {"CANCELLED"}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         try:
-            bpy.ops.object.delete(use_global=False)
+            # 一次 batch_remove：选中对象、AluSlots_* 槽切割体与独占网格
+            count, helpers, meshes = delete_objects(context.selected_objects, context.scene)
         except Exception as e:
             self.report({"ERROR"}, f"删除失败：{e}")
             return {"CANCELLED"}
+        self.report({"INFO"}, f"已删除 {count} 个对象（辅助对象 {helpers} 个，网格 {meshes} 个）")
         return {"FINISHED"}
 
 
 class ALUFRAME_OT_export_bom(bpy.types.Operator):
     bl_idname = "aluframe.export_bom"
     bl_label = "导出 BOM"
-    bl_description = "占位：统计场景中含长度属性的对象数量与总长度"
+    bl_description = "导出铝型材 BOM 清单（Excel .xlsx / CSV）"
     bl_options = {"REGISTER"}
 
+    filepath: bpy.props.StringProperty(name="文件", subtype='FILE_PATH')
+    file_format: bpy.props.EnumProperty(
+        name="格式",
+        items=(
+            ('XLSX', 'Excel (.xlsx)', ''),
+            ('CSV', 'CSV (.csv)', ''),
+        ),
+        default='XLSX',
+    )
+    mode: bpy.props.EnumProperty(
+        name="内容",
+        items=(
+            ('SUMMARY', '汇总', '按型号/标准/长度汇总数量与总长度'),
+            ('MEMBERS', '逐根下料', '每根型材一行'),
+        ),
+        default='SUMMARY',
+    )
+
+    background: bpy.props.BoolProperty(
+        name="后台导出", default=True,
+        description="在后台线程中排序与写文件，导出期间可继续建模；进度显示在状态栏",
+    )
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend = bpy.data.filepath
+            base = os.path.splitext(os.path.basename(blend))[0] if blend else "AluFrame"
+            self.filepath = os.path.join(os.path.dirname(blend) or os.path.expanduser("~"), f"{base}_BOM.xlsx")
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    @timed()
     def execute(self, context):
-        count = 0
-        total_len = 0.0
-        for obj in context.scene.objects:
-            if "length" in obj:
-                count += 1
-                try:
-                    total_len += float(obj["length"])
-                except Exception:
-                    pass
-        self.report({"INFO"}, f"占位：已统计 {count} 根型材，总长度 {total_len:.1f} mm")
-        return {"FINISHED"}
\ No newline at end of file
+        from ..bom import snapshot_member_rows, SUMMARY_MASS_COLUMNS, MEMBER_MASS_COLUMNS
+        from ..bom_export import write_bom
+        from ..connections import HARDWARE_COLUMNS, KIND_LABELS, get_index as get_connections
+        from ..mass import total_mass, type_mass_by_key
+        from ..store import get_index as get_store
+
+        if not self.filepath:
+            self.report({"ERROR"}, "未指定导出路径")
+            return {"CANCELLED"}
+        ext = ".csv" if self.file_format == 'CSV' else ".xlsx"
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ext)
+
+        # 主线程只取快照：逐根模式复制 (名称, 键) 列表，汇总模式为成员存储上一次数组分组的结果。
+        # BOM 分组是成员存储的视图，两种模式与合计读的是同一份数据
+        store = get_store(context.scene)
+        index = store.bom
+        total_count, total_length = index.total_count, index.total_length
+        if self.mode == 'MEMBERS':
+            columns, snapshot = MEMBER_MASS_COLUMNS, index.snapshot()
+            make_rows = functools.partial(snapshot_member_rows, linear_mass=type_mass_by_key(store))
+        else:
+            columns, snapshot = SUMMARY_MASS_COLUMNS, list(store.summary_rows())
+            make_rows = iter
+        mass = total_mass(store)
+        price = getattr(context.scene, "aluframe_price_per_kg", 0.0)
+        overview = [("总质量(kg)", round(mass, 2)), ("估算成本", round(mass * price, 2))]
+        # 连接件：由连接图按连接类型与系列折算（只含独立型材，装配体中的点不参与连接检测）
+        joints = get_connections(context.scene)
+        overview += [(f"{KIND_LABELS[kind]}连接", n) for kind, n in sorted(joints.kind_counts().items())]
+        extra_tables = [(HARDWARE_COLUMNS, joints.hardware_rows())] if len(joints) else []
+        file_format = self.file_format
+
+        def work(job=None):
+            progress = None
+            if job is not None:
+                job.progress(0, len(snapshot))
+                progress = job.progress
+            return write_bom(path, file_format, columns, make_rows(snapshot), total_count, total_length,
+                             progress=progress, overview=overview, extra_tables=extra_tables)
+
+        if not self.background:
+            try:
+                work()
+            except Exception as e:
+                self.report({"ERROR"}, f"导出失败：{e}")
+                return {"CANCELLED"}
+            self.report({"INFO"}, f"导出成功，保存路径：{path}")
+            return {"FINISHED"}
+
+        from .. import jobs
+
+        if jobs.running(BOM_JOB):
+            self.report({"WARNING"}, "上一次 BOM 导出尚未完成")
+            return {"CANCELLED"}
+        jobs.submit(BOM_JOB, work, on_done=lambda job: f"{job.result} 行，{path}")
+        self.report({"INFO"}, f"BOM 正在后台导出（{len(snapshot)} 行），进度见状态栏")
+        return {"FINISHED"}
@@ -0,0 +1,110 @@
+import bpy
+import os
+import time
+from bpy.types import Operator
+
+from ..profiling import timed
+
+CUTLIST_JOB = "下料优化"
+
+
+class ALUFRAME_OT_optimize_cutlist(Operator):
+    bl_idname = "aluframe.optimize_cutlist"
+    bl_label = "下料优化"
+    bl_description = "按型材把 BOM 排到标准棒料上（考虑锯缝与最小余料），导出逐根棒料的下料方案"
+    bl_options = {"REGISTER"}
+
+    filepath: bpy.props.StringProperty(name="文件", subtype='FILE_PATH')
+    file_format: bpy.props.EnumProperty(
+        name="格式",
+        items=(
+            ('XLSX', 'Excel (.xlsx)', ''),
+            ('CSV', 'CSV (.csv)', ''),
+        ),
+        default='XLSX',
+    )
+    stock_length: bpy.props.FloatProperty(name="棒料长度 (mm)", default=6000.0, min=100.0)
+    kerf: bpy.props.FloatProperty(name="锯缝 (mm)", default=3.0, min=0.0, max=20.0)
+    min_offcut: bpy.props.FloatProperty(
+        name="最小余料 (mm)", default=100.0, min=0.0,
+        description="短于该长度的余料按废料计入损耗",
+    )
+    time_budget: bpy.props.FloatProperty(
+        name="时限 (s)", default=2.0, min=0.0, max=60.0,
+        description="每种型材改进阶段的求解时限；不同型材并行求解",
+    )
+    background: bpy.props.BoolProperty(
+        name="后台求解", default=True,
+        description="在后台线程中求解并写文件，期间可继续建模；进度显示在状态栏",
+    )
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend = bpy.data.filepath
+            base = os.path.splitext(os.path.basename(blend))[0] if blend else "AluFrame"
+            self.filepath = os.path.join(os.path.dirname(blend) or os.path.expanduser("~"), f"{base}_下料.xlsx")
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    @timed()
+    def execute(self, context):
+        from ..bom import standard_label
+        from ..cutlist import demand_from_store, optimize_many, write_cutlist
+        from ..store import get_index
+
+        if not self.filepath:
+            self.report({"ERROR"}, "未指定导出路径")
+            return {"CANCELLED"}
+        demand = demand_from_store(get_index(context.scene))
+        if not demand:
+            self.report({"WARNING"}, "场景中没有型材")
+            return {"CANCELLED"}
+
+        ext = ".csv" if self.file_format == 'CSV' else ".xlsx"
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ext)
+        options = dict(
+            stock_length=self.stock_length,
+            kerf=self.kerf,
+            min_offcut=self.min_offcut,
+            time_budget=self.time_budget,
+        )
+        file_format = self.file_format
+
+        def work(job=None):
+            # 需求表是主线程中取得的快照；求解与写文件不访问 bpy
+            t0 = time.perf_counter()
+            plans = optimize_many(demand, **options)
+            elapsed = time.perf_counter() - t0
+            if job is not None:
+                job.progress(1, 2)
+            write_cutlist(path, file_format, plans, label=standard_label)
+            return plans, elapsed
+
+        if not self.background:
+            try:
+                plans, elapsed = work()
+            except Exception as e:
+                self.report({"ERROR"}, f"导出失败：{e}")
+                return {"CANCELLED"}
+            self.report({"INFO"}, f"{_plan_summary(plans, elapsed)}，保存路径：{path}")
+            return {"FINISHED"}
+
+        from .. import jobs
+
+        if jobs.running(CUTLIST_JOB):
+            self.report({"WARNING"}, "上一次下料优化尚未完成")
+            return {"CANCELLED"}
+        jobs.submit(CUTLIST_JOB, work, on_done=lambda job: f"{_plan_summary(*job.result)}，{path}")
+        self.report({"INFO"}, "下料方案正在后台求解与导出，进度见状态栏")
+        return {"FINISHED"}
+
+
+def _plan_summary(plans, elapsed):
+    bars = sum(len(p.bars) for p in plans.values())
+    stock = sum(p.total_stock for p in plans.values())
+    waste = sum(p.waste_ratio * p.total_stock for p in plans.values()) / stock if stock else 0.0
+    text = f"下料方案：{bars} 根棒料，损耗 {waste:.1%}（用时 {elapsed:.2f} s）"
+    oversize = sum(len(p.oversize) for p in plans.values())
+    if oversize:
+        text += f"，{oversize} 根超过棒料长度未计入"
+    return text
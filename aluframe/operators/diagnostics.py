@@ -0,0 +1,71 @@
+import bpy
+import os
+from bpy.types import Operator
+
+
+def trace_counters(scene):
+    """Chrome trace 中附带的计数器：数据块数量与按集合的内存估算。"""
+    from .. import profiling
+
+    counters = {"datablocks": profiling.datablock_counts()}
+    for name, values in profiling.memory_estimate(scene).items():
+        counters[f"memory:{name}"] = values
+    return counters
+
+
+class ALUFRAME_OT_refresh_diagnostics(Operator):
+    bl_idname = "aluframe.refresh_diagnostics"
+    bl_label = "刷新统计"
+    bl_description = "重新统计数据块数量与按集合的内存估算（需遍历全部对象，面板只显示最近一次的结果）"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        from .. import profiling
+        from ..handlers import _tag_redraw
+
+        profiling.refresh_datablock_stats(context.scene)
+        _tag_redraw()
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_export_trace(Operator):
+    bl_idname = "aluframe.export_trace"
+    bl_label = "导出计时 Trace"
+    bl_description = "将性能计时环形缓冲区导出为 Chrome trace JSON（chrome://tracing 或 Perfetto 中打开）"
+    bl_options = {"REGISTER"}
+
+    filepath: bpy.props.StringProperty(name="文件", subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend = bpy.data.filepath
+            base = os.path.splitext(os.path.basename(blend))[0] if blend else "AluFrame"
+            self.filepath = os.path.join(os.path.dirname(blend) or os.path.expanduser("~"), f"{base}_trace.json")
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        from .. import profiling
+
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".json")
+        try:
+            count = profiling.write_chrome_trace(path, trace_counters(context.scene))
+        except Exception as e:
+            self.report({'ERROR'}, f"导出失败：{e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"已导出 {count} 个事件：{path}")
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_reset_profiling(Operator):
+    bl_idname = "aluframe.reset_profiling"
+    bl_label = "清空计时"
+    bl_description = "清空计时环形缓冲区与累计统计"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        from .. import profiling
+
+        profiling.reset()
+        return {'FINISHED'}
@@ -0,0 +1,89 @@
+import bpy
+import os
+import time
+from bpy.types import Operator
+
+from ..profiling import timed
+
+
+class ALUFRAME_OT_export_aluframe(Operator):
+    bl_idname = "aluframe.export_aluframe"
+    bl_label = "导出 AluFrame 装配 (.aluframe)"
+    bl_description = "把型材引用与逐根记录（型号、长度、变换）导出为紧凑的 .aluframe 文件，不含网格"
+    bl_options = {"REGISTER"}
+
+    filepath: bpy.props.StringProperty(name="文件", subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.aluframe", options={'HIDDEN'})
+    selected_only: bpy.props.BoolProperty(name="仅选中", default=False)
+    compress: bpy.props.BoolProperty(name="压缩", default=True, description="记录块经 zlib 压缩")
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            blend = bpy.data.filepath
+            base = os.path.splitext(os.path.basename(blend))[0] if blend else "AluFrame"
+            self.filepath = os.path.join(os.path.dirname(blend) or os.path.expanduser("~"), f"{base}.aluframe")
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    @timed()
+    def execute(self, context):
+        from ..exchange import export_file
+        from ..store import get_index
+
+        path = bpy.path.ensure_ext(bpy.path.abspath(self.filepath), ".aluframe")
+        names = None
+        if self.selected_only:
+            store = get_index(context.scene)
+            names = []
+            for obj in context.selected_objects:
+                # 装配体：导出其全部点
+                names.extend(store.owners.get(obj.name, (obj.name,)))
+        try:
+            count = export_file(path, context.scene, names, self.compress)
+        except Exception as e:
+            self.report({'ERROR'}, f"导出失败：{e}")
+            return {'CANCELLED'}
+        if not count:
+            self.report({'WARNING'}, "没有可导出的型材")
+            return {'CANCELLED'}
+        size = os.path.getsize(path)
+        self.report({'INFO'}, f"已导出 {count} 根型材（{size / 1024:.0f} KB）：{path}")
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_import_aluframe(Operator):
+    bl_idname = "aluframe.import_aluframe"
+    bl_label = "导入 AluFrame 装配 (.aluframe)"
+    bl_description = "读取 .aluframe 文件并批量创建型材（同截面同长度共用网格）"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filepath: bpy.props.StringProperty(name="文件", subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.aluframe", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    @timed()
+    def execute(self, context):
+        from ..exchange import FormatError, import_file
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        path = bpy.path.abspath(self.filepath)
+        t0 = time.perf_counter()
+        try:
+            created, skipped, missing = import_file(path, context)
+        except (OSError, FormatError) as e:
+            self.report({'ERROR'}, f"导入失败：{e}")
+            return {'CANCELLED'}
+        elapsed = time.perf_counter() - t0
+
+        if missing:
+            shown = "、".join(missing[:5]) + (" 等" if len(missing) > 5 else "")
+            self.report({'WARNING'}, f"目录中缺少 {len(missing)} 种型材：{shown}")
+        if not created:
+            self.report({'WARNING'}, "文件中没有可创建的型材")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"已导入 {len(created)} 根型材，跳过 {skipped} 条（{elapsed:.2f}s）")
+        return {'FINISHED'}
@@ -0,0 +1,202 @@
+import bpy
+from bpy.types import Operator
+
+from ..profiling import timed
+
+SUPPORT_ITEMS = [
+    ("PINNED", "铰接", "约束平动，允许转动"),
+    ("FIXED", "固接", "约束平动与转动"),
+    ("NONE", "清除", "删除支座"),
+]
+END_ITEMS = [
+    ("LOWER", "较低端", "世界 Z 坐标较低的一端（立柱底部）"),
+    ("START", "起点", "型材局部 -Z 端"),
+    ("END", "终点", "型材局部 +Z 端"),
+    ("BOTH", "两端", "两端都设支座"),
+]
+
+
+def _selected_members(context, store):
+    """选中对象对应的成员名称（装配体展开为其全部点）。"""
+    names = []
+    for obj in context.selected_objects:
+        for name in store.owners.get(obj.name, (obj.name,)):
+            if store.row(name) is not None:
+                names.append(name)
+    return names
+
+
+def _owner_of(store):
+    """装配体点名称 -> 装配体对象名称。"""
+    return {name: owner for owner, names in store.owners.items() for name in names}
+
+
+def _write_table(scene, prop, table):
+    if table:
+        scene[prop] = table
+    elif prop in scene:
+        del scene[prop]
+
+
+class ALUFRAME_OT_fem_set_support(Operator):
+    bl_idname = "aluframe.fem_set_support"
+    bl_label = "设置支座"
+    bl_description = "在选中型材的端部设置支座（结构计算用）"
+    bl_options = {"REGISTER", "UNDO"}
+
+    support: bpy.props.EnumProperty(name="类型", items=SUPPORT_ITEMS, default="PINNED")
+    end: bpy.props.EnumProperty(name="位置", items=END_ITEMS, default="LOWER")
+
+    @timed()
+    def execute(self, context):
+        from ..fem import SUPPORTS_PROP, read_table
+        from ..store import get_index
+
+        store = get_index(context.scene)
+        names = _selected_members(context, store)
+        if not names:
+            self.report({'WARNING'}, "请先选中型材")
+            return {'CANCELLED'}
+        start, end = store.endpoints()
+        table = read_table(context.scene, SUPPORTS_PROP)
+        kind = "" if self.support == "NONE" else self.support
+        for name in names:
+            row = store.row(name)
+            current = table.get(name, ["", ""])
+            if self.end == "LOWER":
+                ends = (0,) if start[row][2] <= end[row][2] else (1,)
+            else:
+                ends = {"START": (0,), "END": (1,), "BOTH": (0, 1)}[self.end]
+            for k in ends:
+                current[k] = kind
+            if any(current):
+                table[name] = current
+            else:
+                table.pop(name, None)
+        _write_table(context.scene, SUPPORTS_PROP, table)
+        self.report({'INFO'}, f"已为 {len(names)} 根型材设置支座，共 {len(table)} 根带支座")
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_fem_set_load(Operator):
+    bl_idname = "aluframe.fem_set_load"
+    bl_label = "设置荷载"
+    bl_description = "为选中型材设置竖向荷载（向下）：均布荷载与跨中集中力，均为 0 时清除"
+    bl_options = {"REGISTER", "UNDO"}
+
+    distributed: bpy.props.FloatProperty(name="均布荷载 (N/m)", default=0.0, min=0.0)
+    point: bpy.props.FloatProperty(name="跨中集中力 (N)", default=0.0, min=0.0)
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    @timed()
+    def execute(self, context):
+        from ..fem import LOADS_PROP, read_table
+        from ..store import get_index
+
+        store = get_index(context.scene)
+        names = _selected_members(context, store)
+        if not names:
+            self.report({'WARNING'}, "请先选中型材")
+            return {'CANCELLED'}
+        table = read_table(context.scene, LOADS_PROP)
+        for name in names:
+            if self.distributed > 0.0 or self.point > 0.0:
+                table[name] = [self.distributed, self.point]
+            else:
+                table.pop(name, None)
+        _write_table(context.scene, LOADS_PROP, table)
+        self.report({'INFO'}, f"已为 {len(names)} 根型材设置荷载，共 {len(table)} 根带荷载")
+        return {'FINISHED'}
+
+
+def _set_object_color_shading(context, color_type):
+    for area in context.screen.areas if context.screen else ():
+        if area.type != 'VIEW_3D':
+            continue
+        for space in area.spaces:
+            if space.type == 'VIEW_3D':
+                space.shading.color_type = color_type
+
+
+class ALUFRAME_OT_fem_solve(Operator):
+    bl_idname = "aluframe.fem_solve"
+    bl_label = "结构计算"
+    bl_description = "按支座与荷载求解框架的挠度和应力，并按利用率给型材着色（绿→黄→红）"
+    bl_options = {"REGISTER"}
+
+    self_weight: bpy.props.BoolProperty(name="计入自重", default=True)
+    color: bpy.props.BoolProperty(name="按利用率着色", default=True)
+
+    @timed()
+    def execute(self, context):
+        from .. import connections, fem
+        from ..store import get_index
+
+        scene = context.scene
+        store = get_index(scene)
+        supports = fem.read_table(scene, fem.SUPPORTS_PROP)
+        if not supports:
+            self.report({'WARNING'}, "没有支座：请先为型材设置支座")
+            return {'CANCELLED'}
+        loads = fem.read_table(scene, fem.LOADS_PROP)
+        joints = connections.get_index(scene).fem_joints(store)
+        try:
+            result = fem.solve(store, supports, loads, self.self_weight, joints)
+        except RuntimeError as e:
+            # 分解失败（结构为机构等）
+            self.report({'ERROR'}, f"求解失败：{e}")
+            return {'CANCELLED'}
+        fem.last_result = result
+
+        if self.color:
+            self._apply_colors(context, store, result)
+        if result.unsupported:
+            self.report({'WARNING'}, f"{result.unsupported} 根型材未与支座相连，未参与计算")
+        name = result.worst(1)[0][0] if result.names else ""
+        text = (f"最大挠度 {result.max_deflection:.2f} mm，最大利用率 {result.max_utilization:.0%}"
+                f"（{name}），{result.solver}{'（复用分解）' if result.reused else ''} {result.elapsed:.2f}s")
+        self.report({'WARNING'} if result.max_utilization > 1.0 else {'INFO'}, text)
+        return {'FINISHED'}
+
+    @staticmethod
+    def _apply_colors(context, store, result):
+        from ..fem import utilization_color
+
+        # 装配体取其各点的最大利用率
+        owner_of = _owner_of(store)
+        worst = {}
+        for name, value in zip(result.names, result.utilization.tolist()):
+            owner = owner_of.get(name, name)
+            worst[owner] = max(worst.get(owner, 0.0), value)
+        objects = bpy.data.objects
+        for name, value in worst.items():
+            obj = objects.get(name)
+            if obj is not None:
+                obj.color = utilization_color(value)
+        _set_object_color_shading(context, 'OBJECT')
+
+
+class ALUFRAME_OT_fem_clear(Operator):
+    bl_idname = "aluframe.fem_clear"
+    bl_label = "清除计算结果"
+    bl_description = "清除结构计算的着色与结果（支座与荷载保留）"
+    bl_options = {"REGISTER"}
+
+    @timed()
+    def execute(self, context):
+        from .. import fem
+        from ..store import get_index
+
+        result = fem.last_result
+        fem.last_result = None
+        if result is not None:
+            owner_of = _owner_of(get_index(context.scene))
+            objects = bpy.data.objects
+            for name in {owner_of.get(name, name) for name in result.names}:
+                obj = objects.get(name)
+                if obj is not None:
+                    obj.color = (1.0, 1.0, 1.0, 1.0)
+        _set_object_color_shading(context, 'MATERIAL')
+        return {'FINISHED'}
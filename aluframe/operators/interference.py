@@ -0,0 +1,63 @@
+import bpy
+from bpy.types import Operator
+
+from ..profiling import timed
+
+
+class ALUFRAME_OT_check_interference(Operator):
+    bl_idname = "aluframe.check_interference"
+    bl_label = "干涉检查"
+    bl_description = "重新检测全部型材的干涉（重叠超过 30% 视为干涉），并选中发生干涉的型材"
+    bl_options = {"REGISTER", "UNDO"}
+
+    select: bpy.props.BoolProperty(name="选中干涉型材", default=True)
+
+    @timed()
+    def execute(self, context):
+        from .. import interference, snapping
+
+        # 手动检查时从场景全量重建，不依赖增量状态
+        snapping.index.invalidate()
+        index = interference.get_index(context.scene)
+        if not index:
+            self.report({'INFO'}, "未发现模型干涉")
+            return {'FINISHED'}
+
+        if self.select:
+            objects = bpy.data.objects
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            active = None
+            for name in index.by_member:
+                obj = objects.get(name)
+                if obj is not None:
+                    obj.select_set(True)
+                    active = active or obj
+            if active is not None:
+                context.view_layer.objects.active = active
+        self.report({'WARNING'}, f"发现 {len(index)} 处模型干涉")
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_select_interference_pair(Operator):
+    bl_idname = "aluframe.select_interference_pair"
+    bl_label = "选中干涉型材"
+    bl_description = "选中发生干涉的两根型材"
+    bl_options = {"REGISTER", "UNDO"}
+
+    first: bpy.props.StringProperty(options={'HIDDEN'})
+    second: bpy.props.StringProperty(options={'HIDDEN'})
+
+    @timed()
+    def execute(self, context):
+        objects = bpy.data.objects
+        pair = [objects.get(self.first), objects.get(self.second)]
+        if None in pair:
+            self.report({'WARNING'}, "型材已不存在，请重新检查干涉")
+            return {'CANCELLED'}
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        for obj in pair:
+            obj.select_set(True)
+        context.view_layer.objects.active = pair[0]
+        return {'FINISHED'}
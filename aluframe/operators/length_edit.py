@@ -0,0 +1,167 @@
+import bpy
+from bpy.types import Operator
+from bpy_extras import view3d_utils
+
+from ..profiling import timed
+from .profile_add import view3d_under_mouse
+
+_ANCHOR_ITEMS = (
+    ('START', '固定起端', '固定 -Z 端，移动另一端'),
+    ('END', '固定末端', '固定 +Z 端，移动另一端'),
+    ('CENTER', '两端对称', '保持中心不动'),
+)
+
+
+def _active_member(context):
+    from ..length_edit import is_member
+
+    obj = context.active_object
+    return obj if obj is not None and is_member(obj) else None
+
+
+class ALUFRAME_OT_set_length(Operator):
+    bl_idname = "aluframe.set_length"
+    bl_label = "设置长度"
+    bl_description = "把选中型材统一改为指定长度（原位修改端面顶点，不重建几何）"
+    bl_options = {"REGISTER", "UNDO"}
+
+    length: bpy.props.FloatProperty(name="长度 (mm)", default=1000.0, min=10.0, max=20000.0)
+    anchor: bpy.props.EnumProperty(name="固定端", items=_ANCHOR_ITEMS, default='START')
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.selected_objects)
+
+    def invoke(self, context, event):
+        obj = _active_member(context)
+        if obj is not None:
+            self.length = float(obj["length"])
+        return context.window_manager.invoke_props_dialog(self)
+
+    @timed()
+    def execute(self, context):
+        from ..length_edit import set_lengths
+
+        changed = set_lengths(context.selected_objects, self.length, self.anchor)
+        if not changed:
+            self.report({'INFO'}, "选中型材的长度未变化")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"已将 {len(changed)} 根型材改为 {self.length:g} mm")
+        return {'FINISHED'}
+
+
+class ALUFRAME_OT_drag_length(Operator):
+    bl_idname = "aluframe.drag_length"
+    bl_label = "拖拽长度"
+    bl_description = "拖拽活动型材靠近鼠标的一端改变长度（Ctrl 按 10 mm 取整，可直接输入数值后回车）"
+    bl_options = {"REGISTER", "UNDO"}
+
+    _state = None
+    _anchor = 'START'
+    _fixed = None
+    _axis = None
+    _area = None
+    _typed = ""
+
+    def _set_header(self, text):
+        if self._area is not None:
+            self._area.header_text_set(text)
+
+    def _end_points(self, obj):
+        mw = obj.matrix_world
+        axis = mw.col[2].to_3d().normalized()
+        half = axis * (float(obj["length"]) / 2000.0)
+        return mw.translation - half, mw.translation + half, axis
+
+    def _length_from_mouse(self, context, event):
+        """鼠标射线与型材轴线的最近点到固定端的距离（mm）。"""
+        area, region, rv3d, coord = view3d_under_mouse(context, event)
+        if region is None or rv3d is None:
+            return None
+        self._area = self._area or area
+        origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
+        direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, coord).normalized()
+        a = self._axis
+        b = a.dot(direction)
+        denom = 1.0 - b * b
+        if denom < 1e-6:
+            # 沿轴线方向观察，无法确定位置
+            return None
+        w0 = self._fixed - origin
+        s = (b * direction.dot(w0) - a.dot(w0)) / denom
+        step = 10.0 if event.ctrl else 1.0
+        return max(round(s * 1000.0 / step) * step, step)
+
+    def _apply(self, length):
+        from ..length_edit import MIN_LENGTH
+
+        length = max(float(length), MIN_LENGTH)
+        self._state.update(length, self._anchor)
+        typed = f"（输入：{self._typed}）" if self._typed else ""
+        self._set_header(f"长度：{length:.0f}mm{typed}  左键 / 回车确认，右键 / Esc 取消")
+
+    def _finish(self, context):
+        self._set_header(None)
+        context.window.cursor_modal_restore()
+
+    @timed()
+    def modal(self, context, event):
+        if event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            self._state.cancel()
+            self._finish(context)
+            return {'CANCELLED'}
+        if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            return {'PASS_THROUGH'}
+        if event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS':
+            self._state.finish()
+            self._finish(context)
+            return {'FINISHED'}
+        if event.value == 'PRESS' and event.ascii and event.ascii in "0123456789.":
+            self._typed += event.ascii
+            try:
+                self._apply(float(self._typed))
+            except ValueError:
+                pass
+            return {'RUNNING_MODAL'}
+        if event.type == 'BACK_SPACE' and event.value == 'PRESS':
+            self._typed = self._typed[:-1]
+            if self._typed:
+                try:
+                    self._apply(float(self._typed))
+                except ValueError:
+                    pass
+            return {'RUNNING_MODAL'}
+        if event.type == 'MOUSEMOVE' and not self._typed:
+            length = self._length_from_mouse(context, event)
+            if length is not None:
+                self._apply(length)
+        return {'RUNNING_MODAL'}
+
+    def invoke(self, context, event):
+        from ..length_edit import DragState
+
+        obj = _active_member(context)
+        if obj is None:
+            self.report({'WARNING'}, "请先选中一根型材")
+            return {'CANCELLED'}
+
+        start, end, axis = self._end_points(obj)
+        # 移动离鼠标较近的一端（无 3D 视图时默认移动 +Z 端）
+        self._anchor = 'START'
+        area, region, rv3d, coord = view3d_under_mouse(context, event)
+        if region is not None and rv3d is not None:
+            p0 = view3d_utils.location_3d_to_region_2d(region, rv3d, start)
+            p1 = view3d_utils.location_3d_to_region_2d(region, rv3d, end)
+            if p0 is not None and p1 is not None:
+                mouse = type(p0)(coord)
+                if (p0 - mouse).length < (p1 - mouse).length:
+                    self._anchor = 'END'
+        self._area = area
+        self._fixed = end if self._anchor == 'END' else start
+        self._axis = -axis if self._anchor == 'END' else axis
+        self._typed = ""
+        self._state = DragState(obj)
+        self._set_header(f"长度：{float(obj['length']):.0f}mm  左键 / 回车确认，右键 / Esc 取消")
+        context.window.cursor_modal_set('SCROLL_XY')
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
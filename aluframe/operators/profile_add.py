@@ -1,8 +1,12 @@
 import bpy
+import json
+import time
 from bpy.types import Operator
 from bpy_extras import view3d_utils
 
-from ..gn import add_profile_object, ensure_profile_node_group
+from .. import snapping
+from ..data import active_profile
+from ..profiling import timed
 
 
 class ALUFRAME_OT_add_selected_profile(Operator):
@@ -31,13 +35,14 @@ class ALUFRAME_OT_add_selected_profile(Operator):
             pass
         return context.scene.cursor.location.copy()
 
+    @timed()
     def execute(self, context):
-        scene = context.scene
-        idx = scene.aluframe_profiles_index
-        if idx < 0 or idx >= len(scene.aluframe_profiles):
+        from ..gn import add_profile_object
+
+        item = active_profile(context)
+        if item is None:
             self.report({'WARNING'}, '请先选择型材')
             return {'CANCELLED'}
-        item = scene.aluframe_profiles[idx]
         location = self._compute_view_center_location(context, distance=1.0)
         
         # 步骤 1: 创建一个带回退网格的普通对象
@@ -48,215 +53,215 @@ class ALUFRAME_OT_add_selected_profile(Operator):
             return {'CANCELLED'}
 
         # 步骤 2: 若对象已通过Mesh布尔生成槽，则跳过GN；否则尝试添加几何节点
-        if getattr(obj, 'get', lambda k, d=None: None)('alu_grooved_bmesh', False):
-            self.report({'INFO'}, f"已添加型材：{item.name}（Mesh布尔构造）")
-            return {'FINISHED'}
-        try:
-            ng = ensure_profile_node_group()
-            mod = obj.modifiers.new(name="AluFrameProfile", type='NODES')
-            mod.node_group = ng
-
-            def _set_input(modifier, group, name, value):
-                # 优先按名称设置（Blender 4.x）
-                try:
-                    modifier[name] = float(value)
-                    return
-                except Exception:
-                    pass
-                # 退回到按接口顺序映射 Input_N（Blender 3.x）
-                idx = None
-                try:
-                    for i, sock in enumerate(getattr(group, 'inputs', [])):
-                        if sock.name == name:
-                            idx = i + 1  # Input_N 为 1 基
-                            break
-                except Exception:
-                    idx = None
-                if idx is not None:
-                    try:
-                        modifier[f"Input_{idx}"] = float(value)
-                    except Exception:
-                        pass
-
-            _set_input(mod, ng, "Width", item.width)
-            _set_input(mod, ng, "Height", item.height)
-            _set_input(mod, ng, "SlotWidth", item.slot_width)
-            _set_input(mod, ng, "WallThickness", item.wall_thickness)
-            _set_input(mod, ng, "Length", item.default_length)
-
-            # 评估几何节点输出是否为空，如为空则移除修饰器回退到立方体
-            try:
-                depsgraph = context.evaluated_depsgraph_get()
-                obj_eval = obj.evaluated_get(depsgraph)
-                mesh_eval = getattr(obj_eval, "data", None)
-                poly_count = getattr(mesh_eval, "polygons", None)
-                totpoly = getattr(mesh_eval, "totpoly", 0) if mesh_eval else 0
-                totvert = getattr(mesh_eval, "totvert", 0) if mesh_eval else 0
-                if (poly_count is not None and len(poly_count) == 0) or totpoly == 0 or totvert == 0:
-                    # 输出为空，移除几何节点修饰器，保留回退立方体
-                    obj.modifiers.remove(mod)
-                    self.report({'WARNING'}, "几何节点输出为空，已回退到立方体")
-                    return {'FINISHED'}
-            except Exception:
-                # 评估失败不致命，继续保留已创建对象
-                pass
+        _finish_profile_object(self, context, obj, item)
+        return {'FINISHED'}
 
-        except Exception as e:
-            self.report({'WARNING'}, f"成功创建基础立方体，但应用几何节点失败: {e}")
-            # 即使失败，基础对象依然存在，所以返回 FINISHED
-            return {'FINISHED'}
 
-        self.report({'INFO'}, f"已添加型材：{item.name}")
-        return {'FINISHED'}
+def _finish_profile_object(op, context, obj, item):
+    """对象已通过Mesh布尔生成槽则直接完成；否则尝试添加几何节点，若输出为空则回退到立方体。"""
+    from ..gn import add_profile_modifier, node_tree_kind
+
+    if getattr(obj, 'get', lambda k, d=None: None)('alu_grooved_bmesh', False):
+        op.report({'INFO'}, f"已添加型材：{item.name}（Mesh布尔构造）")
+        return
+    try:
+        mod = add_profile_modifier(obj, item, obj.get("length", item.default_length), node_tree_kind(context))
+    except Exception as e:
+        # 即使失败，基础对象依然存在
+        op.report({'WARNING'}, f"成功创建基础立方体，但应用几何节点失败: {e}")
+        return
+
+    # 评估几何节点输出是否为空，如为空则移除修饰器回退到立方体
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh_eval = getattr(obj_eval, "data", None)
+        poly_count = getattr(mesh_eval, "polygons", None)
+        totpoly = getattr(mesh_eval, "totpoly", 0) if mesh_eval else 0
+        totvert = getattr(mesh_eval, "totvert", 0) if mesh_eval else 0
+        if (poly_count is not None and len(poly_count) == 0) or totpoly == 0 or totvert == 0:
+            obj.modifiers.remove(mod)
+            op.report({'WARNING'}, "几何节点输出为空，已回退到立方体")
+            return
+    except Exception:
+        # 评估失败不致命，继续保留已创建对象
+        pass
+    op.report({'INFO'}, f"已添加型材：{item.name}")
+
+
+def view3d_under_mouse(context, event):
+    """返回鼠标所在 3D 视图的 (视图区, 窗口区域, 视图数据, 区域内坐标)；不在 3D 视图上时均为 None。
+
+    拖拽通常从侧栏开始，modal 中的 context.region 是侧栏而不是视图窗口，需要按窗口坐标查找。
+    """
+    screen = context.window.screen if context.window else None
+    if screen is None:
+        return None, None, None, None
+    mx, my = event.mouse_x, event.mouse_y
+    for area in screen.areas:
+        if area.type != 'VIEW_3D':
+            continue
+        for region in area.regions:
+            if region.type != 'WINDOW':
+                continue
+            if region.x <= mx < region.x + region.width and region.y <= my < region.y + region.height:
+                rv3d = area.spaces.active.region_3d
+                return area, region, rv3d, (mx - region.x, my - region.y)
+    return None, None, None, None
+
+
+def pick_radius(region, rv3d, coord, origin, direction, pixels=snapping.PICK_PIXELS):
+    """屏幕拾取半径换算为世界半径：返回 (offset, slope)，深度 t（米）处为 offset + slope·t。
+
+    在射线上深度 1 与 2 处各取一点，测量横向偏移 pixels 像素对应的世界距离；透视视图两者成正比，
+    正交视图两者相等（slope = 0）。
+    """
+    shifted = (coord[0] + pixels, coord[1])
+    size = []
+    for t in (1.0, 2.0):
+        point = origin + direction * t
+        size.append((view3d_utils.region_2d_to_location_3d(region, rv3d, shifted, point) - point).length)
+    slope = max(size[1] - size[0], 0.0)
+    return max(size[0] - slope, 0.0), slope
 
 
 class ALUFRAME_OT_drag_add_profile(Operator):
     bl_idname = "aluframe.drag_add_profile"
     bl_label = "拖拽添加型材"
-    bl_description = "拖拽结束位置生成型材"
+    bl_description = "拖拽结束位置生成型材；光标靠近已有型材的槽轴线或同系列端面时吸附（端面对侧面 5mm，同轴 3mm）"
     bl_options = {"REGISTER", "UNDO"}
 
-    _start = None
+    _ray = None
+    _snap = None
+    _area = None
+
+    def _set_header(self, area, text):
+        if self._area is not None and self._area != area:
+            try:
+                self._area.header_text_set(None)
+            except Exception:
+                pass
+        self._area = area
+        if area is not None:
+            area.header_text_set(text)
+
+    def _update(self, context, event):
+        """每次鼠标移动：求鼠标射线并查询吸附索引（只走射线经过的网格格子）。"""
+        area, region, rv3d, coord = view3d_under_mouse(context, event)
+        self._ray = None
+        self._snap = None
+        if region is None or rv3d is None:
+            self._set_header(None, None)
+            return
+        origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
+        direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, coord).normalized()
+        self._ray = (origin, direction)
+        # 毫米容差作用在新型材的端面上，候选特征按屏幕拾取半径筛选；同轴只吸附同系列型材
+        item = active_profile(context)
+        face = min(item.width, item.height) / 2000.0 if item is not None else 0.0
+        self._snap = snapping.get_index(context.scene).query_ray(
+            origin, direction,
+            pick=pick_radius(region, rv3d, coord, origin, direction),
+            face=face,
+            series=item.series if item is not None else None,
+        )
+        if self._snap is not None:
+            self._set_header(area, f"吸附：{self._snap.label()} → {self._snap.target}（松开放置，右键/Esc 取消）")
+        else:
+            self._set_header(area, "拖拽添加型材：松开放置，右键/Esc 取消")
 
+    def _finish(self, context):
+        self._set_header(None, None)
+        context.window.cursor_modal_restore()
+
+    @timed()
     def modal(self, context, event):
         if event.type in {'RIGHTMOUSE', 'ESC'}:
+            self._finish(context)
             return {'CANCELLED'}
-        if event.type in {'LEFTMOUSE'} and event.value == 'RELEASE':
-            # 计算 3D 位置，若失败则退回 3D 游标
-            region = context.region
-            rv3d = context.region_data
-            coord = (event.mouse_region_x, event.mouse_region_y)
-
-            cursor_loc = context.scene.cursor.location.copy()
-            try:
-                # 使用视图原点+朝向估计
-                origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, coord)
-                direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, coord)
-                location = origin + direction * 1.0  # 简单前方一米
-            except Exception:
-                location = cursor_loc
-
-            scene = context.scene
-            idx = scene.aluframe_profiles_index
-            if 0 <= idx < len(scene.aluframe_profiles):
-                item = scene.aluframe_profiles[idx]
-                obj = add_profile_object(context, item, location=location)
-                if not obj:
-                    self.report({'ERROR'}, "创建基础对象失败，请检查控制台报错")
-                else:
-                    # 已通过Mesh布尔生成槽则直接完成
-                    if getattr(obj, 'get', lambda k, d=None: None)('alu_grooved_bmesh', False):
-                        self.report({'INFO'}, f"已添加型材：{item.name}（Mesh布尔构造）")
-                    else:
-                        # 尝试应用几何节点，若输出为空则回退
-                        try:
-                            ng = ensure_profile_node_group()
-                            mod = obj.modifiers.new(name="AluFrameProfile", type='NODES')
-                            mod.node_group = ng
-
-                            def _set_input(modifier, group, name, value):
-                                try:
-                                    modifier[name] = float(value)
-                                    return
-                                except Exception:
-                                    pass
-                                idx = None
-                                try:
-                                    for i, sock in enumerate(getattr(group, 'inputs', [])):
-                                        if sock.name == name:
-                                            idx = i + 1
-                                            break
-                                except Exception:
-                                    idx = None
-                                if idx is not None:
-                                    try:
-                                        modifier[f"Input_{idx}"] = float(value)
-                                    except Exception:
-                                        pass
-
-                            _set_input(mod, ng, "Width", item.width)
-                            _set_input(mod, ng, "Height", item.height)
-                            _set_input(mod, ng, "SlotWidth", item.slot_width)
-                            _set_input(mod, ng, "WallThickness", item.wall_thickness)
-                            _set_input(mod, ng, "Length", item.default_length)
-
-                        except Exception as e:
-                            self.report({'WARNING'}, f"成功创建基础立方体，但应用几何节点失败: {e}")
-                        else:
-                            # 评估几何节点输出是否为空，如为空则移除修饰器回退到立方体
-                            try:
-                                depsgraph = context.evaluated_depsgraph_get()
-                                obj_eval = obj.evaluated_get(depsgraph)
-                                mesh_eval = getattr(obj_eval, "data", None)
-                                poly_count = getattr(mesh_eval, "polygons", None)
-                                totpoly = getattr(mesh_eval, "totpoly", 0) if mesh_eval else 0
-                                totvert = getattr(mesh_eval, "totvert", 0) if mesh_eval else 0
-                                if (poly_count is not None and len(poly_count) == 0) or totpoly == 0 or totvert == 0:
-                                    obj.modifiers.remove(mod)
-                                    self.report({'WARNING'}, "几何节点输出为空，已回退到立方体")
-                                else:
-                                    self.report({'INFO'}, f"已添加型材：{item.name}")
-                            except Exception:
-                                # 评估失败不致命
-                                self.report({'INFO'}, f"已添加型材：{item.name}")
-                            ng = ensure_profile_node_group()
-                            mod = obj.modifiers.new(name="AluFrameProfile", type='NODES')
-                            mod.node_group = ng
-
-                            def _set_input(modifier, group, name, value):
-                                try:
-                                    modifier[name] = float(value)
-                                    return
-                                except Exception:
-                                    pass
-                                idx = None
-                                try:
-                                    for i, sock in enumerate(getattr(group, 'inputs', [])):
-                                        if sock.name == name:
-                                            idx = i + 1
-                                            break
-                                except Exception:
-                                    idx = None
-                                if idx is not None:
-                                    try:
-                                        modifier[f"Input_{idx}"] = float(value)
-                                    except Exception:
-                                        pass
-
-                            _set_input(mod, ng, "Width", item.width)
-                            _set_input(mod, ng, "Height", item.height)
-                            _set_input(mod, ng, "SlotWidth", item.slot_width)
-                            _set_input(mod, ng, "WallThickness", item.wall_thickness)
-                            _set_input(mod, ng, "Length", item.default_length)
-
-                        # 评估几何节点输出是否为空，如为空则移除修饰器回退到立方体
-                        try:
-                            depsgraph = context.evaluated_depsgraph_get()
-                            obj_eval = obj.evaluated_get(depsgraph)
-                            mesh_eval = getattr(obj_eval, "data", None)
-                            poly_count = getattr(mesh_eval, "polygons", None)
-                            totpoly = getattr(mesh_eval, "totpoly", 0) if mesh_eval else 0
-                            totvert = getattr(mesh_eval, "totvert", 0) if mesh_eval else 0
-                            if (poly_count is not None and len(poly_count) == 0) or totpoly == 0 or totvert == 0:
-                                obj.modifiers.remove(mod)
-                                self.report({'WARNING'}, "几何节点输出为空，已回退到立方体")
-                            else:
-                                self.report({'INFO'}, f"已添加型材：{item.name}")
-                        except Exception:
-                            # 评估失败不致命
-                            self.report({'INFO'}, f"已添加型材：{item.name}")
-                        # 此处应有表达式
-                        pass
-                        self.report({'WARNING'}, f"成功创建基础立方体，但应用几何节点失败: {e}")
-            else:
+        if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            # 允许拖拽过程中旋转/缩放视图
+            return {'PASS_THROUGH'}
+        if event.type == 'MOUSEMOVE':
+            self._update(context, event)
+            return {'RUNNING_MODAL'}
+        if event.type == 'LEFTMOUSE' and event.value == 'RELEASE':
+            self._update(context, event)
+            self._finish(context)
+            item = active_profile(context)
+            if item is None:
                 self.report({'WARNING'}, '请先选择型材')
+                return {'CANCELLED'}
+
+            length = float(item.default_length)
+            matrix = None
+            location = context.scene.cursor.location.copy()
+            if self._snap is not None:
+                matrix = self._snap.matrix(length)
+            elif self._ray is not None:
+                origin, direction = self._ray
+                location = origin + direction * 1.0  # 未吸附：视线前方一米
+
+            from ..gn import add_profile_object
 
-            context.window.cursor_modal_restore()
+            obj = add_profile_object(context, item, location=location, length=length, matrix=matrix)
+            if not obj:
+                self.report({'ERROR'}, "创建基础对象失败，请检查控制台报错")
+                return {'CANCELLED'}
+            _finish_profile_object(self, context, obj, item)
             return {'FINISHED'}
 
         return {'RUNNING_MODAL'}
 
     def invoke(self, context, event):
+        # 拖拽开始前确保吸附索引可用（失效时在此重建一次，之后由合并刷新增量维护）
+        snapping.get_index(context.scene)
         context.window.cursor_modal_set('CROSSHAIR')
         context.window_manager.modal_handler_add(self)
-        return {'RUNNING_MODAL'}
\ No newline at end of file
+        return {'RUNNING_MODAL'}
+
+
+class ALUFRAME_OT_add_profiles_batch(Operator):
+    bl_idname = "aluframe.add_profiles_batch"
+    bl_label = "批量添加型材"
+    bl_description = "从 JSON 文件一次性创建大量型材（单个撤销步骤）"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filepath: bpy.props.StringProperty(name="文件", subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    @timed()
+    def execute(self, context):
+        from ..batch import add_profiles_batch
+
+        # 文件格式：[{"uid": "GB-4040", "length": 1000, "matrix": [[...] * 4]}, ...]
+        # 未给出 matrix 时可用 "location": [x, y, z]
+        try:
+            with open(bpy.path.abspath(self.filepath), 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+        except Exception as e:
+            self.report({'ERROR'}, f"读取批量文件失败：{e}")
+            return {'CANCELLED'}
+
+        if not isinstance(rows, list):
+            self.report({'ERROR'}, "批量文件格式错误：顶层应为记录列表")
+            return {'CANCELLED'}
+
+        # 非对象的行记为 None，与其他无效记录一样由 add_profiles_batch 计入跳过数
+        records = (
+            (r.get('uid', ''), r.get('length'), r.get('matrix') or r.get('location') or (0.0, 0.0, 0.0))
+            if isinstance(r, dict) else None
+            for r in rows
+        )
+        t0 = time.perf_counter()
+        created, skipped = add_profiles_batch(context, records)
+        elapsed = time.perf_counter() - t0
+        if skipped:
+            self.report({'WARNING'}, f"已添加 {len(created)} 根型材，跳过 {skipped} 条无效记录（{elapsed:.2f} s）")
+        else:
+            self.report({'INFO'}, f"已添加 {len(created)} 根型材（{elapsed:.2f} s）")
+        return {'FINISHED'} if created else {'CANCELLED'}
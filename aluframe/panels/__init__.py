@@ -1,21 +1,30 @@
 import bpy
 
+from .. import previews
 from .profile_library import ALUFRAME_PT_profile_library, ALUFRAME_UL_profiles
 from .property_panel import ALUFRAME_PT_property_panel
+from .interference_panel import ALUFRAME_PT_interference
+from .fem_panel import ALUFRAME_PT_fem
+from .diagnostics_panel import ALUFRAME_PT_diagnostics
 
 
 classes = (
     ALUFRAME_UL_profiles,
     ALUFRAME_PT_profile_library,
     ALUFRAME_PT_property_panel,
+    ALUFRAME_PT_interference,
+    ALUFRAME_PT_fem,
+    ALUFRAME_PT_diagnostics,
 )
 
 
 def register():
+    previews.register()
     for cls in classes:
         bpy.utils.register_class(cls)
 
 
 def unregister():
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
\ No newline at end of file
+        bpy.utils.unregister_class(cls)
+    previews.unregister()
\ No newline at end of file
@@ -0,0 +1,62 @@
+import time
+
+import bpy
+
+# 面板中最多列出的计时项
+MAX_TIMING_ROWS = 15
+
+
+class ALUFRAME_PT_diagnostics(bpy.types.Panel):
+    bl_idname = "ALUFRAME_PT_diagnostics"
+    bl_label = "诊断"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'AluFrame'
+    bl_parent_id = "ALUFRAME_PT_property_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        from .. import profiling
+
+        layout = self.layout
+        layout.prop(context.window_manager, "aluframe_profiling")
+        if not profiling.enabled:
+            layout.label(text="开启后记录操作符 / 面板绘制 / depsgraph 处理耗时")
+            return
+
+        # 数据块统计需遍历对象：只在“刷新统计”时计算，绘制中只显示最近一次的结果
+        stats = profiling.datablock_stats
+        box = layout.box()
+        row = box.row()
+        if stats is None:
+            row.label(text="数据块统计：尚未统计")
+        else:
+            row.label(text=f"数据块统计（{time.strftime('%H:%M:%S', time.localtime(stats['time']))}）")
+        row.operator("aluframe.refresh_diagnostics", text="", icon='FILE_REFRESH')
+        if stats is not None:
+            counts = stats["counts"]
+            box.label(text=f"对象 {counts['objects']}，网格 {counts['meshes']}，节点组 {counts['node_groups']}")
+            box.label(text=f"型材对象 {counts['members']}，槽辅助对象 {counts['slot_helpers']}")
+            for name, est in stats["memory"].items():
+                total = (est["mesh_bytes"] + est["object_bytes"]) / (1024.0 * 1024.0)
+                box.label(text=f"{name}：{est['members']} 根，约 {total:.1f} MB")
+
+        rows = profiling.summary()
+        if rows:
+            box = layout.box()
+            row = box.row()
+            row.label(text="名称")
+            row.label(text="次数")
+            row.label(text="平均(ms)")
+            row.label(text="最大(ms)")
+            for name, count, _total, mean, peak in rows[:MAX_TIMING_ROWS]:
+                row = box.row()
+                row.label(text=name)
+                row.label(text=str(count))
+                row.label(text=f"{mean:.3f}")
+                row.label(text=f"{peak:.3f}")
+            if len(rows) > MAX_TIMING_ROWS:
+                box.label(text=f"…… 其余 {len(rows) - MAX_TIMING_ROWS} 项见导出的 Trace")
+        row = layout.row(align=True)
+        row.operator("aluframe.export_trace", icon='EXPORT')
+        row.operator("aluframe.reset_profiling", icon='TRASH')
@@ -0,0 +1,50 @@
+import bpy
+
+from ..profiling import timed
+
+# 面板中列出的利用率最高的型材数量
+MAX_WORST_ROWS = 8
+
+
+class ALUFRAME_PT_fem(bpy.types.Panel):
+    bl_idname = "ALUFRAME_PT_fem"
+    bl_label = "结构计算"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'AluFrame'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @timed()
+    def draw(self, context):
+        # 面板默认折叠，展开后才导入 fem（及 NumPy）
+        from .. import fem
+
+        scene = context.scene
+        layout = self.layout
+        supports = scene.get(fem.SUPPORTS_PROP)
+        loads = scene.get(fem.LOADS_PROP)
+        col = layout.column(align=True)
+        row = col.row(align=True)
+        row.operator("aluframe.fem_set_support", text="铰接支座").support = "PINNED"
+        row.operator("aluframe.fem_set_support", text="固接支座").support = "FIXED"
+        col.operator("aluframe.fem_set_load", text="设置荷载", icon='SORT_ASC')
+        layout.label(text=f"支座 {len(supports) if supports else 0} 根，荷载 {len(loads) if loads else 0} 根")
+
+        row = layout.row(align=True)
+        row.operator("aluframe.fem_solve", text="计算", icon='PLAY')
+        row.operator("aluframe.fem_clear", text="", icon='X')
+
+        result = fem.last_result
+        if result is None:
+            return
+        box = layout.box()
+        col = box.column()
+        col.alert = result.max_utilization > 1.0
+        col.label(text=f"最大挠度：{result.max_deflection:.2f} mm")
+        col.label(text=f"最大利用率：{result.max_utilization:.0%}")
+        if result.unsupported:
+            box.label(text=f"未与支座相连：{result.unsupported} 根", icon='ERROR')
+        for name, ratio, deflection in result.worst(MAX_WORST_ROWS):
+            row = box.row()
+            row.alert = ratio > 1.0
+            row.label(text=f"{name}：{ratio:.0%}，{deflection:.2f} mm")
@@ -0,0 +1,46 @@
+import bpy
+
+from ..profiling import timed
+
+# 面板中最多列出的干涉对数量
+MAX_PAIR_ROWS = 20
+
+
+class ALUFRAME_PT_interference(bpy.types.Panel):
+    bl_idname = "ALUFRAME_PT_interference"
+    bl_label = "干涉检查"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'AluFrame'
+
+    @timed()
+    def draw(self, context):
+        from ..handlers import request_rebuild
+        from ..interference import cached_index
+
+        layout = self.layout
+        layout.operator("aluframe.check_interference", text="重新检查", icon='FILE_REFRESH')
+
+        # 只显示与吸附索引同代的检查结果；失效（打开文件 / 撤销后）时交给计时器重建，绘制中不做检测
+        index = cached_index(context.scene)
+        if index is None:
+            request_rebuild("interference")
+            layout.label(text="检查中……", icon='TIME')
+            return
+        if not index:
+            layout.label(text="未发现模型干涉", icon='CHECKMARK')
+            return
+
+        col = layout.column()
+        col.alert = True
+        col.label(text=f"模型干涉：{len(index)} 处", icon='ERROR')
+        box = layout.box()
+        pairs = index.sorted_pairs()
+        for a, b, ratio in pairs[:MAX_PAIR_ROWS]:
+            row = box.row()
+            row.alert = True
+            op = row.operator("aluframe.select_interference_pair", text=f"{a} × {b}（重叠 {ratio:.0%}）")
+            op.first = a
+            op.second = b
+        if len(pairs) > MAX_PAIR_ROWS:
+            box.label(text=f"…… 其余 {len(pairs) - MAX_PAIR_ROWS} 处")
@@ -1,33 +1,38 @@
 import bpy
-import os
+
+from ..catalog import loaded_catalog
+from ..data import active_profile, catalog_refs_synced, request_catalog_sync
+from ..previews import icon_state, READY, LOADING
+from ..profiling import timed
+from ..search import get_search_index
 
 
 class ALUFRAME_UL_profiles(bpy.types.UIList):
-    # 自定义过滤：按搜索文本、标准、系列过滤
+    # 自定义过滤：按搜索文本、标准、系列过滤（列表项仅为 ID 引用，参数从目录读取）。
+    # 由预建检索索引完成，相同条件的结果直接复用，不在每次重绘时逐条扫描。
+    @timed()
     def filter_items(self, context, data, propname):
         items = getattr(data, propname)
-        helper_filter = []
-        helper_order = []
+        catalog = loaded_catalog()
+        if catalog is None or len(items) != len(catalog):
+            # 引用列表尚未同步，暂不显示
+            return [0] * len(items), []
         scene = context.scene
-        search = (scene.aluframe_search or '').strip().lower()
-        fs = scene.aluframe_filter_standard
-        fr = scene.aluframe_filter_series
-
-        for i, it in enumerate(items):
-            ok = True
-            if fs != 'ALL' and it.standard != fs:
-                ok = False
-            if fr != 'ALL' and it.series != fr:
-                ok = False
-            if search:
-                if search not in it.name.lower() and search not in it.series.lower():
-                    ok = False
-            helper_filter.append(self.bitflag_filter_item if ok else 0)
-            helper_order.append(i)
-        return helper_filter, helper_order
+        flags = get_search_index(catalog).filter_flags(
+            (scene.aluframe_search or '').strip(),
+            scene.aluframe_filter_standard,
+            scene.aluframe_filter_series,
+            self.bitflag_filter_item,
+        )
+        return flags, []
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         # 列表行显示：型号名 + 系列/标准
+        catalog = loaded_catalog()
+        item = catalog.get(item.uid) if catalog is not None else None
+        if item is None:
+            layout.label(text="（目录中已不存在）")
+            return
         row = layout.row(align=True)
         row.label(text=item.name)
         row.label(text=f"{item.series} 系列")
@@ -41,9 +46,15 @@ class ALUFRAME_PT_profile_library(bpy.types.Panel):
     bl_region_type = 'UI'
     bl_category = 'AluFrame'
 
+    @timed()
     def draw(self, context):
         layout = self.layout
         scene = context.scene
+        if not catalog_refs_synced(context.window_manager):
+            # 目录在侧栏首次绘制时才登记加载；加载与引用列表同步由计时器完成，之后面板再重绘
+            request_catalog_sync()
+            layout.label(text="型材目录加载中……")
+            return
 
         # 顶部搜索与过滤
         row = layout.row(align=True)
@@ -55,34 +66,32 @@ class ALUFRAME_PT_profile_library(bpy.types.Panel):
         layout.template_list(
             "ALUFRAME_UL_profiles",
             "profiles",
-            scene,
-            "aluframe_profiles",
+            context.window_manager,
+            "aluframe_catalog",
             scene,
             "aluframe_profiles_index",
             rows=6,
         )
 
         # 预览与参数
-        idx = scene.aluframe_profiles_index
-        if 0 <= idx < len(scene.aluframe_profiles):
-            item = scene.aluframe_profiles[idx]
+        item = active_profile(context)
+        if item is not None:
             box = layout.box()
             box.label(text=f"型号：{item.name}（{item.series} 系列，{'国标' if item.standard=='GB' else '欧标'}）")
             box.label(text=f"截面：{item.width:.1f} × {item.height:.1f} mm，槽宽 {item.slot_width:.1f} mm")
             box.label(text=f"壁厚：{item.wall_thickness:.1f} mm，默认长度 {item.default_length:.1f} mm")
-            # 截面 PNG 预览（可选）
-            try:
-                icons_dir = os.path.join(os.path.dirname(__file__), '..', 'assets', 'section_icons')
-                icons_dir = os.path.normpath(icons_dir)
-                icon_path = os.path.join(icons_dir, f"{item.uid}.png")
-                if os.path.exists(icon_path):
-                    img = bpy.data.images.load(icon_path)
-                    layout.template_preview(img, show_buttons=False)
-                else:
-                    box.label(text="截面图：未提供 PNG 图标")
-            except Exception:
-                box.label(text="截面图载入失败（忽略，不影响功能）")
+            # 截面 PNG 预览（可选）：只读预览缓存，加载由 previews 模块在 draw() 之外完成
+            icon_id, state = icon_state(item.uid)
+            if state == READY:
+                box.template_icon(icon_value=icon_id, scale=6.0)
+            elif state == LOADING:
+                box.label(text="截面图：载入中……")
+            else:
+                box.label(text="截面图：未提供 PNG 图标")
 
+            layout.prop(scene, 'aluframe_geometry_mode', text="几何")
+            if scene.aluframe_geometry_mode == 'NODES':
+                layout.prop(scene, 'aluframe_node_tree', text="节点组")
             row = layout.row(align=True)
             row.operator('aluframe.add_selected_profile')
             row.operator('aluframe.drag_add_profile')
@@ -1,5 +1,10 @@
 import bpy
 
+from ..profiling import timed
+
+# 面板中最多显示的 BOM 行数，其余以汇总形式提示
+MAX_BOM_ROWS = 30
+
 
 class ALUFRAME_PT_property_panel(bpy.types.Panel):
     bl_idname = "ALUFRAME_PT_property_panel"
@@ -8,10 +13,108 @@ class ALUFRAME_PT_property_panel(bpy.types.Panel):
     bl_region_type = 'UI'
     bl_category = 'AluFrame'
 
+    @timed()
     def draw(self, context):
         layout = self.layout
         has_sel = getattr(context.scene, "aluframe_has_selection", False)
         if has_sel:
             layout.label(text="选中物体")
+            obj = context.active_object
+            if obj is not None and obj.get("alu_assembly"):
+                layout.label(text=f"装配体：{len(obj.data.vertices)} 根型材")
+            if obj is not None and "alu_uid" in obj and "length" in obj:
+                layout.label(text=f"长度：{float(obj['length']):.1f} mm")
+                _draw_section(layout, obj)
+            row = layout.row(align=True)
+            row.operator('aluframe.set_length')
+            row.operator('aluframe.drag_length')
+            row = layout.row(align=True)
+            row.operator('aluframe.pack_assembly')
+            row.operator('aluframe.unpack_assembly')
+            return
+
+        # 未选中时显示 BOM 清单：只读取已同步的索引，失效（打开文件 / 撤销后）时交给计时器重建，
+        # 绘制中不扫描场景
+        from .. import bom, connections, store
+        from ..handlers import request_rebuild
+
+        scene = context.scene
+        index = bom.cached_index(scene)
+        if index is None:
+            # 打开文件 / 撤销后两者同时失效（BOM 是成员存储的视图），一并登记，重建后只重绘一次
+            request_rebuild("store", "connections")
+            layout.label(text="BOM 统计中……")
+            return
+        if index.total_count == 0:
+            layout.label(text="请添加型材")
+            return
+
+        box = layout.box()
+        row = box.row()
+        row.label(text="型号")
+        row.label(text="标准")
+        row.label(text="长度(mm)")
+        row.label(text="数量")
+        rows = index.sorted_rows()
+        for bom_row in rows[:MAX_BOM_ROWS]:
+            row = box.row()
+            row.label(text=bom_row.alu_type)
+            row.label(text=bom.standard_label(bom_row.standard))
+            row.label(text=f"{bom_row.length:.1f}")
+            row.label(text=str(bom_row.count))
+        if len(rows) > MAX_BOM_ROWS:
+            box.label(text=f"…… 其余 {len(rows) - MAX_BOM_ROWS} 项见导出文件")
+        layout.label(text=f"总根数：{index.total_count}，总长度：{index.total_length:.1f} mm")
+
+        # 连接节点：增量维护的连接图
+        graph = connections.cached_index(scene)
+        if graph is None:
+            request_rebuild("connections")
+            layout.label(text="连接节点：—")
         else:
-            layout.label(text="请添加型材")
\ No newline at end of file
+            kinds = graph.kind_counts()
+            if kinds:
+                text = "，".join(f"{connections.KIND_LABELS[kind]} {n}" for kind, n in sorted(kinds.items()))
+                layout.label(text=f"连接节点：{text}")
+
+        # 质量与成本：成员存储上的数组运算（按存储版本缓存）；单重取自型材目录，目录未加载时不在绘制中加载
+        from ..catalog import loaded_catalog
+        from ..data import request_catalog_sync
+        from ..mass import total_mass
+
+        members = store.cached_index(scene)
+        row = layout.row()
+        if members is None or loaded_catalog() is None:
+            if members is None:
+                request_rebuild("store")
+            else:
+                request_catalog_sync()
+            row.label(text="总质量：—，估算成本：—")
+        else:
+            mass = total_mass(members)
+            row.label(text=f"总质量：{mass:.2f} kg，估算成本：{mass * scene.aluframe_price_per_kg:.2f} 元")
+        layout.prop(scene, "aluframe_price_per_kg")
+
+
+def _draw_section(layout, obj):
+    """活动型材的截面特性（按截面参数缓存，不逐次计算）。"""
+    from ..catalog import loaded_catalog
+    from ..data import request_catalog_sync
+    from ..section import item_properties
+
+    catalog = loaded_catalog()
+    if catalog is None:
+        # 目录由计时器在 draw() 之外加载
+        request_catalog_sync()
+        layout.label(text="截面特性：型材目录加载中……")
+        return
+    item = catalog.get(obj["alu_uid"])
+    if item is None:
+        return
+    p = item_properties(item)
+    length = float(obj["length"])
+    box = layout.box()
+    box.label(text=f"截面积：{p.area:.1f} mm²，单重：{p.linear_mass:.3f} kg/m")
+    box.label(text=f"Ix / Iy：{p.ix / 1e4:.2f} / {p.iy / 1e4:.2f} cm⁴")
+    box.label(text=f"Wx / Wy：{p.wx / 1e3:.2f} / {p.wy / 1e3:.2f} cm³")
+    box.label(text=f"质量：{p.linear_mass * length / 1000.0:.3f} kg")
@@ -0,0 +1,144 @@
+"""截面图标预览：bpy.utils.previews 集合 + 延迟加载 + 两代集合轮换淘汰。
+
+面板 draw() 中只允许调用 icon_state()：仅读内存，不做磁盘 I/O、不创建数据块。
+未加载的图标登记到待加载集合，由一次性计时器在 draw() 之外加载后再请求重绘。
+
+预览集合没有公开的单项释放接口，淘汰以整个集合为单位：新图标载入当前代集合，
+当前代满后整体释放上一代、当前代降为上一代并新建当前代。上一代中仍被使用的图标
+照常显示，并重新载入当前代，因而常用图标不会随轮换消失。
+"""
+
+import os
+import bpy
+import bpy.utils.previews
+
+# 同时驻留的预览数量上限（两代集合各占一半）
+MAX_PREVIEWS = 128
+GENERATION = MAX_PREVIEWS // 2
+
+READY = 'READY'
+LOADING = 'LOADING'
+MISSING = 'MISSING'
+
+_pcoll = None          # 当前代：新载入的图标
+_old = None            # 上一代：下次轮换时整体释放
+_available = None      # 图标目录中存在 PNG 的 uid 集合（在计时器中扫描一次）
+_pending = set()
+_load_scheduled = False
+
+
+def icons_dir():
+    return os.path.join(os.path.dirname(__file__), 'assets', 'section_icons')
+
+
+def icon_state(uid):
+    """返回 (icon_id, 状态)。状态为 READY / LOADING / MISSING。"""
+    if _pcoll is None:
+        return 0, MISSING
+    if uid in _pcoll:
+        return _pcoll[uid].icon_id, READY
+    if _old is not None and uid in _old:
+        # 仍在使用：重新载入当前代，避免随上一代一起释放
+        _pending.add(uid)
+        _schedule_load()
+        return _old[uid].icon_id, READY
+    if _available is not None and uid not in _available:
+        return 0, MISSING
+    _pending.add(uid)
+    _schedule_load()
+    return 0, LOADING
+
+
+def _schedule_load():
+    global _load_scheduled
+    if _load_scheduled:
+        return
+    _load_scheduled = True
+    bpy.app.timers.register(_load_pending, first_interval=0.0)
+
+
+def _rotate():
+    """释放上一代集合，当前代降为上一代，并新建当前代。"""
+    global _pcoll, _old
+    if _old is not None:
+        bpy.utils.previews.remove(_old)
+    _old = _pcoll
+    _pcoll = bpy.utils.previews.new()
+
+
+def _load_pending():
+    global _available, _load_scheduled
+    _load_scheduled = False
+    if _pcoll is None:
+        _pending.clear()
+        return None
+    folder = icons_dir()
+    if _available is None:
+        try:
+            _available = {
+                os.path.splitext(e.name)[0]
+                for e in os.scandir(folder)
+                if e.is_file() and e.name.lower().endswith('.png')
+            }
+        except OSError:
+            _available = set()
+
+    loaded = False
+    for uid in list(_pending):
+        _pending.discard(uid)
+        if uid not in _available or uid in _pcoll:
+            continue
+        if len(_pcoll) >= GENERATION:
+            _rotate()
+        try:
+            _pcoll.load(uid, os.path.join(folder, f"{uid}.png"), 'IMAGE')
+        except Exception as e:
+            print(f"[AluFrame] 截面图标载入失败：{uid}：{e}")
+            _available.discard(uid)
+            continue
+        loaded = True
+
+    if loaded:
+        _tag_redraw()
+    return None
+
+
+def _tag_redraw():
+    wm = getattr(bpy.context, 'window_manager', None)
+    if wm is None:
+        return
+    for win in wm.windows:
+        for area in win.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def refresh():
+    """图标目录有变化（如重新生成图标）后调用：清空预览并在下次使用时重新扫描。"""
+    global _available, _old
+    _available = None
+    _pending.clear()
+    if _pcoll is not None:
+        _pcoll.clear()
+    if _old is not None:
+        bpy.utils.previews.remove(_old)
+        _old = None
+
+
+def register():
+    global _pcoll
+    if _pcoll is None:
+        _pcoll = bpy.utils.previews.new()
+
+
+def unregister():
+    global _pcoll, _old, _available, _load_scheduled
+    if bpy.app.timers.is_registered(_load_pending):
+        bpy.app.timers.unregister(_load_pending)
+    _load_scheduled = False
+    for pcoll in (_pcoll, _old):
+        if pcoll is not None:
+            bpy.utils.previews.remove(pcoll)
+    _pcoll = _old = None
+    _pending.clear()
+    _available = None
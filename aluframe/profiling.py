@@ -0,0 +1,192 @@
+"""热路径计时（按需开启）：记录每次调用的耗时到环形缓冲区，并可导出为 Chrome trace JSON。
+
+- 被计时的函数用 @timed(名称) 装饰；关闭时包装函数只多一次模块级布尔判断，可随发布版保留
+- 开启：侧栏“诊断”子面板的开关（WindowManager.aluframe_profiling，不随文件保存），
+  或启动前设置环境变量 ALUFRAME_PROFILE=1
+- 环形缓冲区保存最近 RING_SIZE 次调用（名称、开始时间、耗时、线程），另按名称累计次数 / 总耗时 / 最大值
+- 导出的 JSON 可在 chrome://tracing 或 https://ui.perfetto.dev 中打开；
+  数据块数量与网格内存估算以计数器事件（ph = "C"）附在末尾
+
+不在模块级导入 bpy：数据块统计在函数内按需导入。
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+
+RING_SIZE = 20000
+
+enabled = os.environ.get("ALUFRAME_PROFILE", "") not in ("", "0")
+
+_ring = deque(maxlen=RING_SIZE)
+# 名称 -> [次数, 总耗时 ns, 最大耗时 ns]
+_stats = {}
+_origin_ns = time.perf_counter_ns()
+
+
+def set_enabled(value):
+    global enabled
+    enabled = bool(value)
+
+
+def reset():
+    _ring.clear()
+    _stats.clear()
+
+
+def record(name, start_ns, duration_ns):
+    _ring.append((name, start_ns, duration_ns, threading.get_ident()))
+    stat = _stats.get(name)
+    if stat is None:
+        _stats[name] = [1, duration_ns, duration_ns]
+    else:
+        stat[0] += 1
+        stat[1] += duration_ns
+        if duration_ns > stat[2]:
+            stat[2] = duration_ns
+
+
+def timed(name=None):
+    """计时装饰器；name 缺省为函数的限定名。"""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        def call(*args, **kwargs):
+            if not enabled:
+                return fn(*args, **kwargs)
+            t0 = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, t0, time.perf_counter_ns() - t0)
+
+        return functools.wraps(fn)(_same_arity(fn, call))
+    return decorate
+
+
+def _same_arity(fn, call):
+    """返回与 fn 位置参数个数相同的包装函数。
+
+    Blender 注册类时按参数个数校验 draw / execute / modal / filter_items 等方法，
+    (*args, **kwargs) 形式的包装函数会被拒绝。
+    """
+    code = fn.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS) or code.co_kwonlyargcount or fn.__defaults__:
+        return call
+    n = code.co_argcount
+    if n == 0:
+        return lambda: call()
+    if n == 1:
+        return lambda a: call(a)
+    if n == 2:
+        return lambda a, b: call(a, b)
+    if n == 3:
+        return lambda a, b, c: call(a, b, c)
+    if n == 4:
+        return lambda a, b, c, d: call(a, b, c, d)
+    return call
+
+
+def summary():
+    """按总耗时降序的 [(名称, 次数, 总耗时 ms, 平均 ms, 最大 ms), ...]。"""
+    rows = []
+    for name, (count, total, peak) in _stats.items():
+        rows.append((name, count, total / 1e6, total / 1e6 / count, peak / 1e6))
+    rows.sort(key=lambda r: -r[2])
+    return rows
+
+
+def datablock_counts():
+    """当前文件的数据块数量：网格、对象、槽辅助对象（逐对象布尔构造）、型材、节点组。"""
+    import bpy
+
+    objects = bpy.data.objects
+    return {
+        "meshes": len(bpy.data.meshes),
+        "objects": len(objects),
+        "slot_helpers": sum(1 for o in objects if o.name.startswith("AluSlots_")),
+        "members": sum(1 for o in objects if "alu_type" in o),
+        "node_groups": len(bpy.data.node_groups),
+    }
+
+
+# 粗略的每元素字节数（坐标、索引与常用属性层），仅用于相对比较
+_VERT_BYTES = 32
+_EDGE_BYTES = 16
+_LOOP_BYTES = 16
+_POLY_BYTES = 16
+_OBJECT_BYTES = 2048
+
+
+def mesh_bytes(mesh):
+    return (len(mesh.vertices) * _VERT_BYTES + len(mesh.edges) * _EDGE_BYTES
+            + len(mesh.loops) * _LOOP_BYTES + len(mesh.polygons) * _POLY_BYTES)
+
+
+def memory_estimate(scene):
+    """按集合估算型材占用的内存（字节）：共享网格只计一次，另计对象本身的固定开销。
+
+    返回 {集合名: {"members": 根数, "objects": 对象数, "mesh_bytes": …, "object_bytes": …}}。
+    """
+    result = {}
+    for coll in [scene.collection] + list(scene.collection.children_recursive):
+        meshes = {}
+        members = 0
+        objects = 0
+        for obj in coll.objects:
+            if obj.get("alu_assembly"):
+                members += len(obj.data.vertices)
+            elif "alu_type" in obj:
+                members += 1
+            elif not obj.name.startswith("AluSlots_"):
+                continue
+            objects += 1
+            if obj.type == 'MESH':
+                meshes[obj.data.name] = obj.data
+        if objects:
+            result[coll.name] = {
+                "members": members,
+                "objects": objects,
+                "mesh_bytes": sum(mesh_bytes(m) for m in meshes.values()),
+                "object_bytes": objects * _OBJECT_BYTES,
+            }
+    return result
+
+
+# 最近一次的数据块统计 {"counts": …, "memory": …, "time": …}；诊断面板只显示它（见 refresh_datablock_stats）
+datablock_stats = None
+
+
+def refresh_datablock_stats(scene):
+    """重新统计数据块数量与按集合的内存估算并保存（“刷新统计”操作符调用，面板绘制中不遍历对象）。"""
+    global datablock_stats
+    datablock_stats = {"counts": datablock_counts(), "memory": memory_estimate(scene), "time": time.time()}
+    return datablock_stats
+
+
+def trace_events(counters=None):
+    """环形缓冲区转为 Chrome trace 事件列表（时间单位：微秒）。"""
+    pid = os.getpid()
+    events = [
+        {"name": name, "cat": "aluframe", "ph": "X", "pid": pid, "tid": tid,
+         "ts": (start - _origin_ns) / 1000.0, "dur": duration / 1000.0}
+        for name, start, duration, tid in list(_ring)
+    ]
+    if counters:
+        ts = (time.perf_counter_ns() - _origin_ns) / 1000.0
+        for name, values in counters.items():
+            events.append({"name": name, "cat": "aluframe", "ph": "C", "pid": pid, "tid": 0,
+                           "ts": ts, "args": values})
+    return events
+
+
+def write_chrome_trace(path, counters=None):
+    """写出 Chrome trace JSON，返回事件数量。"""
+    events = trace_events(counters)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+    return len(events)
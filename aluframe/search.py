@@ -0,0 +1,159 @@
+"""型材目录检索索引（不依赖 bpy）。
+
+- 文本：对“型号 + 系列”建立 1~3 字符 n-gram 倒排表；更长的检索词先求各 3-gram 倒排表的交集，
+  再对少量候选做子串校验
+- 数值：宽、高、槽宽、系列各自维护排序数组，范围查询用二分定位
+- 结果按 (检索文本, 过滤条件, 目录版本) 记忆，UIList 重绘时直接复用
+
+检索文本支持结构化条件（空格分隔，可与普通关键字混用）：
+    slot:8          槽宽 = 8mm（也可写 槽:8）
+    series:40-45    系列 40~45（也可写 系列:40-45）
+    w:40 / h:80     宽 / 高（也可写 宽: / 高:），均支持 a-b 范围
+"""
+
+import bisect
+from collections import OrderedDict
+
+MAX_GRAM = 3
+_MEMO_SIZE = 64
+
+_RANGE_KEYS = {
+    "slot": "slot_width", "槽": "slot_width", "槽宽": "slot_width",
+    "w": "width", "宽": "width",
+    "h": "height", "高": "height",
+    "series": "series", "系列": "series",
+}
+
+# 数值相等比较容差（mm）
+_EPS = 1e-6
+
+
+def _grams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_query(text):
+    """拆分检索文本：返回 (关键字列表, {字段: (下限, 上限)})。"""
+    terms = []
+    ranges = {}
+    for token in (text or "").replace("，", " ").replace(",", " ").split():
+        token = token.replace("：", ":")
+        key, sep, value = token.partition(":")
+        field = _RANGE_KEYS.get(key.lower()) if sep else None
+        if field is None:
+            terms.append(token.lower())
+            continue
+        value = value.lower().replace("mm", "")
+        lo_s, dash, hi_s = value.partition("-")
+        lo = _to_float(lo_s)
+        hi = _to_float(hi_s) if dash else lo
+        if lo is None or hi is None:
+            terms.append(token.lower())
+            continue
+        ranges[field] = (min(lo, hi), max(lo, hi))
+    return terms, ranges
+
+
+class CatalogSearchIndex:
+    def __init__(self, entries, version):
+        self.version = version
+        self.size = len(entries)
+        self._texts = []
+        self._grams = {}
+        self._by_standard = {}
+        self._sorted = {}
+        self._memo = OrderedDict()
+
+        for i, e in enumerate(entries):
+            text = f"{e.name} {e.series}".lower()
+            self._texts.append(text)
+            for n in range(1, MAX_GRAM + 1):
+                for g in _grams(text, n):
+                    self._grams.setdefault(g, set()).add(i)
+            self._by_standard.setdefault(e.standard, set()).add(i)
+
+        for field in ("width", "height", "slot_width", "series"):
+            pairs = []
+            for i, e in enumerate(entries):
+                v = _to_float(getattr(e, field))
+                if v is not None:
+                    pairs.append((v, i))
+            pairs.sort()
+            self._sorted[field] = ([v for v, _ in pairs], [i for _, i in pairs])
+
+    def _match_term(self, term):
+        if len(term) <= MAX_GRAM:
+            return self._grams.get(term, set())
+        postings = [self._grams.get(g) for g in _grams(term, MAX_GRAM)]
+        if any(p is None for p in postings):
+            return set()
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        texts = self._texts
+        return {i for i in candidates if term in texts[i]}
+
+    def _match_range(self, field, lo, hi):
+        values, ids = self._sorted[field]
+        a = bisect.bisect_left(values, lo - _EPS)
+        b = bisect.bisect_right(values, hi + _EPS)
+        return set(ids[a:b])
+
+    def query(self, text, standard='ALL', series='ALL'):
+        """返回命中的条目下标集合（None 表示不过滤，全部命中）。"""
+        terms, ranges = parse_query(text)
+        if series != 'ALL':
+            v = _to_float(series)
+            if v is not None:
+                ranges["series"] = (v, v)
+        result = None
+
+        def narrow(hits):
+            nonlocal result
+            result = set(hits) if result is None else result & hits
+
+        if standard != 'ALL':
+            narrow(self._by_standard.get(standard, set()))
+        for field, rng in ranges.items():
+            narrow(self._match_range(field, *rng))
+        for term in sorted(terms, key=len, reverse=True):
+            narrow(self._match_term(term))
+            if not result:
+                break
+        return result
+
+    def filter_flags(self, text, standard, series, flag):
+        """返回 UIList.filter_items 需要的标志列表；相同条件直接复用记忆结果。"""
+        key = (text, standard, series, flag)
+        flags = self._memo.get(key)
+        if flags is not None:
+            self._memo.move_to_end(key)
+            return flags
+        hits = self.query(text, standard, series)
+        if hits is None:
+            flags = [flag] * self.size
+        else:
+            flags = [0] * self.size
+            for i in hits:
+                flags[i] = flag
+        self._memo[key] = flags
+        if len(self._memo) > _MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return flags
+
+
+_index = None
+
+
+def get_search_index(catalog):
+    """返回与目录版本一致的检索索引（目录重新加载后自动重建）。"""
+    global _index
+    if _index is None or _index.version != catalog.version or _index.size != len(catalog):
+        _index = CatalogSearchIndex(catalog.entries, catalog.version)
+    return _index
@@ -0,0 +1,217 @@
+"""型材截面几何（纯 Python，不依赖 bpy，可供后台脚本与子进程复用）。
+
+坐标单位为毫米，原点位于截面中心，X 对应宽度、Y 对应高度。
+视图中的几何只用带槽外轮廓（实心）；截面特性（面积、惯性矩、质量）按空心的 T 槽截面模型计算，
+见 hollow_section_parts。
+"""
+
+import functools
+import math
+from collections import namedtuple
+
+
+def section_outline(width, height, slot_width, wall_thickness):
+    """返回带槽截面的外轮廓顶点列表 [(x, y), ...]（逆时针，首尾不重复）。
+
+    四条边的中点各开一个槽口：开口宽 `slot_width`，深度 `wall_thickness`。
+    槽宽或壁厚无效（≤0 或超出截面）时退化为矩形。
+    """
+    w2 = float(width) / 2.0
+    h2 = float(height) / 2.0
+    s2 = float(slot_width) / 2.0
+    t = float(wall_thickness)
+
+    if w2 <= 0.0 or h2 <= 0.0:
+        return []
+    if s2 <= 0.0 or t <= 0.0 or s2 >= min(w2, h2) or t >= min(w2, h2):
+        return [(-w2, -h2), (w2, -h2), (w2, h2), (-w2, h2)]
+
+    return [
+        # 下边（沿 +X）
+        (-w2, -h2), (-s2, -h2), (-s2, -h2 + t), (s2, -h2 + t), (s2, -h2),
+        # 右边（沿 +Y）
+        (w2, -h2), (w2, -s2), (w2 - t, -s2), (w2 - t, s2), (w2, s2),
+        # 上边（沿 -X）
+        (w2, h2), (s2, h2), (s2, h2 - t), (-s2, h2 - t), (-s2, h2),
+        # 左边（沿 -Y）
+        (-w2, h2), (-w2, s2), (-w2 + t, s2), (-w2 + t, -s2), (-w2, -s2),
+    ]
+
+
+def item_outline(item):
+    """按型材条目（需具备 width/height/slot_width/wall_thickness 属性）返回外轮廓。"""
+    return section_outline(item.width, item.height, item.slot_width, item.wall_thickness)
+
+
+# ---------------------------------------------------------------------------
+# 截面特性（面积、形心、惯性矩、截面模量），按参数缓存
+# ---------------------------------------------------------------------------
+
+# 铝合金（6063-T5）
+DENSITY = 2700.0  # kg/m³
+ELASTIC_MODULUS = 69000.0  # N/mm²（MPa）
+SHEAR_MODULUS = 25800.0  # N/mm²
+YIELD_STRENGTH = 160.0  # N/mm²
+
+SectionProperties = namedtuple("SectionProperties", (
+    "area",  # mm²
+    "cx", "cy",  # 形心，mm
+    "ix", "iy", "ixy",  # 对形心轴的惯性矩 / 惯性积，mm⁴（ix 绕 X 轴）
+    "wx", "wy",  # 截面模量，mm³
+    "j",  # 扭转常数（开口薄壁 + 中心方管近似），mm⁴
+    "linear_mass",  # kg/m
+))
+
+_EMPTY = SectionProperties(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def _polygon_moments(points):
+    """简单多边形（逆时针）对原点的 (面积, 静矩 Sx, 静矩 Sy, Ixx, Iyy, Ixy)。"""
+    n = len(points)
+    a_sum = sx = sy = ixx = iyy = ixy = 0.0
+    for i in range(n):
+        x0, y0 = points[i]
+        x1, y1 = points[(i + 1) % n]
+        a = x0 * y1 - x1 * y0
+        a_sum += a
+        sx += (x0 + x1) * a
+        sy += (y0 + y1) * a
+        ixx += (y0 * y0 + y0 * y1 + y1 * y1) * a
+        iyy += (x0 * x0 + x0 * x1 + x1 * x1) * a
+        ixy += (x0 * y1 + 2.0 * x0 * y0 + 2.0 * x1 * y1 + x1 * y0) * a
+    return a_sum / 2.0, sx / 6.0, sy / 6.0, ixx / 12.0, iyy / 12.0, ixy / 24.0
+
+
+def _centroidal(moments):
+    area, sx, sy, ixx, iyy, ixy = moments
+    if area <= 0.0:
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    cx = sx / area
+    cy = sy / area
+    # 平行移轴到形心
+    return area, cx, cy, ixx - area * cy * cy, iyy - area * cx * cx, ixy - area * cx * cy
+
+
+def polygon_properties(points):
+    """简单多边形（逆时针）的 (面积, 形心 x, 形心 y, Ix, Iy, Ixy)，惯性矩对形心轴。"""
+    if len(points) < 3:
+        return 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+    return _centroidal(_polygon_moments(points))
+
+
+def composite_properties(parts):
+    """由 [(多边形, 符号), ...] 组合（符号 +1 为实体、-1 为挖空）求截面特性，格式同 polygon_properties。"""
+    total = [0.0] * 6
+    for points, sign in parts:
+        if len(points) < 3:
+            continue
+        for k, value in enumerate(_polygon_moments(points)):
+            total[k] += sign * value
+    return _centroidal(total)
+
+
+def _rectangle(w2, h2):
+    return [(-w2, -h2), (w2, -h2), (w2, h2), (-w2, h2)]
+
+
+def _strip(p, q, thickness):
+    """线段 p -> q 沿法向加厚 thickness 的四边形（逆时针）。"""
+    dx, dy = q[0] - p[0], q[1] - p[1]
+    length = math.hypot(dx, dy)
+    if length <= 0.0:
+        return []
+    nx, ny = -dy / length * thickness / 2.0, dx / length * thickness / 2.0
+    return [(p[0] - nx, p[1] - ny), (q[0] - nx, q[1] - ny), (q[0] + nx, q[1] + ny), (p[0] + nx, p[1] + ny)]
+
+
+# T 槽截面模型的比例（相对槽宽 / 壁厚）
+_BORE_RATIO = 0.8  # 中心孔直径 / 槽宽
+_WEB_RATIO = 0.5  # 斜筋厚 / 壁厚
+_BORE_SIDES = 16
+
+
+def hollow_section_parts(width, height, slot_width, wall_thickness):
+    """T 槽型材的截面模型 [(多边形, 符号), ...]：
+
+    - 带槽外轮廓减去内腔矩形（四壁厚 wall_thickness，槽口处壁被切开）
+    - 中心方管（边长 槽宽 + 2 壁厚）减去中心孔（直径 0.8 槽宽）
+    - 中心方管四角到内腔四角的斜筋（厚 0.5 壁厚）
+
+    壁厚无效或内腔不存在时退化为实心外轮廓。
+    """
+    outline = section_outline(width, height, slot_width, wall_thickness)
+    if not outline:
+        return []
+    w2, h2 = float(width) / 2.0, float(height) / 2.0
+    s, t = float(slot_width), float(wall_thickness)
+    iw2, ih2 = w2 - t, h2 - t
+    if t <= 0.0 or iw2 <= 0.0 or ih2 <= 0.0:
+        return [(outline, 1)]
+    parts = [(outline, 1), (_rectangle(iw2, ih2), -1)]
+    c2 = min(s / 2.0 + t, iw2, ih2)
+    if c2 < min(iw2, ih2) and s > 0.0:
+        parts.append((_rectangle(c2, c2), 1))
+        r = min(s * _BORE_RATIO / 2.0, c2 - t / 2.0)
+        if r > 0.0:
+            bore = [(r * math.cos(2.0 * math.pi * k / _BORE_SIDES), r * math.sin(2.0 * math.pi * k / _BORE_SIDES))
+                    for k in range(_BORE_SIDES)]
+            parts.append((bore, -1))
+        for sx, sy in ((1, 1), (-1, 1), (-1, -1), (1, -1)):
+            parts.append((_strip((sx * c2, sy * c2), (sx * iw2, sy * ih2), t * _WEB_RATIO), 1))
+    return parts
+
+
+def _open_section_torsion(width, height, slot_width, wall_thickness):
+    """扭转常数：槽口把外壁切开，外壁与斜筋按开口薄壁 Σ b·t³/3，中心方管按闭口薄壁 4A²t/周长。"""
+    w, h, s, t = float(width), float(height), float(slot_width), float(wall_thickness)
+    if t <= 0.0 or t >= min(w, h) / 2.0:
+        return _rectangle_torsion(w, h)
+    walls = max(2.0 * (w - t) + 2.0 * (h - t) - 4.0 * s, 0.0)
+    j = walls * t ** 3 / 3.0
+    c = min(s + 2.0 * t, w - 2.0 * t, h - 2.0 * t)
+    if s > 0.0 and c < min(w, h) - 2.0 * t:
+        side = c - t
+        j += 4.0 * side ** 4 * t / (4.0 * side)
+        web = math.hypot(w / 2.0 - t - c / 2.0, h / 2.0 - t - c / 2.0)
+        j += 4.0 * web * (t * _WEB_RATIO) ** 3 / 3.0
+    return j
+
+
+def _rectangle_torsion(width, height):
+    """实心矩形的扭转常数近似 J = β·b·t³（b ≥ t）。"""
+    b, t = max(width, height), min(width, height)
+    if t <= 0.0:
+        return 0.0
+    r = t / b
+    return (1.0 / 3.0 - 0.21 * r * (1.0 - r ** 4 / 12.0)) * b * t ** 3
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_properties(width, height, slot_width, wall_thickness):
+    parts = hollow_section_parts(width, height, slot_width, wall_thickness)
+    if not parts:
+        return _EMPTY
+    area, cx, cy, ix, iy, ixy = composite_properties(parts)
+    if area <= 0.0:
+        return _EMPTY
+    outline = parts[0][0]
+    ymax = max(abs(y - cy) for _, y in outline)
+    xmax = max(abs(x - cx) for x, _ in outline)
+    return SectionProperties(
+        area, cx, cy, ix, iy, ixy,
+        ix / ymax if ymax else 0.0,
+        iy / xmax if xmax else 0.0,
+        _open_section_torsion(width, height, slot_width, wall_thickness),
+        area * 1e-6 * DENSITY,
+    )
+
+
+def section_properties(width, height, slot_width, wall_thickness):
+    """截面特性（空心 T 槽截面模型，见 hollow_section_parts）；参数按 0.001 mm 取整后缓存，同一截面只计算一次。"""
+    return _cached_properties(round(float(width), 3), round(float(height), 3),
+                              round(float(slot_width), 3), round(float(wall_thickness), 3))
+
+
+def item_properties(item):
+    """按型材条目返回截面特性。"""
+    return section_properties(item.width, item.height, item.slot_width, item.wall_thickness)
@@ -0,0 +1,521 @@
+"""型材吸附引擎：均匀网格哈希上的空间索引（端面中心 / 槽轴线 / 型材轴线）。
+
+- 每根型材只把轴线段登记到网格（按截面半径 + 容差膨胀），端面中心与四条槽轴线在窄相中精确计算
+- 对象增删、移动由 handlers 的合并刷新增量更新（update_objects / prune），改名与删除 / 移出场景
+  按 session_uid 识别（见 tracking）；仅在文件加载、撤销/重做或切换场景后全量重建
+- 拖拽时沿鼠标射线做 3D DDA，只检查射线经过的格子（及拾取半径覆盖的相邻格子）；万根型材下单次查询为亚毫秒级
+
+候选特征按拾取半径筛选：由屏幕像素（PICK_PIXELS）换算的世界半径，随视图深度线性增大，
+与视图缩放无关地保持相同的屏幕手感。毫米容差作用在新型材的端面上（端面中心位于射线上）：
+    端面对侧面（90°）：端面边缘距某根型材的槽轴线 ≤ 5 mm，新型材端面落在槽轴线上、沿侧面法线伸出
+    同轴：端面中心距某根同系列型材的端面中心 ≤ 3 mm，新型材沿原型材轴线继续延伸
+即射线到槽轴线的距离 ≤ 拾取半径 + 端面半径 + 5 mm，射线到端面中心的距离 ≤ 拾取半径 + 3 mm。
+两者同时命中时同轴优先（更具体的特征）。
+"""
+
+import math
+
+from .tracking import ObjectNames
+
+END_TO_SIDE_TOLERANCE = 5.0
+COAXIAL_TOLERANCE = 3.0
+# 拾取半径（屏幕像素），由拖拽操作符换算为随深度变化的世界半径（query_ray 的 pick）
+PICK_PIXELS = 12
+
+# 网格边长（米）：与常用型材长度同量级，每根型材只占少数几个格子
+CELL_SIZE = 0.25
+
+END_TO_SIDE = 'END_TO_SIDE'
+COAXIAL = 'COAXIAL'
+
+_EPS = 1e-12
+
+
+def _sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _add(a, b):
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+def _scale(a, s):
+    return (a[0] * s, a[1] * s, a[2] * s)
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _length(a):
+    return math.sqrt(_dot(a, a))
+
+
+def _normalized(a):
+    n = _length(a)
+    if n < _EPS:
+        return None
+    return (a[0] / n, a[1] / n, a[2] / n)
+
+
+class SnapMember:
+    """一根型材的吸附特征（世界空间，米）。
+
+    p0 / p1：两端端面中心；axis：p0 -> p1 单位向量；x / y：截面局部轴；w2 / h2：截面半宽 / 半高；
+    series：型材系列（同轴吸附只在同系列之间进行）。
+    """
+
+    __slots__ = ("name", "p0", "p1", "axis", "length", "x", "y", "w2", "h2", "series", "cells")
+
+    def __init__(self, name, p0, p1, x, y, w2, h2, series=""):
+        self.name = name
+        self.p0 = p0
+        self.p1 = p1
+        d = _sub(p1, p0)
+        self.length = _length(d)
+        self.axis = _normalized(d) or (0.0, 0.0, 1.0)
+        self.x = x
+        self.y = y
+        self.w2 = w2
+        self.h2 = h2
+        self.series = series
+        self.cells = ()
+
+    def radius(self):
+        return math.hypot(self.w2, self.h2)
+
+    def same_shape(self, other):
+        return (self.p0 == other.p0 and self.p1 == other.p1 and self.x == other.x
+                and self.y == other.y and self.w2 == other.w2 and self.h2 == other.h2
+                and self.series == other.series)
+
+    def slot_lines(self):
+        """四条槽轴线（侧面中线）：[(起点, 外法线), ...]，方向均与 axis 相同。"""
+        p0, x, y, w2, h2 = self.p0, self.x, self.y, self.w2, self.h2
+        return (
+            (_add(p0, _scale(x, w2)), x),
+            (_add(p0, _scale(x, -w2)), _scale(x, -1.0)),
+            (_add(p0, _scale(y, h2)), y),
+            (_add(p0, _scale(y, -h2)), _scale(y, -1.0)),
+        )
+
+
+class SnapResult:
+    """吸附结果：新型材端面中心 location、伸出方向 direction、截面 X 轴 axis_x。"""
+
+    __slots__ = ("kind", "location", "direction", "axis_x", "target", "distance", "depth")
+
+    def __init__(self, kind, location, direction, axis_x, target, distance, depth):
+        self.kind = kind
+        self.location = location
+        self.direction = direction
+        self.axis_x = axis_x
+        self.target = target
+        self.distance = distance
+        self.depth = depth
+
+    def label(self):
+        return "同轴" if self.kind == COAXIAL else "端面对侧面"
+
+    def matrix(self, length):
+        """新型材（长度 mm，网格沿局部 Z 居中）的世界变换矩阵。"""
+        from mathutils import Matrix
+
+        z = self.direction
+        x = self.axis_x
+        y = _cross(z, x)
+        center = _add(self.location, _scale(z, float(length) / 2000.0))
+        return Matrix((
+            (x[0], y[0], z[0], center[0]),
+            (x[1], y[1], z[1], center[1]),
+            (x[2], y[2], z[2], center[2]),
+            (0.0, 0.0, 0.0, 1.0),
+        ))
+
+
+def member_from_object(obj):
+    """由型材对象的世界矩阵与局部包围盒提取吸附特征；非型材对象返回 None。"""
+    from .bom import member_key
+
+    if member_key(obj) is None:
+        return None
+    bb = obj.bound_box
+    xs = [c[0] for c in bb]
+    ys = [c[1] for c in bb]
+    zs = [c[2] for c in bb]
+    cx = (min(xs) + max(xs)) / 2.0
+    cy = (min(ys) + max(ys)) / 2.0
+    mw = obj.matrix_world
+    p0 = tuple(mw @ _vector((cx, cy, min(zs))))
+    p1 = tuple(mw @ _vector((cx, cy, max(zs))))
+    col_x = tuple(mw.col[0][:3])
+    col_y = tuple(mw.col[1][:3])
+    sx = _length(col_x)
+    sy = _length(col_y)
+    x = _normalized(col_x) or (1.0, 0.0, 0.0)
+    y = _normalized(col_y) or (0.0, 1.0, 0.0)
+    w2 = (max(xs) - min(xs)) / 2.0 * sx
+    h2 = (max(ys) - min(ys)) / 2.0 * sy
+    return SnapMember(obj.name, p0, p1, x, y, w2, h2, str(obj.get("series", "")))
+
+
+def _vector(co):
+    from mathutils import Vector
+    return Vector(co)
+
+
+def _ray_segment(o, d, a, u, length):
+    """射线 o + t·d（t ≥ 0）与线段 a + s·u（0 ≤ s ≤ length）的最近点：返回 (距离, t, s)。"""
+    w0 = _sub(o, a)
+    b = _dot(d, u)
+    dd = _dot(d, w0)
+    e = _dot(u, w0)
+    denom = 1.0 - b * b
+    if denom > 1e-9:
+        t = max((b * e - dd) / denom, 0.0)
+        s = e + t * b
+    else:
+        s = e
+    s = min(max(s, 0.0), length)
+    q = _add(a, _scale(u, s))
+    t = max(_dot(_sub(q, o), d), 0.0)
+    return _length(_sub(_add(o, _scale(d, t)), q)), t, s
+
+
+def _ray_point(o, d, c):
+    """点到射线的距离与射线参数：(距离, t)；点在射线起点后方时返回 (inf, t)。"""
+    v = _sub(c, o)
+    t = _dot(v, d)
+    if t < 0.0:
+        return math.inf, t
+    return math.sqrt(max(_dot(v, v) - t * t, 0.0)), t
+
+
+class SnapIndex:
+    """均匀网格哈希：格子 -> 型材名称集合；型材名称 -> SnapMember。"""
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell = float(cell_size)
+        self.members = {}
+        self.grid = {}
+        self._objects = ObjectNames()
+        self.scene_name = None
+        self.valid = False
+        # 每次全量重建递增；依赖本索引的派生索引（干涉、连接）据此判断是否需要重建
+        self.generation = 0
+        self._bounds = None
+        # 登记时的膨胀量取两种容差中较大者
+        self._tol = max(END_TO_SIDE_TOLERANCE, COAXIAL_TOLERANCE) / 1000.0
+
+    def __len__(self):
+        return len(self.members)
+
+    def invalidate(self):
+        self.valid = False
+
+    def clear(self):
+        self.members.clear()
+        self.grid.clear()
+        self._objects.clear()
+        self._bounds = None
+
+    # -- 登记 ---------------------------------------------------------------
+
+    def _cells_for(self, m):
+        """沿轴线按半格步长采样，覆盖每个采样点膨胀后的包围盒，得到保守的格子集合。"""
+        inv = 1.0 / self.cell
+        step = self.cell / 2.0
+        pad = m.radius() + self._tol + step / 2.0
+        n = int(m.length / step) + 1
+        cells = set()
+        floor = math.floor
+        for i in range(n + 1):
+            s = min(i * step, m.length)
+            p = _add(m.p0, _scale(m.axis, s))
+            x0, x1 = floor((p[0] - pad) * inv), floor((p[0] + pad) * inv)
+            y0, y1 = floor((p[1] - pad) * inv), floor((p[1] + pad) * inv)
+            z0, z1 = floor((p[2] - pad) * inv), floor((p[2] + pad) * inv)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    for cz in range(z0, z1 + 1):
+                        cells.add((cx, cy, cz))
+        return tuple(cells)
+
+    def insert(self, m):
+        self.remove(m.name)
+        m.cells = self._cells_for(m)
+        grid = self.grid
+        for c in m.cells:
+            bucket = grid.get(c)
+            if bucket is None:
+                grid[c] = {m.name}
+            else:
+                bucket.add(m.name)
+        self.members[m.name] = m
+        pad = m.radius() + self._tol
+        lo = tuple(min(m.p0[i], m.p1[i]) - pad for i in range(3))
+        hi = tuple(max(m.p0[i], m.p1[i]) + pad for i in range(3))
+        if self._bounds is None:
+            self._bounds = (lo, hi)
+        else:
+            blo, bhi = self._bounds
+            self._bounds = (
+                tuple(min(a, b) for a, b in zip(blo, lo)),
+                tuple(max(a, b) for a, b in zip(bhi, hi)),
+            )
+
+    def remove(self, name):
+        m = self.members.pop(name, None)
+        if m is None:
+            return False
+        grid = self.grid
+        for c in m.cells:
+            bucket = grid.get(c)
+            if bucket is not None:
+                bucket.discard(name)
+                if not bucket:
+                    del grid[c]
+        return True
+
+    # -- 与场景同步 -----------------------------------------------------------
+
+    def rebuild(self, scene):
+        """全量重建：仅在文件加载、撤销/重做或切换场景后调用。"""
+        self.clear()
+        for obj in scene.objects:
+            m = member_from_object(obj)
+            if m is not None:
+                self.insert(m)
+                self._objects.register(obj, True)
+        self.scene_name = scene.name
+        self.valid = True
+        self.generation += 1
+
+    def update_objects(self, objects):
+        """处理新增、移动或属性变化的对象（来自 depsgraph 更新，含纯变换更新）。
+
+        返回几何实际发生变化（新增、移动或移除）的型材名称列表。
+        """
+        changed = []
+        for obj in objects:
+            try:
+                name = obj.name
+                previous = self._objects.previous(obj)
+                m = member_from_object(obj) if obj.users else None
+            except ReferenceError:
+                # 对象在合并窗口内已被删除，交给 prune 处理
+                continue
+            # 改名：移除旧名称下的型材
+            if previous is not None and self.remove(previous):
+                changed.append(previous)
+            self._objects.register(obj, m is not None)
+            if m is None:
+                if self.remove(name):
+                    changed.append(name)
+                continue
+            old = self.members.get(name)
+            if old is not None and old.same_shape(m):
+                continue
+            self.insert(m)
+            changed.append(name)
+        return changed
+
+    def prune(self, scene):
+        """剔除已删除或已移出 scene 的对象的型材（场景成员变化时调用），返回被剔除的名称列表。"""
+        return [name for name in self._objects.missing(scene) if self.remove(name)]
+
+    # -- 查询 ---------------------------------------------------------------
+
+    def nearby(self, point, radius):
+        """返回包围盒与以 point 为中心、radius 为半径的立方体相交格子中的型材名称集合。"""
+        inv = 1.0 / self.cell
+        floor = math.floor
+        lo = [floor((point[i] - radius) * inv) for i in range(3)]
+        hi = [floor((point[i] + radius) * inv) for i in range(3)]
+        names = set()
+        grid = self.grid
+        for cx in range(lo[0], hi[0] + 1):
+            for cy in range(lo[1], hi[1] + 1):
+                for cz in range(lo[2], hi[2] + 1):
+                    bucket = grid.get((cx, cy, cz))
+                    if bucket:
+                        names |= bucket
+        return names
+
+    def neighbours(self, name):
+        """与指定型材至少共享一个格子的其他型材名称集合（宽相候选）。"""
+        m = self.members.get(name)
+        if m is None:
+            return set()
+        grid = self.grid
+        names = set()
+        for c in m.cells:
+            bucket = grid.get(c)
+            if bucket:
+                names |= bucket
+        names.discard(name)
+        return names
+
+    def _far_depth(self, o):
+        """射线起点到索引包围盒最远点的距离（拾取半径的上界按此深度计算）。"""
+        lo, hi = self._bounds
+        center = tuple((a + b) / 2.0 for a, b in zip(lo, hi))
+        return _length(_sub(center, o)) + _length(_sub(hi, lo)) / 2.0
+
+    def _clip_ray(self, o, d, pad=0.0):
+        """射线与（向外扩大 pad 的）索引包围盒求交，返回 (t_enter, t_exit)；不相交返回 None。"""
+        if self._bounds is None:
+            return None
+        lo, hi = self._bounds
+        lo = tuple(v - pad for v in lo)
+        hi = tuple(v + pad for v in hi)
+        t0, t1 = 0.0, math.inf
+        for i in range(3):
+            if abs(d[i]) < _EPS:
+                if o[i] < lo[i] or o[i] > hi[i]:
+                    return None
+                continue
+            a = (lo[i] - o[i]) / d[i]
+            b = (hi[i] - o[i]) / d[i]
+            if a > b:
+                a, b = b, a
+            t0 = max(t0, a)
+            t1 = min(t1, b)
+            if t0 > t1:
+                return None
+        return t0, t1
+
+    def _walk(self, o, d, t_enter, t_exit):
+        """3D DDA（Amanatides & Woo）：按射线经过顺序产出 (格子, 进入该格的 t)。"""
+        cell = self.cell
+        p = _add(o, _scale(d, t_enter))
+        idx = [math.floor(p[i] / cell) for i in range(3)]
+        step = [0, 0, 0]
+        t_max = [math.inf] * 3
+        t_delta = [math.inf] * 3
+        for i in range(3):
+            if d[i] > _EPS:
+                step[i] = 1
+                t_max[i] = t_enter + ((idx[i] + 1) * cell - p[i]) / d[i]
+                t_delta[i] = cell / d[i]
+            elif d[i] < -_EPS:
+                step[i] = -1
+                t_max[i] = t_enter + (idx[i] * cell - p[i]) / d[i]
+                t_delta[i] = -cell / d[i]
+        t = t_enter
+        while t <= t_exit:
+            yield (idx[0], idx[1], idx[2]), t
+            i = 0 if t_max[0] < t_max[1] else 1
+            if t_max[2] < t_max[i]:
+                i = 2
+            t = t_max[i]
+            idx[i] += step[i]
+            t_max[i] += t_delta[i]
+
+    def _cells_near(self, key, t_cell, reach):
+        """DDA 当前格子及拾取半径覆盖的相邻格子（reach(t) 为深度 t 处的世界半径）。"""
+        # 格子内各点的深度不超过进入深度 + 格子对角线
+        n = math.ceil(reach(t_cell + self.cell * math.sqrt(3.0)) / self.cell)
+        if n <= 0:
+            yield key
+            return
+        x, y, z = key
+        for cx in range(x - n, x + n + 1):
+            for cy in range(y - n, y + n + 1):
+                for cz in range(z - n, z + n + 1):
+                    yield cx, cy, cz
+
+    def query_ray(self, origin, direction, exclude=(), pick=(0.0, 0.0), face=0.0, series=None):
+        """沿射线查找最近的吸附特征，返回 SnapResult 或 None。
+
+        pick：拾取半径 (offset, slope)（米），深度 t 处为 offset + slope·t：透视视图 slope > 0，
+        正交视图 slope = 0；缺省为 0，只按毫米容差判定。
+        face：新型材端面的半径（米，截面半宽与半高中较小者），端面对侧面的 5 mm 容差从端面边缘算起。
+        series：新型材的系列；给出时只与同系列型材同轴吸附。
+
+        只检查射线经过的格子及拾取半径覆盖的相邻格子。同轴优先于端面对侧面（与深度无关），因此：
+        - 已命中同轴时，走到格子进入深度超过命中深度 + 同轴容差为止（更近的同轴端面
+          只可能在已走过的格子中），随后立即返回
+        - 只命中端面对侧面时继续走完整条射线，更远处的同轴端面仍优先
+        """
+        d = _normalized(tuple(direction))
+        if d is None or not self.members:
+            return None
+        o = tuple(origin)
+        offset, slope = pick
+        side_tol = END_TO_SIDE_TOLERANCE / 1000.0 + face
+        coax_tol = COAXIAL_TOLERANCE / 1000.0
+
+        def reach(t):
+            return offset + slope * max(t, 0.0)
+
+        span = self._clip_ray(o, d, reach(self._far_depth(o)) + face)
+        if span is None:
+            return None
+
+        members = self.members
+        grid = self.grid
+        seen = set(exclude)
+        visited = set()
+        best = None
+        best_rank = None
+
+        for key, t_cell in self._walk(o, d, *span):
+            if best is not None and best.kind == COAXIAL and t_cell > best.depth + coax_tol:
+                break
+            for cell in self._cells_near(key, t_cell, lambda t: reach(t) + face):
+                if cell in visited:
+                    continue
+                visited.add(cell)
+                bucket = grid.get(cell)
+                if not bucket:
+                    continue
+                for name in bucket:
+                    if name in seen:
+                        continue
+                    seen.add(name)
+                    m = members[name]
+                    # 粗筛：射线与轴线段的距离超出截面半径 + 容差 + 拾取半径时，端面与槽轴线都不可能命中
+                    dist, t, _ = _ray_segment(o, d, m.p0, m.axis, m.length)
+                    if dist > m.radius() + side_tol + reach(t + m.length + m.radius()):
+                        continue
+                    if series is None or m.series == series:
+                        for end, outward in ((m.p0, _scale(m.axis, -1.0)), (m.p1, m.axis)):
+                            dist, t = _ray_point(o, d, end)
+                            if dist <= coax_tol + reach(t):
+                                # 同轴：沿原轴线向外延伸；截面 X 轴与原型材一致（反向时取反保持右手系）
+                                ax = m.x if outward is m.axis else _scale(m.x, -1.0)
+                                rank = (0, t)
+                                if best_rank is None or rank < best_rank:
+                                    best = SnapResult(COAXIAL, end, outward, ax, name, dist, t)
+                                    best_rank = rank
+                    for start, normal in m.slot_lines():
+                        dist, t, s = _ray_segment(o, d, start, m.axis, m.length)
+                        if dist <= side_tol + reach(t):
+                            rank = (1, t)
+                            if best_rank is None or rank < best_rank:
+                                loc = _add(start, _scale(m.axis, s))
+                                best = SnapResult(END_TO_SIDE, loc, normal, m.axis, name, dist, t)
+                                best_rank = rank
+        return best
+
+
+index = SnapIndex()
+
+
+def get_index(scene):
+    """返回与 scene 对应的吸附索引；失效或场景切换时先重建。"""
+    if not index.valid or index.scene_name != scene.name:
+        index.rebuild(scene)
+    return index
+
+
+def cached_index(scene):
+    """已与 scene 同步的吸附索引；失效时返回 None（不重建，供面板绘制使用）。"""
+    if not index.valid or index.scene_name != scene.name:
+        return None
+    return index
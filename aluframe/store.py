@@ -0,0 +1,326 @@
+"""成员存储：场景中全部型材的紧凑数组，供批量查询直接做数组运算。
+
+- 每根型材一行：型材表序号（int32）、长度 mm（float64）、世界变换（4×4 float64）、标志（uint8）；
+  型材表记录本文件用到的 (型材 ID, 型号, 标准)，行只保存序号
+- 独立型材对象一行，名称为对象名；装配体中的每个点一行，名称为“对象名#点序号”（与 bom 一致）
+- 场景对象是唯一的数据来源，存储只是由它派生的索引（与 snapping 相同）：不随 .blend 保存，
+  文件加载、撤销 / 重做后失效，首次读取（get_index）时整体重建，之后由 handlers 的合并刷新
+  按变化的对象增量更新；删除或移出场景的对象按 session_uid 识别（见 tracking）
+- BOM 分组（bom.BomIndex）是存储的视图：写入 / 删除行时同步维护，面板、导出与下料读到的是同一份数据
+- 删除一行时用最后一行填补空位，数组始终连续，view() 返回的切片可直接参与 NumPy 运算
+
+BOM 汇总、下料需求、导出等批量计算读取这里的数组，不逐对象访问 RNA。
+"""
+
+import numpy as np
+
+from .bom import LENGTH_DECIMALS, BomIndex
+from .tracking import ObjectNames
+
+# 标志位
+FLAG_ASSEMBLY = 1  # 装配体中的点
+FLAG_UNKNOWN = 2  # 型材 ID 不在当前目录中
+
+_INITIAL_CAPACITY = 256
+
+
+def _euler_xyz_matrices(rotation):
+    """XYZ 欧拉角（n×3，弧度）转旋转矩阵（n×3×3），与 mathutils.Euler(…, 'XYZ').to_matrix() 一致。"""
+    cx, cy, cz = np.cos(rotation).T
+    sx, sy, sz = np.sin(rotation).T
+    m = np.empty((len(rotation), 3, 3))
+    m[:, 0, 0] = cy * cz
+    m[:, 0, 1] = sx * sy * cz - cx * sz
+    m[:, 0, 2] = cx * sy * cz + sx * sz
+    m[:, 1, 0] = cy * sz
+    m[:, 1, 1] = sx * sy * sz + cx * cz
+    m[:, 1, 2] = cx * sy * sz - sx * cz
+    m[:, 2, 0] = -sy
+    m[:, 2, 1] = sx * cy
+    m[:, 2, 2] = cx * cy
+    return m
+
+
+def _assembly_rows(obj):
+    """装配体的 [(成员名称, (型材 ID, 型号, 标准), 长度, 世界矩阵 4×4), ...]，矩阵整体向量化计算。"""
+    from .assembly import point_entries, read_points
+
+    co, unit, length, rotation, scale = read_points(obj.data)
+    n = len(unit)
+    local = np.zeros((n, 4, 4))
+    local[:, :3, :3] = _euler_xyz_matrices(rotation.astype(np.float64)) * scale.astype(np.float64)[:, None, :]
+    local[:, :3, 3] = co
+    local[:, 3, 3] = 1.0
+    world = np.asarray(obj.matrix_world, dtype=np.float64) @ local
+    entries = point_entries(obj.data)
+    name = obj.name
+    rows = []
+    for i, (u, value) in enumerate(zip(unit.tolist(), length.tolist())):
+        if 0 <= u < len(entries) and entries[u] is not None:
+            rows.append((f"{name}#{i}", entries[u], value, world[i]))
+    return rows
+
+
+def member_type(obj):
+    """独立型材对象的 (型材 ID, 型号, 标准)；非型材对象返回 None（判定与 bom.member_key 相同）。"""
+    if "alu_type" not in obj or "length" not in obj:
+        return None
+    return (str(obj.get("alu_uid", "")), str(obj["alu_type"]), str(obj.get("standard", "")))
+
+
+class MemberStore:
+    """型材成员的紧凑数组存储（场景对象是它的同步视图）。"""
+
+    def __init__(self):
+        self.types = []  # 型材表：[(型材 ID, 型号, 标准), ...]
+        self._type_index = {}
+        self.names = []
+        self._row = {}  # 成员名称 -> 行号
+        self.owners = {}  # 装配体对象名称 -> 其成员名称集合
+        self._objects = ObjectNames()
+        self.bom = BomIndex()
+        self.count = 0
+        self._allocate(_INITIAL_CAPACITY)
+        self.scene_name = None
+        self.valid = False
+        self.version = 0
+
+    # ------------------------------------------------------------------
+    # 数组管理
+    # ------------------------------------------------------------------
+
+    def _allocate(self, capacity):
+        self.profile = np.zeros(capacity, dtype=np.int32)
+        self.length = np.zeros(capacity, dtype=np.float64)
+        self.matrix = np.zeros((capacity, 4, 4), dtype=np.float64)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+
+    def _grow(self, needed):
+        capacity = len(self.profile)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        old = (self.profile, self.length, self.matrix, self.flags)
+        self._allocate(capacity)
+        for new, values in zip((self.profile, self.length, self.matrix, self.flags), old):
+            new[:self.count] = values[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def invalidate(self):
+        self.valid = False
+
+    def clear(self):
+        self.types.clear()
+        self._type_index.clear()
+        self.names.clear()
+        self._row.clear()
+        self.owners.clear()
+        self._objects.clear()
+        self.bom.clear()
+        self.count = 0
+
+    def _touch(self):
+        self.version += 1
+
+    def type_id(self, entry):
+        """型材表序号，(型材 ID, 型号, 标准) 首次出现时追加。"""
+        i = self._type_index.get(entry)
+        if i is None:
+            i = self._type_index[entry] = len(self.types)
+            self.types.append(entry)
+        return i
+
+    def _set(self, name, entry, length, matrix, flags):
+        row = self._row.get(name)
+        if row is None:
+            row = self.count
+            self._grow(row + 1)
+            self._row[name] = row
+            self.names.append(name)
+            self.count += 1
+        self.profile[row] = self.type_id(entry)
+        self.length[row] = length
+        self.matrix[row] = matrix
+        self.flags[row] = flags
+        self.bom.set(name, entry[1:] + (round(length, LENGTH_DECIMALS),))
+
+    def _remove(self, name):
+        row = self._row.pop(name, None)
+        if row is None:
+            return
+        self.bom.discard(name)
+        last = self.count - 1
+        if row != last:
+            # 最后一行移到空位
+            moved = self.names[last]
+            self.names[row] = moved
+            self._row[moved] = row
+            for values in (self.profile, self.length, self.matrix, self.flags):
+                values[row] = values[last]
+        self.names.pop()
+        self.count = last
+
+    def _object_flags(self, entry):
+        from .catalog import get_catalog
+
+        return 0 if get_catalog().get(entry[0]) is not None else FLAG_UNKNOWN
+
+    def _set_object(self, obj):
+        """按对象当前状态写入 / 删除其行，返回是否有变化（对象改名时先移除旧名称的行）。"""
+        name = obj.name
+        previous = self._objects.previous(obj)
+        renamed = self._forget(previous) if previous is not None else False
+        changed = self._set_rows(obj)
+        self._objects.register(obj, name in self._row or name in self.owners)
+        return changed or renamed
+
+    def _forget(self, name):
+        if name in self.owners:
+            return self._set_owner(name, ())
+        if name in self._row:
+            self._remove(name)
+            return True
+        return False
+
+    def _set_rows(self, obj):
+        name = obj.name
+        if name in self.owners or obj.get("alu_assembly"):
+            return self._set_owner(name, _assembly_rows(obj) if obj.users else ())
+        entry = member_type(obj) if obj.users else None
+        if entry is None:
+            if name in self._row:
+                self._remove(name)
+                return True
+            return False
+        try:
+            length = float(obj["length"])
+        except (TypeError, ValueError):
+            return False
+        self._set(name, entry, length, obj.matrix_world, self._object_flags(entry))
+        return True
+
+    def _set_owner(self, owner, rows):
+        old = self.owners.pop(owner, ())
+        new = {row[0] for row in rows}
+        for name in old:
+            if name not in new:
+                self._remove(name)
+        for name, entry, length, matrix in rows:
+            self._set(name, entry, length, matrix, FLAG_ASSEMBLY | self._object_flags(entry))
+        if new:
+            self.owners[owner] = new
+        return bool(old) or bool(new)
+
+    # ------------------------------------------------------------------
+    # 与场景同步
+    # ------------------------------------------------------------------
+
+    def rebuild(self, scene):
+        """全量重建：文件加载、撤销 / 重做或切换场景后首次读取时调用。"""
+        self.clear()
+        for obj in scene.objects:
+            self._set_object(obj)
+        self.scene_name = scene.name
+        self.valid = True
+        self._touch()
+
+    def update_objects(self, objects):
+        """处理发生变化（含纯变换）的对象，返回是否有变化。"""
+        changed = False
+        for obj in objects:
+            try:
+                changed |= self._set_object(obj)
+            except ReferenceError:
+                # 对象在合并窗口内已被删除，交给 prune 处理
+                continue
+        if changed:
+            self._touch()
+        return changed
+
+    def prune(self, scene):
+        """剔除已删除或已移出 scene 的对象的成员（场景成员变化时调用），返回是否有变化。"""
+        removed = False
+        for name in self._objects.missing(scene):
+            removed |= self._forget(name)
+        if removed:
+            self._touch()
+        return removed
+
+    # ------------------------------------------------------------------
+    # 查询（数组运算）
+    # ------------------------------------------------------------------
+
+    def view(self):
+        """(型材表序号, 长度, 世界矩阵 n×4×4, 标志) 的连续切片（只读使用）。"""
+        n = self.count
+        return self.profile[:n], self.length[:n], self.matrix[:n], self.flags[:n]
+
+    def row(self, name):
+        return self._row.get(name)
+
+    def summary(self):
+        """按 (型号, 标准, 长度) 分组计数：返回 (型材表序号, 长度, 数量) 三个数组，排序与 BOM 一致。
+
+        同型号同标准的不同型材 ID 合为一组（与 bom.member_key 相同），序号取该组的一个代表。
+        """
+        profile, length, _, _ = self.view()
+        if not len(profile):
+            return np.zeros(0, np.int32), np.zeros(0), np.zeros(0, np.int64)
+        # 型材表序号换成 (型号, 标准) 的排序名次
+        keys = sorted({entry[1:] for entry in self.types})
+        position = {key: i for i, key in enumerate(keys)}
+        rank = np.array([position[entry[1:]] for entry in self.types], dtype=np.int64)
+        representative = np.empty(len(keys), dtype=np.int32)
+        representative[rank] = np.arange(len(self.types), dtype=np.int32)
+        pairs = np.stack((rank[profile].astype(np.float64), np.round(length, LENGTH_DECIMALS)), axis=1)
+        unique, counts = np.unique(pairs, axis=0, return_counts=True)
+        return representative[unique[:, 0].astype(np.int64)], unique[:, 1], counts
+
+    def bom_rows(self):
+        """[(型号, 标准, 长度, 数量), ...]：与 bom.BomIndex.sorted_rows 的分组和排序一致。"""
+        profile, length, counts = self.summary()
+        return [(self.types[p][1], self.types[p][2], value, count)
+                for p, value, count in zip(profile.tolist(), length.tolist(), counts.tolist())]
+
+    def summary_rows(self):
+        """BOM 汇总行（列同 bom.SUMMARY_MASS_COLUMNS）：在 SUMMARY_COLUMNS 之后附单重与总质量。"""
+        from .bom import standard_label
+        from .mass import linear_mass_table
+
+        table = linear_mass_table(self).tolist()
+        profile, length, counts = self.summary()
+        for p, value, count in zip(profile.tolist(), length.tolist(), counts.tolist()):
+            _, alu_type, standard = self.types[p]
+            kg = table[p]
+            yield (alu_type, standard_label(standard), value, count, round(value * count, 1),
+                   round(kg, 3), round(kg * value * count / 1000.0, 2))
+
+    def endpoints(self):
+        """每根型材两个端面中心（世界坐标，米）：(起点 n×3, 终点 n×3)；型材沿局部 Z 居中拉伸。"""
+        _, length, matrix, _ = self.view()
+        axis = matrix[:, :3, 2]
+        norm = np.linalg.norm(axis, axis=1)
+        norm[norm == 0.0] = 1.0
+        half = axis * (length / 2000.0 / norm)[:, None]
+        center = matrix[:, :3, 3]
+        return center - half, center + half
+
+
+index = MemberStore()
+
+
+def get_index(scene):
+    """返回与 scene 对应的成员存储；失效或场景切换时先重建。"""
+    if not index.valid or index.scene_name != scene.name:
+        index.rebuild(scene)
+    return index
+
+
+def cached_index(scene):
+    """已与 scene 同步的成员存储；失效时返回 None（不重建，供面板绘制使用）。"""
+    if not index.valid or index.scene_name != scene.name:
+        return None
+    return index
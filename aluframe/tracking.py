@@ -0,0 +1,40 @@
+"""对象登记：按对象名称做键的增量索引（成员存储、吸附索引）共用的改名与移除识别。
+
+索引只保存对象名称；对象改名或离开场景后名称不再可靠，这里按 session_uid 记录登记时的名称：
+
+- 改名：对象再次出现在更新列表中时，按 session_uid 取回旧名称（previous）
+- 删除 / 移出场景：场景成员变化（depsgraph 报告场景或集合更新）时，与 scene.objects 的
+  session_uid 比较（missing）；仍有其他用户、只是被移出场景的对象，以及同一合并窗口内
+  “删除 + 新增”（对象总数不变）的情况都能识别
+"""
+
+
+class ObjectNames:
+    """对象 session_uid -> 登记时的对象名称。"""
+
+    def __init__(self):
+        self._names = {}
+
+    def __len__(self):
+        return len(self._names)
+
+    def clear(self):
+        self._names.clear()
+
+    def previous(self, obj):
+        """对象改名前登记的名称；未登记或名称未变时返回 None。"""
+        name = self._names.get(obj.session_uid)
+        return name if name is not None and name != obj.name else None
+
+    def register(self, obj, present):
+        """present 为真时按当前名称登记 obj，否则注销。"""
+        if present:
+            self._names[obj.session_uid] = obj.name
+        else:
+            self._names.pop(obj.session_uid, None)
+
+    def missing(self, scene):
+        """已登记但不在 scene 中（已删除或已移出场景）的对象：注销并返回其登记名称列表。"""
+        alive = {obj.session_uid for obj in scene.objects}
+        gone = [uid for uid in self._names if uid not in alive]
+        return [self._names.pop(uid) for uid in gone]
@@ -10,19 +10,39 @@ def draw_aluframe_header(self, context):
     row.operator("ed.undo", text="撤销")
     row.operator("ed.redo", text="重做")
     row.operator("aluframe.export_bom", text="导出BOM")
+    row.operator("aluframe.optimize_cutlist", text="下料优化")
     # 快捷：添加当前选中型材
     row.operator("aluframe.add_selected_profile", text="添加当前型材")
 
 
+def draw_import_menu(self, context):
+    self.layout.operator("aluframe.import_aluframe", text="AluFrame 装配 (.aluframe)")
+
+
+def draw_export_menu(self, context):
+    self.layout.operator("aluframe.export_aluframe", text="AluFrame 装配 (.aluframe)")
+
+
 def register():
     try:
         bpy.types.VIEW3D_HT_header.append(draw_aluframe_header)
     except Exception as e:
         print(f"[AluFrame] Header UI 注册失败：{e}")
+    # 文件 > 导入 / 导出
+    try:
+        bpy.types.TOPBAR_MT_file_import.append(draw_import_menu)
+        bpy.types.TOPBAR_MT_file_export.append(draw_export_menu)
+    except Exception as e:
+        print(f"[AluFrame] 导入 / 导出菜单注册失败：{e}")
 
 
 def unregister():
     try:
         bpy.types.VIEW3D_HT_header.remove(draw_aluframe_header)
+    except Exception:
+        pass
+    try:
+        bpy.types.TOPBAR_MT_file_import.remove(draw_import_menu)
+        bpy.types.TOPBAR_MT_file_export.remove(draw_export_menu)
     except Exception:
         pass
\ No newline at end of file
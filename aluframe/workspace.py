@@ -33,42 +33,44 @@ def ensure_workspace():
         pass
 
 
-def set_units_millimeters_deferred():
-    """将场景单位设置为毫米（兼容 3.5/4.x），在 scene 可用时执行。
+def set_units_millimeters(scene):
+    """将场景单位设置为毫米（兼容 3.5/4.x）。
 
     - system 统一设为 METRIC
     - 若支持 length_unit，则设为 MILLIMETERS
     - 统一将 scale_length 设为 0.001（1 BU = 1mm），确保旧版本表现一致
     """
-
-    def _apply():
+    us = scene.unit_settings
+    try:
+        us.system = 'METRIC'
+    except Exception:
+        pass
+    if hasattr(us, 'length_unit'):
         try:
-            scene = getattr(bpy.context, 'scene', None)
-            if scene is None and len(bpy.data.scenes) > 0:
-                scene = bpy.data.scenes[0]
-            if scene is None:
-                return 0.25
-
-            us = scene.unit_settings
-            try:
-                us.system = 'METRIC'
-            except Exception:
-                pass
-            if hasattr(us, 'length_unit'):
-                try:
-                    us.length_unit = 'MILLIMETERS'
-                except Exception:
-                    pass
-            try:
-                us.scale_length = 0.001
-            except Exception:
-                pass
-            return None  # 完成后停止计时器
+            us.length_unit = 'MILLIMETERS'
         except Exception:
-            return 0.25
-
+            pass
     try:
-        bpy.app.timers.register(_apply)
+        us.scale_length = 0.001
     except Exception:
-        # 老版本若无 timers.register，则静默跳过
-        pass
\ No newline at end of file
+        pass
+
+
+def setup_new_file():
+    """新文件 / 启动文件的场景设置：毫米单位与 AluFrame 工作台。
+
+    由 handlers 在 load_post / load_factory_startup_post 中调用（插件在会话中途启用时另调用一次），
+    已保存的文件保持用户自己的设置，不做修改。
+    """
+    if bpy.data.filepath:
+        return
+    scene = getattr(bpy.context, 'scene', None)
+    if scene is None and len(bpy.data.scenes) > 0:
+        scene = bpy.data.scenes[0]
+    if scene is not None:
+        set_units_millimeters(scene)
+    # 尝试创建并切换到 AluFrame 工作台（非强制，失败不影响使用）
+    try:
+        ensure_workspace()
+    except Exception as e:
+        print(f"[AluFrame] 工作台初始化跳过：{e}")
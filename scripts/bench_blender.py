@@ -0,0 +1,210 @@
+"""
+Blender 后台基准套件：在不同规模的合成装配上测量插件各环节耗时，输出 JSON，可与基线比较。
+
+运行方式：
+  blender --background --factory-startup --python-exit-code 1 --python scripts/bench_blender.py -- \
+      [--sizes 100,1000,10000,50000] [--mode ANALYTIC] [--output bench.json] \
+      [--baseline 基线.json] [--tolerance 0.25]
+
+测量项（秒）：
+- register：插件注册（全局一次）
+- add：批量创建 N 根型材（batch.add_profiles_batch，单个撤销步骤）
+- evaluate：创建后的首次 depsgraph 求值
+- bom：BOM 索引全量重建并生成逐根下料行
+- save / load：保存为 .blend、重新打开
+- delete：全选后执行 aluframe.delete_selected
+
+给出 --baseline 时逐项比较：比基线慢超过 tolerance（相对）且超过 MIN_REGRESSION_SECONDS（绝对）
+记为回归，脚本以退出码 1 结束（需配合 --python-exit-code）。
+
+基线不随仓库提供（耗时取决于机器与 Blender 版本）：在同一台机器上先用修改前的代码运行一次，
+把 --output 写出的文件作为之后各次运行的 --baseline，例如
+  git stash && blender --background --factory-startup --python scripts/bench_blender.py -- --output bench_base.json
+  git stash pop && blender --background --factory-startup --python-exit-code 1 \
+      --python scripts/bench_blender.py -- --output bench.json --baseline bench_base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+# 低于该绝对差值的变慢视为噪声（秒）
+MIN_REGRESSION_SECONDS = 0.005
+METRICS = ("add", "evaluate", "bom", "save", "load", "delete")
+
+
+def repo_root():
+    env = os.environ.get("REPO_ROOT")
+    if env:
+        return env
+    here = os.path.abspath(os.path.dirname(__file__))
+    return os.path.abspath(os.path.join(here, os.pardir))
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_blender.py")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="逗号分隔的型材数量")
+    parser.add_argument("--mode", default="ANALYTIC", help="几何后端（aluframe_geometry_mode）")
+    parser.add_argument("--output", default="", help="结果 JSON 路径；缺省只打印")
+    parser.add_argument("--baseline", default="", help="基线 JSON 路径")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="相对基线允许的变慢比例")
+    parser.add_argument("--seed", type=int, default=1, help="合成装配的随机种子")
+    args = parser.parse_args(argv)
+    args.sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    return args
+
+
+def synthetic_records(count, uids, seed):
+    """合成装配：网格排布、三个轴向交替、长度取 200–3000 mm（10 mm 取整，便于共享网格）。"""
+    from mathutils import Matrix
+
+    rng = random.Random(seed)
+    rotations = (
+        Matrix.Identity(4),
+        Matrix.Rotation(1.5707963267948966, 4, 'X'),
+        Matrix.Rotation(1.5707963267948966, 4, 'Y'),
+    )
+    side = max(1, int(round(count ** (1.0 / 3.0))))
+    records = []
+    for i in range(count):
+        x, y, z = i % side, (i // side) % side, i // (side * side)
+        length = float(rng.randrange(20, 301) * 10)
+        matrix = Matrix.Translation((x * 0.5, y * 0.5, z * 0.5)) @ rotations[i % 3]
+        records.append((uids[i % len(uids)], length, matrix))
+    return records
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - t0, value
+
+
+def _clear_scene(bpy):
+    bpy.data.batch_remove(list(bpy.data.objects))
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def run_size(bpy, count, args, uids, blend_path):
+    from aluframe import bom, gn, store
+    from aluframe.batch import add_profiles_batch
+
+    _clear_scene(bpy)
+    gn.reset_mesh_cache()
+    context = bpy.context
+    context.scene.aluframe_geometry_mode = args.mode
+    records = synthetic_records(count, uids, args.seed)
+    result = {}
+
+    result["add"], (created, _) = _timed(lambda: add_profiles_batch(context, records))
+    result["evaluate"], _ = _timed(context.view_layer.update)
+
+    def compute_bom():
+        store.index.invalidate()
+        index = bom.get_index(context.scene)
+        for _ in index.member_rows():
+            pass
+        return index.total_count
+
+    result["bom"], total = _timed(compute_bom)
+    if total != len(created):
+        print(f"[Bench] 警告：BOM 根数 {total} 与创建数量 {len(created)} 不一致")
+
+    result["save"], _ = _timed(lambda: bpy.ops.wm.save_as_mainfile(filepath=blend_path, check_existing=False))
+    result["load"], _ = _timed(lambda: bpy.ops.wm.open_mainfile(filepath=blend_path))
+
+    context = bpy.context
+    for obj in context.scene.objects:
+        obj.select_set(True)
+    result["delete"], _ = _timed(bpy.ops.aluframe.delete_selected)
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """与基线逐项比较，打印对照表并返回回归项列表 [(规模, 测量项, 基线, 本次), ...]。"""
+    regressions = []
+    rows = [("register", "register", baseline.get("register"), results.get("register"))]
+    for size, metrics in results["sizes"].items():
+        base = baseline.get("sizes", {}).get(size, {})
+        for name in METRICS:
+            rows.append((size, name, base.get(name), metrics.get(name)))
+
+    print(f"[Bench] {'规模':>8}{'测量项':>10}{'基线 (s)':>12}{'本次 (s)':>12}{'变化':>10}")
+    for size, name, old, new in rows:
+        if old is None or new is None:
+            print(f"[Bench] {size:>8}{name:>10}{'-':>12}{new if new is not None else '-':>12}")
+            continue
+        ratio = (new - old) / old if old > 0.0 else 0.0
+        flag = ""
+        if new > old * (1.0 + tolerance) and new - old > MIN_REGRESSION_SECONDS:
+            regressions.append((size, name, old, new))
+            flag = "  << 回归"
+        print(f"[Bench] {size:>8}{name:>10}{old:>12.4f}{new:>12.4f}{ratio:>+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    root = repo_root()
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    import bpy  # 由 Blender 提供
+    import aluframe
+
+    args = parse_args()
+    t_register, _ = _timed(aluframe.register)
+
+    from aluframe.catalog import get_catalog
+    catalog = get_catalog()
+    preferred = [uid for uid in ("GB-2020", "GB-3030", "GB-4040", "GB-4080") if catalog.get(uid)]
+    uids = preferred or [e.uid for e in catalog.entries[:4]]
+
+    results = {
+        "blender": bpy.app.version_string,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "mode": args.mode,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "register": t_register,
+        "sizes": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="aluframe_bench_") as tmp:
+        blend_path = os.path.join(tmp, "bench.blend")
+        for count in args.sizes:
+            metrics = run_size(bpy, count, args, uids, blend_path)
+            results["sizes"][str(count)] = metrics
+            line = "  ".join(f"{name}={metrics[name]:.4f}s" for name in METRICS)
+            print(f"[Bench] {count:>6} 根：{line}")
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"[Bench] 结果已写入：{args.output}")
+    else:
+        print(text)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+
+    aluframe.unregister()
+    if regressions:
+        print(f"[Bench] 发现 {len(regressions)} 项性能回归（容差 {args.tolerance:.0%}）")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
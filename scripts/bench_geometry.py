@@ -0,0 +1,98 @@
+"""
+Blender 后台基准：对比型材几何后端（解析截面 / 布尔槽口）的构建与求值耗时。
+
+运行方式：
+  blender --background --python scripts/bench_geometry.py -- [--count 50]
+
+输出（每种后端）：
+- 单根构建耗时：不同长度逐根生成网格（绕过共享缓存），取平均值
+- 单根求值耗时：N 根型材全部标记更新后，一次 depsgraph 求值的平均值
+另附“逐对象布尔修饰器”旧路径的求值耗时作为参照。
+"""
+
+import sys
+import os
+import time
+
+
+def repo_root():
+    env = os.environ.get("REPO_ROOT")
+    if env:
+        return env
+    here = os.path.abspath(os.path.dirname(__file__))
+    return os.path.abspath(os.path.join(here, os.pardir))
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    count = 50
+    if "--count" in argv:
+        count = int(argv[argv.index("--count") + 1])
+    return count
+
+
+def _clear_scene(bpy):
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def _time_evaluation(bpy, context, objs):
+    for obj in objs:
+        obj.update_tag()
+    t0 = time.perf_counter()
+    context.view_layer.update()
+    return (time.perf_counter() - t0) / max(len(objs), 1)
+
+
+def main():
+    root = repo_root()
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    import bpy  # 由 Blender 提供
+    import aluframe
+    from aluframe import gn
+
+    count = parse_args()
+    aluframe.register()
+    context = bpy.context
+    scene = context.scene
+    from aluframe.catalog import get_catalog
+    catalog = get_catalog()
+    item = catalog.get("GB-4040") or catalog.entries[0]
+
+    results = {}
+    for mode in ("ANALYTIC", "BOOLEAN"):
+        _clear_scene(bpy)
+        gn.reset_mesh_cache()
+        scene.aluframe_geometry_mode = mode
+
+        t0 = time.perf_counter()
+        objs = []
+        for i in range(count):
+            # 每根长度不同，强制走一次完整构建
+            obj = gn.add_profile_object(context, item, location=(0.0, i * 0.1, 0.0), length=500.0 + i)
+            objs.append(obj)
+        build = (time.perf_counter() - t0) / count
+        evaluate = _time_evaluation(bpy, context, objs)
+        results[mode] = (build, evaluate)
+
+    # 旧路径：逐对象布尔修饰器 + 槽辅助对象（每次求值都重新计算布尔）
+    _clear_scene(bpy)
+    objs = [gn._add_profile_object_boolean(context, item, (0.0, i * 0.1, 0.0), 1000.0) for i in range(count)]
+    context.view_layer.update()
+    results["BOOLEAN_MODIFIER"] = (float("nan"), _time_evaluation(bpy, context, objs))
+
+    print(f"[Bench] 型材：{item.uid}，数量：{count}")
+    print(f"[Bench] {'后端':<18}{'构建/根 (ms)':>16}{'求值/根 (ms)':>16}")
+    for mode, (build, evaluate) in results.items():
+        print(f"[Bench] {mode:<18}{build * 1000.0:>16.3f}{evaluate * 1000.0:>16.3f}")
+
+    aluframe.unregister()
+
+
+if __name__ == "__main__":
+    main()
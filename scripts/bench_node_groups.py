@@ -0,0 +1,101 @@
+"""
+Blender 后台基准：对比两种型材节点组（截面扫掠 / 立方体布尔）的求值耗时。
+
+运行方式：
+  blender --background --python scripts/bench_node_groups.py -- [--count 50]
+
+输出（每种节点组）：
+- 首次求值/根：N 根型材创建后第一次 depsgraph 求值的平均值
+- 改长度/根：修改全部型材的 Length 输入后重新求值的平均值
+- 改截面/根：修改全部型材的 SlotWidth 输入后重新求值的平均值
+"""
+
+import sys
+import os
+import time
+
+
+def repo_root():
+    env = os.environ.get("REPO_ROOT")
+    if env:
+        return env
+    here = os.path.abspath(os.path.dirname(__file__))
+    return os.path.abspath(os.path.join(here, os.pardir))
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    count = 50
+    if "--count" in argv:
+        count = int(argv[argv.index("--count") + 1])
+    return count
+
+
+def _clear_scene(bpy):
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        if mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+
+
+def _time_update(context, objs):
+    for obj in objs:
+        obj.update_tag()
+    t0 = time.perf_counter()
+    context.view_layer.update()
+    return (time.perf_counter() - t0) / max(len(objs), 1)
+
+
+def main():
+    root = repo_root()
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    import bpy  # 由 Blender 提供
+    import aluframe
+    from aluframe import gn
+
+    count = parse_args()
+    aluframe.register()
+    context = bpy.context
+    scene = context.scene
+    from aluframe.catalog import get_catalog
+    catalog = get_catalog()
+    item = catalog.get("GB-4040") or catalog.entries[0]
+    scene.aluframe_geometry_mode = 'NODES'
+
+    results = {}
+    for kind in ("SWEEP", "BOOLEAN"):
+        _clear_scene(bpy)
+        scene.aluframe_node_tree = kind
+        objs = [
+            gn.add_profile_object(context, item, location=(0.0, i * 0.1, 0.0), length=1000.0)
+            for i in range(count)
+        ]
+        first = _time_update(context, objs)
+
+        mods = [obj.modifiers["AluFrameProfile"] for obj in objs]
+        for i, mod in enumerate(mods):
+            gn.set_profile_inputs(mod, item, 500.0 + i)
+        length = _time_update(context, objs)
+
+        for mod in mods:
+            gn.set_modifier_input(mod, mod.node_group, "SlotWidth", float(item.slot_width) * 0.9)
+        section = _time_update(context, objs)
+
+        depsgraph = context.evaluated_depsgraph_get()
+        polys = len(objs[0].evaluated_get(depsgraph).data.polygons) if objs else 0
+        results[kind] = (first, length, section, polys)
+
+    print(f"[Bench] 型材：{item.uid}，数量：{count}")
+    print(f"[Bench] {'节点组':<10}{'首次求值/根 (ms)':>18}{'改长度/根 (ms)':>18}{'改截面/根 (ms)':>18}{'面数':>8}")
+    for kind, (first, length, section, polys) in results.items():
+        print(f"[Bench] {kind:<10}{first * 1000.0:>18.3f}{length * 1000.0:>18.3f}"
+              f"{section * 1000.0:>18.3f}{polys:>8}")
+
+    aluframe.unregister()
+
+
+if __name__ == "__main__":
+    main()
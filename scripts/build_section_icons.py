@@ -0,0 +1,176 @@
+"""
+离线生成截面 PNG 图标：按型材目录中每个条目的截面参数光栅化到 aluframe/assets/section_icons/。
+
+运行方式（普通 Python 3 即可，无需 Blender / PIL）：
+  python scripts/build_section_icons.py [--size 128] [--jobs 4] [--force]
+
+- 多进程并行生成
+- 以截面参数哈希做缓存（manifest.json），参数未变化的图标直接跳过
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+# 光栅化算法变化时递增，使旧图标全部重建
+RASTER_VERSION = 1
+# 每像素超采样（边长方向），用于抗锯齿
+SUPERSAMPLE = 4
+FILL_RGB = (70, 78, 90)
+MANIFEST = "manifest.json"
+
+
+def repo_root():
+    env = os.environ.get("REPO_ROOT")
+    if env:
+        return env
+    here = os.path.abspath(os.path.dirname(__file__))
+    return os.path.abspath(os.path.join(here, os.pardir))
+
+
+def _load_module(name):
+    # aluframe/__init__.py 依赖 bpy，这里按文件路径单独加载不依赖 bpy 的模块
+    path = os.path.join(repo_root(), "aluframe", f"{name}.py")
+    spec = importlib.util.spec_from_file_location(f"_aluframe_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+section = _load_module("section")
+catalog = _load_module("catalog")
+
+
+def param_hash(entry, size):
+    key = f"{entry.width:g}|{entry.height:g}|{entry.slot_width:g}|{entry.wall_thickness:g}|{size}|{RASTER_VERSION}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def rasterize(outline, size, margin=0.1):
+    """扫描线 + 奇偶规则填充多边形，返回 size×size 的覆盖率（0~255）字节行列表。"""
+    if not outline:
+        return [bytes(size) for _ in range(size)]
+    xs = [p[0] for p in outline]
+    ys = [p[1] for p in outline]
+    span = max(max(xs) - min(xs), max(ys) - min(ys)) or 1.0
+    scale = size * (1.0 - 2.0 * margin) / span
+    cx = (max(xs) + min(xs)) / 2.0
+    cy = (max(ys) + min(ys)) / 2.0
+    # 转为像素坐标（图像 Y 轴向下）
+    pts = [((x - cx) * scale + size / 2.0, size / 2.0 - (y - cy) * scale) for x, y in outline]
+    edges = list(zip(pts, pts[1:] + pts[:1]))
+
+    n = SUPERSAMPLE
+    rows = []
+    for py in range(size):
+        coverage = [0] * size
+        for sy in range(n):
+            y = py + (sy + 0.5) / n
+            xs_cross = []
+            for (x0, y0), (x1, y1) in edges:
+                if (y0 <= y < y1) or (y1 <= y < y0):
+                    xs_cross.append(x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+            xs_cross.sort()
+            for a, b in zip(xs_cross[0::2], xs_cross[1::2]):
+                # 统计落在 [a, b) 内的子采样点
+                for px in range(max(int(a), 0), min(int(b) + 1, size)):
+                    for sx in range(n):
+                        x = px + (sx + 0.5) / n
+                        if a <= x < b:
+                            coverage[px] += 1
+        total = n * n
+        rows.append(bytes(min(255, c * 255 // total) for c in coverage))
+    return rows
+
+
+def write_png(path, alpha_rows, rgb=FILL_RGB):
+    """写出 RGBA PNG（纯色 + 覆盖率作为 Alpha）。"""
+    size = len(alpha_rows)
+    r, g, b = rgb
+    raw = bytearray()
+    for row in alpha_rows:
+        raw.append(0)  # 过滤类型：None
+        for a in row:
+            raw.extend((r, g, b, a))
+
+    def chunk(tag, data):
+        body = tag + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    png = b"\x89PNG\r\n\x1a\n"
+    png += chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0))
+    png += chunk(b"IDAT", zlib.compress(bytes(raw), 9))
+    png += chunk(b"IEND", b"")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(png)
+    os.replace(tmp, path)
+
+
+def build_one(job):
+    uid, params, size, out_dir = job
+    outline = section.section_outline(*params)
+    write_png(os.path.join(out_dir, f"{uid}.png"), rasterize(outline, size))
+    return uid
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    opts = {"size": 128, "jobs": os.cpu_count() or 1, "force": False}
+    if "--size" in argv:
+        opts["size"] = int(argv[argv.index("--size") + 1])
+    if "--jobs" in argv:
+        opts["jobs"] = max(1, int(argv[argv.index("--jobs") + 1]))
+    opts["force"] = "--force" in argv
+    return opts
+
+
+def main():
+    opts = parse_args()
+    size = opts["size"]
+    out_dir = os.path.join(repo_root(), "aluframe", "assets", "section_icons")
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    cat = catalog.Catalog()
+    cat.load(cache_dir="")  # 离线构建不读写编译缓存
+    jobs = []
+    hashes = {}
+    for entry in cat.entries:
+        h = param_hash(entry, size)
+        hashes[entry.uid] = h
+        png = os.path.join(out_dir, f"{entry.uid}.png")
+        if not opts["force"] and manifest.get(entry.uid) == h and os.path.isfile(png):
+            continue
+        params = (entry.width, entry.height, entry.slot_width, entry.wall_thickness)
+        jobs.append((entry.uid, params, size, out_dir))
+
+    print(f"[Icons] 目录条目：{len(cat.entries)}，需生成：{len(jobs)}，并行进程：{opts['jobs']}")
+    done = []
+    if jobs:
+        if opts["jobs"] > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=opts["jobs"]) as pool:
+                done = list(pool.map(build_one, jobs, chunksize=max(1, len(jobs) // (opts["jobs"] * 4))))
+        else:
+            done = [build_one(job) for job in jobs]
+
+    for uid in done:
+        manifest[uid] = hashes[uid]
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    print(f"[Icons] 完成：生成 {len(done)} 个图标 -> {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+插件启动开销测量：比较未启用 / 启用插件时 Blender 的启动时间与打开文件时间。
+
+运行方式（在 Blender 之外，用普通 Python 执行）：
+  python scripts/measure_startup.py [--blender /path/to/blender] [--runs 5] [--members 10000] [--output startup.json]
+
+每次测量都启动一个新的 Blender 后台进程（--background --factory-startup），本脚本在子进程中以
+--python 再次运行（参数 --child），输出一行以 RESULT_PREFIX 开头的 JSON：
+- launch：子进程总耗时（进程启动到退出，外部计时），分别测量 bare / addon
+- register：aluframe.register() 本身的耗时
+- open：打开含 --members 根型材的 .blend（文件由一次额外的子进程生成）
+- heavy_modules：注册后已导入的重型模块（网格后端、NumPy），用于确认延迟加载生效
+
+结果取 --runs 次的中位数；addon 与 bare 之差即插件带来的启动 / 打开文件开销。
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RESULT_PREFIX = "[Startup] RESULT "
+HEAVY_MODULES = ("aluframe.gn", "aluframe.batch", "aluframe.assembly", "numpy")
+
+
+def repo_root():
+    env = os.environ.get("REPO_ROOT")
+    if env:
+        return env
+    here = os.path.abspath(os.path.dirname(__file__))
+    return os.path.abspath(os.path.join(here, os.pardir))
+
+
+# ---------------------------------------------------------------------------
+# 子进程（在 Blender 中运行）
+# ---------------------------------------------------------------------------
+
+def _child(argv):
+    parser = argparse.ArgumentParser(prog="measure_startup.py --child")
+    parser.add_argument("--child", action="store_true")
+    parser.add_argument("--addon", action="store_true")
+    parser.add_argument("--open", default="")
+    parser.add_argument("--generate", default="")
+    parser.add_argument("--members", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    root = repo_root()
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    import bpy  # 由 Blender 提供
+
+    result = {}
+    preloaded = {name for name in HEAVY_MODULES if name in sys.modules}
+    if args.addon:
+        import aluframe
+
+        t0 = time.perf_counter()
+        aluframe.register()
+        result["register"] = time.perf_counter() - t0
+        result["heavy_modules"] = sorted(n for n in HEAVY_MODULES if n in sys.modules and n not in preloaded)
+
+    if args.generate:
+        _generate(bpy, args.generate, args.members)
+    if args.open:
+        t0 = time.perf_counter()
+        bpy.ops.wm.open_mainfile(filepath=args.open)
+        result["open"] = time.perf_counter() - t0
+
+    print(RESULT_PREFIX + json.dumps(result))
+    sys.stdout.flush()
+
+
+def _generate(bpy, path, count):
+    """生成测试文件：count 根型材（解析截面后端，网格排布）。"""
+    from mathutils import Matrix
+
+    import aluframe
+    from aluframe.batch import add_profiles_batch
+    from aluframe.catalog import get_catalog
+
+    if "aluframe.handlers" not in sys.modules:
+        aluframe.register()
+    catalog = get_catalog()
+    uids = [e.uid for e in catalog.entries[:4]]
+    side = max(1, int(round(count ** 0.5)))
+    records = [
+        (uids[i % len(uids)], float(200 + (i % 10) * 100),
+         Matrix.Translation(((i % side) * 0.1, (i // side) * 0.1, 0.0)))
+        for i in range(count)
+    ]
+    add_profiles_batch(bpy.context, records)
+    bpy.ops.wm.save_as_mainfile(filepath=path, check_existing=False)
+    print(f"[Startup] 已生成 {count} 根型材：{path}")
+
+
+# ---------------------------------------------------------------------------
+# 驱动（普通 Python）
+# ---------------------------------------------------------------------------
+
+def _run(blender, extra):
+    cmd = [blender, "--background", "--factory-startup", "--python-exit-code", "1",
+           "--python", os.path.abspath(__file__), "--", "--child"] + extra
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=dict(os.environ, REPO_ROOT=repo_root()))
+    elapsed = time.perf_counter() - t0
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stdout + proc.stderr)
+        raise SystemExit(f"[Startup] Blender 子进程失败（退出码 {proc.returncode}）")
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            result = json.loads(line[len(RESULT_PREFIX):])
+            result["launch"] = elapsed
+            return result
+    raise SystemExit("[Startup] 子进程未输出测量结果")
+
+
+def _median(runs, key):
+    values = [r[key] for r in runs if key in r]
+    return statistics.median(values) if values else None
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="measure_startup.py")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender 可执行文件")
+    parser.add_argument("--runs", type=int, default=5, help="每种配置的运行次数（取中位数）")
+    parser.add_argument("--members", type=int, default=10000, help="打开文件测量所用的型材数量；0 表示跳过")
+    parser.add_argument("--output", default="", help="结果 JSON 路径；缺省只打印")
+    args = parser.parse_args()
+
+    results = {"runs": args.runs, "members": args.members}
+    with tempfile.TemporaryDirectory(prefix="aluframe_startup_") as tmp:
+        blend = os.path.join(tmp, "startup.blend")
+        if args.members > 0:
+            _run(args.blender, ["--generate", blend, "--members", str(args.members)])
+
+        for label, extra in (("bare", []), ("addon", ["--addon"])):
+            launch = [_run(args.blender, extra) for _ in range(args.runs)]
+            results[label] = {
+                "launch": _median(launch, "launch"),
+                "register": _median(launch, "register"),
+                "heavy_modules": launch[-1].get("heavy_modules", []),
+            }
+            if args.members > 0:
+                opened = [_run(args.blender, extra + ["--open", blend]) for _ in range(args.runs)]
+                results[label]["open"] = _median(opened, "open")
+
+    bare, addon = results["bare"], results["addon"]
+    print(f"[Startup] 启动：未启用 {bare['launch']:.3f}s，启用 {addon['launch']:.3f}s，"
+          f"差值 {addon['launch'] - bare['launch']:+.3f}s（register {addon['register'] * 1000:.1f} ms）")
+    if args.members > 0:
+        print(f"[Startup] 打开 {args.members} 根型材的文件：未启用 {bare['open']:.3f}s，"
+              f"启用 {addon['open']:.3f}s，差值 {addon['open'] - bare['open']:+.3f}s")
+    if addon["heavy_modules"]:
+        print(f"[Startup] 注意：注册后已导入 {', '.join(addon['heavy_modules'])}")
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"[Startup] 结果已写入：{args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        _child(sys.argv[sys.argv.index("--") + 1:])
+    else:
+        main()
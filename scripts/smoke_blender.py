@@ -39,8 +39,10 @@ def main():
     print("[Smoke] 注册 AluFrame 插件...")
     aluframe.register()
 
+    from aluframe.catalog import get_catalog
+
     scene = bpy.context.scene
-    profiles = list(scene.aluframe_profiles)
+    profiles = get_catalog().entries
     print(f"[Smoke] 已加载型材数量：{len(profiles)}")
     assert len(profiles) >= 10, "型材 JSON 未正确加载（应≥10）"
 
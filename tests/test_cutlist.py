@@ -0,0 +1,77 @@
+"""下料优化回归测试（纯 Python，不依赖 Blender；在仓库根目录运行 python -m pytest）。"""
+
+import pytest
+
+from aluframe.cutlist import optimize, optimize_many
+
+
+def _cuts(plan):
+    return sorted(sorted(bar.cuts) for bar in plan.bars)
+
+
+def test_kerf_boundary_two_halves_need_two_bars():
+    # 3000 + 锯缝 3 + 3000 > 6000：不能共用一根棒料
+    plan = optimize([(3000.0, 2)], stock_length=6000, kerf=3)
+    assert len(plan.bars) == 2
+    assert plan.lower_bound == 2 and plan.optimal
+
+
+def test_kerf_boundary_exact_fit_shares_a_bar():
+    # 2998.5 + 3 + 2998.5 = 6000：最后一段恰好用尽棒料，不计末尾锯缝
+    plan = optimize([(2998.5, 2)], stock_length=6000, kerf=3)
+    assert _cuts(plan) == [[2998.5, 2998.5]]
+    assert plan.bars[0].remnant == 0.0
+    assert list(plan.bars[0].sequence()) == [(0.0, 2998.5), (3001.5, 2998.5)]
+
+
+def test_full_stock_length_piece_fits():
+    plan = optimize([(6000.0, 1)], stock_length=6000, kerf=3)
+    assert _cuts(plan) == [[6000.0]]
+    assert plan.oversize == []
+
+
+@pytest.mark.parametrize("length", [6000.1, 0.0, -250.0])
+def test_unusable_lengths_go_to_oversize(length):
+    plan = optimize([(length, 2), (1000.0, 1)], stock_length=6000, kerf=3)
+    assert plan.oversize == [length, length]
+    assert _cuts(plan) == [[1000.0]]
+
+
+def test_zero_count_is_ignored():
+    plan = optimize([(1000.0, 0), (1200.0, -1)])
+    assert plan.bars == [] and plan.oversize == []
+    assert plan.lower_bound == 0
+
+
+def test_lower_bound_counts_kerf():
+    # 3 × (2000 + 3) > 6000 + 3：按含锯缝的总长，下限为 2 根
+    plan = optimize([(2000.0, 3)], stock_length=6000, kerf=3)
+    assert plan.lower_bound == 2
+    assert len(plan.bars) == 2 and plan.optimal
+    assert plan.piece_count == 3
+
+
+def test_repack_beats_first_fit_decreasing():
+    # 降序首次适应：{500, 400} {300, 300, 300} {200} 用 3 根；最优为 {500, 300, 200} {400, 300, 300}
+    pieces = [(500.0, 1), (400.0, 1), (300.0, 3), (200.0, 1)]
+    ffd = optimize(pieces, stock_length=1000, kerf=0, min_offcut=0, time_budget=0)
+    assert ffd.method == 'FFD' and len(ffd.bars) == 3 and not ffd.optimal
+
+    plan = optimize(pieces, stock_length=1000, kerf=0, min_offcut=0)
+    assert plan.method == 'FFD+REPACK'
+    assert len(plan.bars) == plan.lower_bound == 2 and plan.optimal
+    assert _cuts(plan) == [[200.0, 300.0, 500.0], [300.0, 300.0, 400.0]]
+
+
+def test_optimize_many_solves_each_key_separately():
+    demand = {
+        ("4040", "GB"): [(3000.0, 2), (7000.0, 1)],
+        ("3030", "GB"): [(1500.0, 4)],
+    }
+    plans = optimize_many(demand, stock_length=6000, kerf=3, processes=1)
+    assert list(plans) == [("3030", "GB"), ("4040", "GB")]
+    assert plans[("4040", "GB")].key == ("4040", "GB")
+    assert len(plans[("4040", "GB")].bars) == 2
+    assert plans[("4040", "GB")].oversize == [7000.0]
+    # 4 × (1500 + 3) > 6003：第 4 段放不下
+    assert len(plans[("3030", "GB")].bars) == 2
@@ -0,0 +1,101 @@
+""".aluframe 文件读写回归测试（不依赖 Blender，需 NumPy；在仓库根目录运行 python -m pytest）。"""
+
+import io
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aluframe import exchange  # noqa: E402
+
+TYPES = [{"uid": "a", "name": "4040", "standard": "GB"}]
+
+
+def _records(n):
+    profile = np.zeros(n, dtype=np.uint32)
+    length = np.linspace(100.0, 2000.0, n) + 0.123456789
+    matrix = np.tile(np.eye(4), (n, 1, 1))
+    matrix[:, :3, 3] = np.arange(3 * n).reshape(n, 3) * 1.000000123
+    return profile, length, matrix
+
+
+def _write(n, compress=True):
+    f = io.BytesIO()
+    exchange.write_records(f, TYPES, *_records(n), compress=compress)
+    return f.getvalue()
+
+
+def _read(raw):
+    f = io.BytesIO(raw)
+    types, count, flags = exchange.read_header(f)
+    return types, count, exchange.read_blocks(f, flags, count)
+
+
+def _header_end(raw):
+    (size,) = struct.unpack_from("<I", raw, exchange.HEADER.size)
+    return exchange.HEADER.size + 4 + size
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip_keeps_float64(compress):
+    n = exchange.CHUNK_RECORDS + 5
+    types, count, blocks = _read(_write(n, compress))
+    assert types == TYPES and count == n
+    _, length, matrix = _records(n)
+    read = np.concatenate(blocks)
+    assert np.array_equal(read["length"], length)
+    assert np.array_equal(read["matrix"], matrix[:, :3, :])
+
+
+def test_header_count_mismatch_is_rejected():
+    raw = bytearray(_write(10))
+    magic, version, flags, type_count, _ = exchange.HEADER.unpack_from(raw)
+    exchange.HEADER.pack_into(raw, 0, magic, version, flags, type_count, 11)
+    with pytest.raises(exchange.FormatError):
+        _read(bytes(raw))
+
+
+def test_truncated_file_is_rejected():
+    with pytest.raises(exchange.FormatError):
+        _read(_write(10)[:-3])
+
+
+def test_bad_zlib_chunk_is_rejected():
+    raw = bytearray(_write(10))
+    start = _header_end(raw) + exchange.CHUNK.size
+    raw[start:start + 4] = b"\xff\xff\xff\xff"
+    with pytest.raises(exchange.FormatError):
+        _read(bytes(raw))
+
+
+def test_chunk_size_must_match_record_count():
+    raw = bytearray(_write(10, compress=False))
+    exchange.CHUNK.pack_into(raw, _header_end(raw), 9, 10 * exchange.RECORD_DTYPE.itemsize)
+    with pytest.raises(exchange.FormatError):
+        _read(bytes(raw))
+
+
+@pytest.mark.parametrize("table", [b"\xff\xfe", b"{not json", b'{"uid": "a"}'])
+def test_bad_type_table_is_rejected(table):
+    raw = (exchange.HEADER.pack(exchange.MAGIC, exchange.FORMAT_VERSION, 0, 1, 0)
+           + struct.pack("<I", len(table)) + table)
+    with pytest.raises(exchange.FormatError):
+        _read(raw)
+
+
+def test_short_type_table_length_is_rejected():
+    raw = exchange.HEADER.pack(exchange.MAGIC, exchange.FORMAT_VERSION, 0, 0, 0) + b"\x01"
+    with pytest.raises(exchange.FormatError):
+        _read(raw)
+
+
+def test_corrupt_later_chunk_fails_before_any_block_is_returned():
+    n = exchange.CHUNK_RECORDS + 5
+    raw = bytearray(_write(n))
+    pos = _header_end(raw)
+    _, size = exchange.CHUNK.unpack_from(raw, pos)
+    second = pos + exchange.CHUNK.size + size + exchange.CHUNK.size
+    raw[second:second + 4] = b"\x00\x00\x00\x00"
+    with pytest.raises(exchange.FormatError):
+        _read(bytes(raw))
@@ -0,0 +1,77 @@
+"""结构计算回归测试：单根梁与闭式解对比（不依赖 Blender，需 NumPy；在仓库根目录运行 python -m pytest）。"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aluframe import fem  # noqa: E402
+
+E = fem.ELASTIC_MODULUS
+AREA, INERTIA, TORSION, MODULUS = 600.0, 1.0e5, 5.0e3, 5.0e3
+L = 1000.0
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "scipy":
+        if not fem.has_scipy():
+            pytest.skip("SciPy 未安装")
+    else:
+        monkeypatch.setattr(fem, "_sparse", None)
+        monkeypatch.setattr(fem, "_sparse_linalg", None)
+    return request.param
+
+
+def _beam(end_supports):
+    """沿世界 X 的单根梁（截面 X 轴沿世界 Y），端点序号 0 为起点、1 为终点。"""
+    section = [[AREA, INERTIA, INERTIA, TORSION, MODULUS, MODULUS]]
+    return fem.frame_model([[0.0, 0.0, 0.0]], [[L, 0.0, 0.0]], [[0.0, 1.0, 0.0]], section, [20.0],
+                           end_supports, joints=())
+
+
+def _solve(end_supports, q=0.0, point=0.0):
+    model = _beam(end_supports)
+    fem.factorize(model)
+    return fem.solve_model(model, np.array([q]), np.array([point]))
+
+
+def test_cantilever_udl(backend):
+    q = 1.0  # N/mm
+    deflection, stress, utilization = _solve({0: "FIXED"}, q=q)
+    expected = q * L ** 4 / (8.0 * E * INERTIA)
+    assert deflection[0] == pytest.approx(expected, rel=1e-4)
+    assert stress[0] == pytest.approx(q * L ** 2 / 2.0 / MODULUS, rel=1e-4)
+    # 悬臂端挠度计入利用率（不被两端连线抵消）
+    assert utilization[0] >= expected / (L / fem.DEFLECTION_LIMIT) * (1.0 - 1e-4)
+
+
+def test_simply_supported_udl(backend):
+    q = 1.0
+    deflection, stress, _ = _solve({0: "PINNED", 1: "PINNED"}, q=q)
+    assert deflection[0] == pytest.approx(5.0 * q * L ** 4 / (384.0 * E * INERTIA), rel=1e-4)
+    assert stress[0] == pytest.approx(q * L ** 2 / 8.0 / MODULUS, rel=1e-4)
+
+
+def test_simply_supported_point_load(backend):
+    p = 1000.0  # N
+    deflection, stress, _ = _solve({0: "PINNED", 1: "PINNED"}, point=p)
+    assert deflection[0] == pytest.approx(p * L ** 3 / (48.0 * E * INERTIA), rel=1e-4)
+    assert stress[0] == pytest.approx(p * L / 4.0 / MODULUS, rel=1e-4)
+
+
+def test_mechanism_is_reported(backend):
+    # 只在一端铰接：可绕支座自由转动
+    with pytest.raises(fem.UnstableStructure):
+        _solve({0: "PINNED"}, q=1.0)
+
+
+def test_unsupported_member_is_excluded(backend):
+    section = [[AREA, INERTIA, INERTIA, TORSION, MODULUS, MODULUS]] * 2
+    model = fem.frame_model(
+        [[0.0, 0.0, 0.0], [0.0, 5000.0, 0.0]], [[L, 0.0, 0.0], [L, 5000.0, 0.0]],
+        [[0.0, 1.0, 0.0]] * 2, section, [20.0, 20.0], {0: "FIXED"}, joints=())
+    fem.factorize(model)
+    deflection, _, _ = fem.solve_model(model, np.array([1.0, 1.0]), np.zeros(2))
+    assert deflection[0] > 0.0
+    assert deflection[1] == 0.0
+    assert not model.active[model.member_mid[1]]
@@ -0,0 +1,87 @@
+"""吸附射线查询回归测试（纯 Python，不依赖 Blender；在仓库根目录运行 python -m pytest）。"""
+
+import math
+
+from aluframe.snapping import COAXIAL, END_TO_SIDE, SnapIndex, SnapMember
+
+H = 0.02  # 截面半宽 / 半高（米）
+# 约 50° 视场、1000 像素宽的透视视图中 12 像素的拾取半径：深度每增加 1 m 增大约 5.6 mm
+PICK = (0.0, 2.0 * math.tan(math.radians(25.0)) / 1000.0 * 12)
+
+
+def _index(*members):
+    index = SnapIndex()
+    for m in members:
+        index.insert(m)
+    return index
+
+
+def _horizontal(name, z, series="40"):
+    """沿世界 X、中心在 (0, 0, z) 的 2 m 型材（顶面槽轴线在 z + H）。"""
+    return SnapMember(name, (-1.0, 0.0, z), (1.0, 0.0, z), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0), H, H, series)
+
+
+def _vertical(name, top, series="40"):
+    """沿世界 Z、顶端端面中心在 (0, 0, top) 的 1 m 型材。"""
+    return SnapMember(name, (0.0, 0.0, top - 1.0), (0.0, 0.0, top), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), H, H, series)
+
+
+def test_side_hit_without_coaxial():
+    result = _index(_horizontal("a", 0.0)).query_ray((0.0, 0.0, 5.0), (0.0, 0.0, -1.0))
+    assert result.kind == END_TO_SIDE
+    assert result.target == "a"
+
+
+def test_deeper_coaxial_wins_over_nearer_side():
+    # 射线先经过 a 的顶面槽轴线，更深处才到 b 的端面中心：同轴仍优先
+    index = _index(_horizontal("a", 0.0), _vertical("b", -1.5))
+    result = index.query_ray((0.0, 0.0, 5.0), (0.0, 0.0, -1.0))
+    assert result.kind == COAXIAL
+    assert result.target == "b"
+    assert abs(result.depth - 6.5) < 1e-9
+
+
+def test_nearest_coaxial_wins():
+    index = _index(_vertical("near", 1.0), _vertical("far", -2.0))
+    result = index.query_ray((0.0, 0.0, 5.0), (0.0, 0.0, -1.0))
+    assert result.kind == COAXIAL
+    assert result.target == "near"
+
+
+def test_side_hit_from_realistic_cursor_offset():
+    # 相机在 3 m 外，光标偏离顶面槽轴线 25 mm：只按毫米容差量射线时不会吸附
+    index = _index(_horizontal("a", 0.0))
+    origin, direction = (0.3, 0.025, 3.0), (0.0, 0.0, -1.0)
+    assert index.query_ray(origin, direction) is None
+    result = index.query_ray(origin, direction, pick=PICK, face=H, series="40")
+    assert result.kind == END_TO_SIDE
+    assert result.target == "a"
+    # 新型材端面落在槽轴线上，沿顶面法线伸出
+    assert all(abs(a - b) < 1e-9 for a, b in zip(result.location, (0.3, 0.0, H)))
+    assert result.direction == (0.0, 0.0, 1.0)
+
+
+def test_end_face_tolerance_without_pick_radius():
+    # 5 mm 容差从新型材端面边缘算起（端面半径 20 mm）：光标距顶面槽轴线 24 mm 仍吸附到顶面；
+    # 26 mm 时顶面不再命中，改为距 6 mm 的 +Y 侧面槽轴线；再远则都不命中
+    index = _index(_horizontal("a", 0.0))
+    top = index.query_ray((0.3, 0.024, 3.0), (0.0, 0.0, -1.0), face=H)
+    assert top.kind == END_TO_SIDE and top.direction == (0.0, 0.0, 1.0)
+    side = index.query_ray((0.3, 0.026, 3.0), (0.0, 0.0, -1.0), face=H)
+    assert side.kind == END_TO_SIDE and side.direction == (0.0, 1.0, 0.0)
+    assert index.query_ray((0.3, 0.05, 3.0), (0.0, 0.0, -1.0), face=H) is None
+
+
+def test_coaxial_from_realistic_cursor_offset():
+    index = _index(_vertical("b", 0.0))
+    result = index.query_ray((0.008, 0.004, 3.0), (0.0, 0.0, -1.0), pick=PICK, face=H, series="40")
+    assert result.kind == COAXIAL
+    assert result.target == "b"
+    assert result.location == (0.0, 0.0, 0.0)
+
+
+def test_coaxial_only_within_series():
+    index = _index(_vertical("b", 0.0, series="40"))
+    result = index.query_ray((0.008, 0.004, 3.0), (0.0, 0.0, -1.0), pick=PICK, face=H, series="30")
+    assert result is not None
+    assert result.kind == END_TO_SIDE
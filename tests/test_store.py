@@ -0,0 +1,95 @@
+"""成员存储与 BOM 视图的同步回归测试（不依赖 Blender，需 NumPy；在仓库根目录运行 python -m pytest）。"""
+
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aluframe import store  # noqa: E402
+
+_uids = itertools.count(1)
+
+
+class FakeObject:
+    """只提供成员存储读取的属性：名称、session_uid、用户数、ID 属性与世界矩阵。"""
+
+    def __init__(self, name, length, alu_type="4040", standard="GB"):
+        self.name = name
+        self.session_uid = next(_uids)
+        self.users = 1
+        self.matrix_world = np.eye(4)
+        self.props = {"alu_uid": alu_type, "alu_type": alu_type, "standard": standard, "length": length}
+
+    def __contains__(self, key):
+        return key in self.props
+
+    def __getitem__(self, key):
+        return self.props[key]
+
+    def get(self, key, default=None):
+        return self.props.get(key, default)
+
+
+class FakeScene:
+    def __init__(self, *objects):
+        self.name = "Scene"
+        self.objects = list(objects)
+
+
+@pytest.fixture
+def members(monkeypatch):
+    # 标志位需要型材目录，这里与目录无关
+    monkeypatch.setattr(store.MemberStore, "_object_flags", lambda self, entry: 0)
+    return store.MemberStore()
+
+
+def _bom(index):
+    return sorted((row.alu_type, row.length, row.count) for row in index.bom.rows.values())
+
+
+def test_bom_view_follows_store(members):
+    a, b = FakeObject("a", 500.0), FakeObject("b", 500.04)
+    members.rebuild(FakeScene(a, b, FakeObject("c", 800.0, alu_type="3030")))
+    assert len(members) == 3
+    assert _bom(members) == [("3030", 800.0, 1), ("4040", 500.0, 2)]
+    assert members.bom.total_count == 3
+    assert members.bom_rows() == [("3030", "GB", 800.0, 1), ("4040", "GB", 500.0, 2)]
+
+    b.props["length"] = 600.0
+    assert members.update_objects([b])
+    assert _bom(members) == [("3030", 800.0, 1), ("4040", 500.0, 1), ("4040", 600.0, 1)]
+    assert members.bom.total_length == pytest.approx(1900.0)
+
+
+def test_rename_drops_old_row(members):
+    a = FakeObject("a", 500.0)
+    members.rebuild(FakeScene(a))
+    a.name = "renamed"
+    assert members.update_objects([a])
+    assert members.names == ["renamed"]
+    assert set(members.bom.members) == {"renamed"}
+
+
+def test_unlinked_object_with_users_is_pruned(members):
+    a, b = FakeObject("a", 500.0), FakeObject("b", 700.0)
+    scene = FakeScene(a, b)
+    members.rebuild(scene)
+    # 移出场景但仍有其他用户（如仍链接在另一个场景中）
+    scene.objects.remove(b)
+    assert members.prune(scene)
+    assert members.names == ["a"]
+    assert members.bom.total_count == 1
+
+
+def test_delete_and_add_in_one_window(members):
+    old = FakeObject("a", 500.0)
+    scene = FakeScene(old)
+    members.rebuild(scene)
+    # 同一合并窗口内删除旧对象、新建同名对象：对象总数不变
+    new = FakeObject("a", 900.0, alu_type="3030")
+    scene.objects = [new]
+    assert members.prune(scene)
+    assert members.update_objects([new])
+    assert members.names == ["a"]
+    assert _bom(members) == [("3030", 900.0, 1)]